@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING
 
 from constants import pg
-from typeguard import typechecked
+from typechecking import typechecked
 
 if TYPE_CHECKING:
     from nodes.camera import Camera
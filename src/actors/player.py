@@ -4,8 +4,8 @@ from constants import NATIVE_SURF
 from constants import pg
 from nodes.kinematic import Kinematic
 from pygame.math import Vector2
-from schemas import NoneOrBlobSpriteMetadata
-from typeguard import typechecked
+from tile_layer import TileLayer
+from typechecking import typechecked
 from utils import exp_decay
 
 if TYPE_CHECKING:
@@ -31,7 +31,7 @@ class Player:
         # Listen to input
         game_event_handler: "EventHandler",
         # Room metadata for collision
-        solid_collision_map_list: list[int | NoneOrBlobSpriteMetadata],
+        solid_collision_map_list: TileLayer,
         room_width_tu: int,
         room_height_tu: int,
         # REMOVE IN BUILD
@@ -44,7 +44,7 @@ class Player:
         self.game_debug_draw: "DebugDraw" = game_debug_draw
 
         # Initialize room metadata
-        self.solid_collision_map_list: list[int | NoneOrBlobSpriteMetadata] = solid_collision_map_list
+        self.solid_collision_map_list: TileLayer = solid_collision_map_list
         self.room_width_tu: int = room_width_tu
         self.room_height_tu: int = room_height_tu
 
@@ -68,6 +68,10 @@ class Player:
         self.surf.fill("red")
         self.collider_rect: pg.FRect = self.surf.get_frect()
 
+        # Collider rect position before the last update, for draw interpolation
+        self.previous_collider_rect_x: float = self.collider_rect.x
+        self.previous_collider_rect_y: float = self.collider_rect.y
+
     def _setup_movement_metadata(self) -> None:
         """
         Setup my movement magic numbers.
@@ -95,6 +99,7 @@ class Player:
             self.solid_collision_map_list,
             self.room_width_tu,
             self.room_height_tu,
+            # REMOVE IN BUILD
             self.game_debug_draw,
             self.camera,
         )
@@ -102,7 +107,7 @@ class Player:
     #################
     # SETTER GETTER #
     #################
-    def set_solid_collision_map_list(self, value: list[int | NoneOrBlobSpriteMetadata]) -> None:
+    def set_solid_collision_map_list(self, value: TileLayer) -> None:
         """
         Call when room collision map list updates.
         Content changes.
@@ -129,15 +134,28 @@ class Player:
         self.room_height_tu = value
         self.kinematic.set_room_height_tu(value)
 
+    def reset_previous_position(self) -> None:
+        """
+        Call when collider rect is moved outside of update.
+        So draw does not interpolate from a stale position.
+        """
+
+        self.previous_collider_rect_x = self.collider_rect.x
+        self.previous_collider_rect_y = self.collider_rect.y
+
     ########
     # DRAW #
     ########
-    def draw(self) -> None:
+    def draw(self, interpolation_alpha: float = 1.0) -> None:
+        # Lerp from previous to current update position
+        x: float = self.previous_collider_rect_x + (self.collider_rect.x - self.previous_collider_rect_x) * interpolation_alpha
+        y: float = self.previous_collider_rect_y + (self.collider_rect.y - self.previous_collider_rect_y) * interpolation_alpha
+
         NATIVE_SURF.blit(
             self.surf,
             (
-                self.collider_rect.x - self.camera.rect.x,
-                self.collider_rect.y - self.camera.rect.y,
+                x - self.camera.rect.x,
+                y - self.camera.rect.y,
             ),
         )
 
@@ -145,6 +163,9 @@ class Player:
     # UPDATE #
     ##########
     def update(self, dt: int) -> None:
+        # Remember where I was for draw interpolation
+        self.reset_previous_position()
+
         # Get dir input
         direction_horizontal: int = self.game_event_handler.is_right_pressed - self.game_event_handler.is_left_pressed
         direction_vertical: int = self.game_event_handler.is_down_pressed - self.game_event_handler.is_up_pressed
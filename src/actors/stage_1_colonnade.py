@@ -5,7 +5,7 @@ from constants import NATIVE_HEIGHT
 from constants import NATIVE_WIDTH
 from constants import pg
 from constants import TILE_SIZE
-from typeguard import typechecked
+from typechecking import typechecked
 
 
 if TYPE_CHECKING:
@@ -6,7 +6,7 @@ from constants import NATIVE_WIDTH
 from constants import NATIVE_WIDTH_TU
 from constants import pg
 from constants import TILE_SIZE
-from typeguard import typechecked
+from typechecking import typechecked
 
 
 if TYPE_CHECKING:
@@ -4,7 +4,7 @@ from actors.parallax_background import ParallaxBackground
 from constants import NATIVE_HEIGHT
 from constants import NATIVE_WIDTH
 from constants import pg
-from typeguard import typechecked
+from typechecking import typechecked
 
 
 if TYPE_CHECKING:
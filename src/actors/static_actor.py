@@ -5,7 +5,8 @@ from constants import TILE_SIZE
 from nodes.animator import Animator
 from schemas import AnimationMetadata
 from schemas import AnimationSpriteMetadata
-from typeguard import typechecked
+from tile_layer import TileLayer
+from typechecking import typechecked
 
 if TYPE_CHECKING:
     from nodes.camera import Camera
@@ -14,7 +15,9 @@ if TYPE_CHECKING:
 @typechecked
 class StaticActor:
     """
-    TODO: write doc for this actor
+    An animated tile, like thin fire or thin waterfall, drawn on every occupied cell of its collision map.
+    Every occurrence shows the same frame, so it keeps 1 subsurf per frame and no pre render.
+    Each draw reads only the cells under the camera from the collision map, edits to it show on the next draw.
     """
 
     def __init__(
@@ -22,8 +25,6 @@ class StaticActor:
         sprite_sheet_surf: pg.Surface,
         camera: "Camera",
         animation_data: dict[str, AnimationMetadata],
-        room_width: int,
-        room_height: int,
         room_width_tu: int,
         room_height_tu: int,
     ):
@@ -41,20 +42,13 @@ class StaticActor:
             self.initial_animation
         ].animation_sprites_list
         self.animation_sprites_list_len: int = len(self.animation_sprites_list)
-        self.pre_render_frame_surf_width: int = room_width
-        self.pre_render_frame_surf_height: int = room_height
-        self.pre_render_frame_surf_width_tu: int = room_width_tu
-        self.pre_render_frame_surf_height_tu: int = room_height_tu
 
-        # Pre render surfs as big as room, 1 surf for 1 frame
-        self.pre_render_frame_surfs_list: list[pg.Surface] = []
+        # Frame strip, 1 sprite sheet subsurf for 1 frame
+        self.animation_sprite_surfs_list: list[pg.Surface] = []
+        self._update_animation_sprite_surfs_list()
 
-        # For every frame creates a surf as big as room
-        for _ in range(self.animation_sprites_list_len):
-            pre_render_frame_surf: pg.Surface = pg.Surface((self.pre_render_frame_surf_width, self.pre_render_frame_surf_height))
-            pre_render_frame_surf.set_colorkey("red")
-            pre_render_frame_surf.fill("red")
-            self.pre_render_frame_surfs_list.append(pre_render_frame_surf)
+        # Collision map of my occupied cells, empty until the owner sets it
+        self.collision_map_list: TileLayer = TileLayer(room_width_tu, room_height_tu)
 
         # Animator node
         self.animator = Animator(
@@ -66,57 +60,52 @@ class StaticActor:
     def _on_animation_frame_change(self, frame_index: int, _frame_data: AnimationSpriteMetadata) -> None:
         self.frame_index = frame_index
 
-    def update_pre_render_frame_surfs(self, collision_map_list: list[int]) -> None:
+    def _update_animation_sprite_surfs_list(self) -> None:
         """
-        Reads the given collision map.
-        Whenever it reads, it will recreate the whole pre render from square one.
-        Then based on what is on collision map, will draw on pre render as if it is the first time.
+        Cut the frame strip from the sprite sheet, subsurfs share its pixels.
         """
 
-        # Reset the pre render surfs
-        self.pre_render_frame_surfs_list = []
-        # For every frame creates a surf as big as room
-        for _ in range(self.animation_sprites_list_len):
-            pre_render_frame_surf = pg.Surface((self.pre_render_frame_surf_width, self.pre_render_frame_surf_height))
-            pre_render_frame_surf.set_colorkey("red")
-            pre_render_frame_surf.fill("red")
-            self.pre_render_frame_surfs_list.append(pre_render_frame_surf)
-        # Iter over the collision map cells
-        for cell_index in range(len(collision_map_list)):
-            # Get cell
-            cell = collision_map_list[cell_index]
-            # Cell occupied?
-            if cell == 1:
-                # Turn occupied cell index to coord
-                coord = self._get_coords_from_index(
-                    cell_index,
-                    self.pre_render_frame_surf_width_tu,
-                    self.pre_render_frame_surf_height_tu,
+        self.animation_sprite_surfs_list = [
+            self.sprite_sheet_surf.subsurface(
+                (
+                    animation_sprite_metadata.x,
+                    animation_sprite_metadata.y,
+                    self.animation_sprite_width,
+                    self.animation_sprite_height,
                 )
-                # Make sure index exists
-                if coord[0] == -1 or coord[1] == -1:
-                    return
-                world_x_tu = coord[0]
-                world_y_tu = coord[1]
-                world_x_snapped = world_x_tu * TILE_SIZE
-                world_y_snapped = world_y_tu * TILE_SIZE
-                # Use coord to update each pre render
-                for j in range(self.animation_sprites_list_len):
-                    # Get this pre render frame surf
-                    pre_render_frame_surf = self.pre_render_frame_surfs_list[j]
-                    # Get this animation frame
-                    animation_sprite_metadata = self.animation_sprites_list[j]
-                    # Draw this animation frame on this pre render on snapped world mouse
-                    pre_render_frame_surf.blit(
-                        self.sprite_sheet_surf,
-                        (world_x_snapped, world_y_snapped),
-                        (
-                            animation_sprite_metadata.x,
-                            animation_sprite_metadata.y,
-                            self.animation_sprite_width,
-                            self.animation_sprite_height,
-                        ),
-                    )
+            )
+            for animation_sprite_metadata in self.animation_sprites_list
+        ]
+
+    def set_animation_data(self, sprite_sheet_surf: pg.Surface, animation_data: dict[str, AnimationMetadata]) -> None:
+        """
+        Swap sprite sheet and animation data, for hot reload.
+        Frame strip is cut again, frame count and frames may have changed.
+        """
+
+        self.sprite_sheet_surf = sprite_sheet_surf
+        self.aniamtion_data = animation_data
+
+        # Initial animation gone? Use the first one
+        if self.initial_animation not in animation_data:
+            self.initial_animation = list(animation_data.keys())[0]
+        self.animation_sprite_width = self.aniamtion_data[self.initial_animation].animation_sprite_width
+        self.animation_sprite_height = self.aniamtion_data[self.initial_animation].animation_sprite_height
+        self.animation_sprites_list = self.aniamtion_data[self.initial_animation].animation_sprites_list
+        self.animation_sprites_list_len = len(self.animation_sprites_list)
+        self._update_animation_sprite_surfs_list()
+
+        # Animator sets frame index through its event
+        self.frame_index = 0
+        self.animator.set_animation_data(self.aniamtion_data)
+
+    def set_collision_map_list(self, collision_map_list: TileLayer) -> None:
+        """
+        Set the collision map of my occupied cells, 1 is occupied.
+        It is read on every draw, so the owner edits it in place and sets it again only when it is a new one.
+        """
+
+        self.collision_map_list = collision_map_list
 
     def draw(
         self, blit_sequence: list[tuple[pg.Surface, tuple[float, float]]]
@@ -125,17 +114,30 @@ class StaticActor:
         tuple[pg.Surface, tuple[float, float]]
     ]:
         """
-        This takes existing blit sequence, adds my current pre render frame to it and returns it.
+        This takes existing blit sequence, adds my current frame on every occupied cell the camera sees to it and returns it.
         """
 
-        blit_sequence.append(
-            (
-                self.pre_render_frame_surfs_list[self.frame_index],
-                (
-                    -self.camera.rect.x,
-                    -self.camera.rect.y,
-                ),
+        # Cells whose sprite touches the camera, sprites hang right and down from their cell, 1 more for the truncated offset
+        first_world_tu_x: int = int((self.camera.rect.x - self.animation_sprite_width) // TILE_SIZE) + 1
+        first_world_tu_y: int = int((self.camera.rect.y - self.animation_sprite_height) // TILE_SIZE) + 1
+        last_world_tu_x: int = int((self.camera.rect.right - 1) // TILE_SIZE) + 1
+        last_world_tu_y: int = int((self.camera.rect.bottom - 1) // TILE_SIZE) + 1
+
+        # Camera offset truncated once, like a float blit position of 1 room surf
+        offset_x: int = int(-self.camera.rect.x)
+        offset_y: int = int(-self.camera.rect.y)
+
+        # Current frame on every occupied cell of them
+        animation_sprite_surf: pg.Surface = self.animation_sprite_surfs_list[self.frame_index]
+        blit_sequence.extend(
+            (animation_sprite_surf, (world_tu_x * TILE_SIZE + offset_x, world_tu_y * TILE_SIZE + offset_y))
+            for world_tu_x, world_tu_y, cell in self.collision_map_list.iter_region_tiles(
+                first_world_tu_x,
+                first_world_tu_y,
+                last_world_tu_x - first_world_tu_x + 1,
+                last_world_tu_y - first_world_tu_y + 1,
             )
+            if cell == 1
         )
 
         return blit_sequence
@@ -143,16 +145,3 @@ class StaticActor:
     def update(self, dt: int) -> None:
         # Update animation counter
         self.animator.update(dt)
-
-    # Helper
-    def _get_coords_from_index(self, index: int, room_width_tu: int, room_height_tu: int) -> tuple[int, int]:
-        """
-        Returns the (x, y) coordinates for a given index in the collision map list.
-        Returns (-1, -1) if the index is out of bounds.
-        """
-        if 0 <= index < room_width_tu * room_height_tu:
-            x = index % room_width_tu
-            y = index // room_width_tu
-            return x, y
-        else:
-            return -1, -1
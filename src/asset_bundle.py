@@ -0,0 +1,166 @@
+from io import BytesIO
+from json import dumps
+from json import loads
+from mmap import ACCESS_READ
+from mmap import mmap
+from os import sep
+from os import walk
+from os.path import exists
+from os.path import getsize
+from os.path import join
+from os.path import relpath
+from struct import calcsize
+from struct import pack
+from struct import unpack_from
+from typing import BinaryIO
+
+# Bundle file, relative to the game root like the asset dirs, the release build writes it
+BUNDLE_FILE_NAME: str = "assets.bundle"
+
+# Header is magic then index byte length, the index is JSON {path : [offset, length, type]}
+# Offsets are from the end of the index, paths use / on every OS
+BUNDLE_MAGIC: bytes = b"P2DBNDL1"
+BUNDLE_HEADER_FORMAT: str = "<8sI"
+BUNDLE_HEADER_SIZE: int = calcsize(BUNDLE_HEADER_FORMAT)
+
+
+def _to_bundle_path(path: str) -> str:
+    """
+    | Pass an asset path.
+    | Returns it the way the index stores it.
+    """
+
+    return path.replace(sep, "/")
+
+
+def _open_bundle(bundle_path: str) -> tuple[None | mmap, dict[str, tuple[int, int, str]], dict[str, list[str]]]:
+    """
+    | Pass the bundle path.
+    |
+    | Map it once, read its index.
+    | Returns the map, {path : (offset, length, type)} and {dir : [file names]}.
+    | No bundle? Returns no map and empty dicts, every asset is read from its own file.
+    |
+    | Raises exception on a file that is not a bundle.
+    """
+
+    if not exists(bundle_path):
+        return None, {}, {}
+
+    with open(bundle_path, "rb") as bundle_file:
+        # The map stays valid after the file closes
+        bundle_mmap: mmap = mmap(bundle_file.fileno(), 0, access=ACCESS_READ)
+
+    magic, index_length = unpack_from(BUNDLE_HEADER_FORMAT, bundle_mmap)
+    if magic != BUNDLE_MAGIC:
+        raise ValueError(f"{bundle_path} is not an asset bundle")
+
+    data_offset: int = BUNDLE_HEADER_SIZE + index_length
+    index: dict[str, tuple[int, int, str]] = {}
+    dirs: dict[str, list[str]] = {}
+    for path, (offset, length, asset_type) in loads(bundle_mmap[BUNDLE_HEADER_SIZE:data_offset]).items():
+        index[path] = (data_offset + offset, length, asset_type)
+        dir_path, _, file_name = path.rpartition("/")
+        dirs.setdefault(dir_path, []).append(file_name)
+
+    return bundle_mmap, index, dirs
+
+
+# Opened on import, 1 open and 1 map for every asset
+BUNDLE_MMAP, BUNDLE_INDEX, BUNDLE_DIRS = _open_bundle(BUNDLE_FILE_NAME)
+
+
+def list_bundle_dir(directory: str) -> None | list[str]:
+    """
+    | Pass a dir.
+    | Returns the file names the bundle has in it, None if it has none.
+    """
+
+    return BUNDLE_DIRS.get(_to_bundle_path(directory))
+
+
+def asset_exists(path: str) -> bool:
+    """
+    | Pass an asset path.
+    | True if it is in the bundle or on disk.
+    """
+
+    return _to_bundle_path(path) in BUNDLE_INDEX or exists(path)
+
+
+def is_bundled_asset(path: str) -> bool:
+    """
+    | Pass an asset path.
+    | True if it is read from the bundle, the release build wrote it.
+    """
+
+    return _to_bundle_path(path) in BUNDLE_INDEX
+
+
+def open_asset(path: str) -> BinaryIO:
+    """
+    | Pass an asset path.
+    |
+    | In the bundle? Returns its bytes from the map as a file.
+    | Else opens it on disk, like the dev tree and the user dir.
+    """
+
+    bundle_path: str = _to_bundle_path(path)
+    if BUNDLE_MMAP is not None and bundle_path in BUNDLE_INDEX:
+        offset, length, _ = BUNDLE_INDEX[bundle_path]
+        end: int = offset + length
+        return BytesIO(BUNDLE_MMAP[offset:end])
+
+    return open(path, "rb")
+
+
+def map_asset(path: str) -> memoryview:
+    """
+    | Pass an asset path.
+    |
+    | Returns its bytes without a copy.
+    | In the bundle? A view of the bundle map, else the file on disk mapped on its own.
+    """
+
+    bundle_path: str = _to_bundle_path(path)
+    if BUNDLE_MMAP is not None and bundle_path in BUNDLE_INDEX:
+        offset, length, _ = BUNDLE_INDEX[bundle_path]
+        end: int = offset + length
+        return memoryview(BUNDLE_MMAP)[offset:end]
+
+    with open(path, "rb") as asset_file:
+        return memoryview(mmap(asset_file.fileno(), 0, access=ACCESS_READ))
+
+
+def write_bundle(bundle_path: str, root_dir_path: str, dir_names: tuple[str, ...]) -> int:
+    """
+    | Pass the bundle path, the root the game reads assets from and the asset dirs in it.
+    |
+    | Pack every file in those dirs, sub dirs too, into 1 bundle.
+    | Paths in the index are relative to the root, the way the game asks for them.
+    | Returns the file count.
+    """
+
+    # Index first, then data in the same order
+    file_paths: list[str] = []
+    for dir_name in dir_names:
+        for dir_path, sub_dir_names, file_names in walk(join(root_dir_path, dir_name)):
+            sub_dir_names.sort()
+            file_paths.extend(join(dir_path, file_name) for file_name in sorted(file_names))
+
+    index: dict[str, tuple[int, int, str]] = {}
+    offset: int = 0
+    for file_path in file_paths:
+        length: int = getsize(file_path)
+        index[_to_bundle_path(relpath(file_path, root_dir_path))] = (offset, length, file_path.rpartition(".")[2])
+        offset += length
+
+    index_bytes: bytes = dumps(index).encode()
+    with open(bundle_path, "wb") as bundle_file:
+        bundle_file.write(pack(BUNDLE_HEADER_FORMAT, BUNDLE_MAGIC, len(index_bytes)))
+        bundle_file.write(index_bytes)
+        for file_path in file_paths:
+            with open(file_path, "rb") as asset_file:
+                bundle_file.write(asset_file.read())
+
+    return len(file_paths)
@@ -0,0 +1,1070 @@
+"""
+Headless benchmark runner.
+
+Builds the Game under SDL dummy video and audio drivers, so it runs on a box with no display.
+Run from the repo root, assets paths are relative to it:
+
+python src/benchmark.py frames --scene MainMenu --frames 2000
+python src/benchmark.py frames --scene RoomJsonGeneratorPlayTest --frames 2000
+python src/benchmark.py replay --log session.bin
+python src/benchmark.py startup --runs 5
+python src/benchmark.py typecheck --frames 2000
+python src/benchmark.py rooms --scale 2 --runs 5
+python src/benchmark.py paint --sizes 20 50 100 200
+python src/benchmark.py chunks --sizes 20 100 400
+python src/benchmark.py collision --runs 20000
+python src/benchmark.py batch --counts 100 1000 5000
+python src/benchmark.py schemas --runs 200
+"""
+
+from array import array
+from os import environ
+from time import perf_counter
+from tracemalloc import get_traced_memory
+from tracemalloc import reset_peak
+from tracemalloc import start as start_tracemalloc
+from tracemalloc import stop as stop_tracemalloc
+
+# Start of the startup clock, before the game modules are imported
+IMPORT_START: float = perf_counter()
+
+# Dummy drivers must be set before constants calls pg.init
+environ.setdefault("SDL_VIDEODRIVER", "dummy")
+environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from argparse import ArgumentParser  # noqa: E402
+from argparse import Namespace  # noqa: E402
+from json import dumps  # noqa: E402
+from json import loads  # noqa: E402
+from os import listdir  # noqa: E402
+from os.path import join  # noqa: E402
+from random import Random  # noqa: E402
+from re import search  # noqa: E402
+from statistics import median  # noqa: E402
+from statistics import quantiles  # noqa: E402
+from subprocess import PIPE  # noqa: E402
+from subprocess import Popen  # noqa: E402
+from sys import executable  # noqa: E402
+from sys import getsizeof  # noqa: E402
+from tempfile import TemporaryDirectory  # noqa: E402
+from typing import Callable  # noqa: E402
+from zlib import crc32  # noqa: E402
+
+from jsonschema import validate  # noqa: E402
+
+from constants import EVENTS  # noqa: E402
+from constants import FIXED_DT  # noqa: E402
+from constants import FIXED_STEP_MS  # noqa: E402
+from constants import JSONS_REPO_DIR_PATH  # noqa: E402
+from constants import MAX_CATCH_UP_STEPS  # noqa: E402
+from constants import NATIVE_HEIGHT  # noqa: E402
+from constants import NATIVE_SURF  # noqa: E402
+from constants import NATIVE_WIDTH  # noqa: E402
+from constants import pg  # noqa: E402
+from constants import ROOM_HEIGHT_TU  # noqa: E402
+from constants import ROOM_WIDTH_TU  # noqa: E402
+from constants import TILE_SIZE  # noqa: E402
+from nodes.batch_kinematic import BatchKinematic  # noqa: E402
+from nodes.batch_kinematic import IS_NUMPY_AVAILABLE  # noqa: E402
+from nodes.camera import Camera  # noqa: E402
+from nodes.game import Game  # noqa: E402
+from nodes.input_replayer import InputReplayer  # noqa: E402
+from nodes.kinematic import Kinematic  # noqa: E402
+from nodes.options_menu import OptionsMenu  # noqa: E402
+from room_format import load_room_binary  # noqa: E402
+from room_format import room_json_to_bytes  # noqa: E402
+from schemas import ANIMATION_SCHEMA  # noqa: E402
+from schemas import get_none_or_blob_sprite_metadata  # noqa: E402
+from schemas import instance_animation_metadata  # noqa: E402
+from schemas import instance_none_or_blob_sprite_metadata  # noqa: E402
+from schemas import instance_sprite_sheet_metadata  # noqa: E402
+from schemas import NoneOrBlobSpriteMetadata  # noqa: E402
+from schemas import SPRITE_SHEET_METADATA_SCHEMA  # noqa: E402
+from tile_layer import TileLayer  # noqa: E402
+from utils import dynamic_rect_vs_rect  # noqa: E402
+from utils import swept_rect_vs_rect  # noqa: E402
+
+
+###########
+# HELPERS #
+###########
+def _step(game: Game, dt: int) -> None:
+    """
+    One untimed frame, same order as the main loop fixed step.
+    """
+
+    for event in pg.event.get(EVENTS):
+        game.event_handler.event(event)
+    game.current_scene.update(dt)
+    game.event_handler.reset_just_events()
+    game.current_scene.draw()
+
+
+def _run_until(game: Game, dt: int, predicate: Callable[[], bool], max_frames: int = 10000) -> None:
+    """
+    Step untimed frames until predicate is true.
+    """
+
+    for _ in range(max_frames):
+        if predicate():
+            return
+        _step(game, dt)
+    raise ValueError(f"Scenario did not reach its state in {max_frames} frames")
+
+
+def _tap(key: int) -> None:
+    """
+    Queue a key down and up, read on the next frame.
+    """
+
+    pg.event.post(pg.event.Event(pg.KEYDOWN, key=key, unicode="", mod=0, scancode=0))
+    pg.event.post(pg.event.Event(pg.KEYUP, key=key, unicode="", mod=0, scancode=0))
+
+
+def _hold(key: int) -> None:
+    """
+    Queue a key down, stays pressed.
+    """
+
+    pg.event.post(pg.event.Event(pg.KEYDOWN, key=key, unicode="", mod=0, scancode=0))
+
+
+def _present(game: Game, is_dirty_rects: bool) -> None:
+    """
+    Scale and push native to the window, same choice as the main loop.
+    """
+
+    if is_dirty_rects and not game.is_full_redraw and game.window_integer_scale != 0 and not game.debug_draw.is_active:
+        window_dirty_rects: list[pg.Rect] = game.scale_dirty_rects_to_window()
+        if window_dirty_rects:
+            pg.display.update(window_dirty_rects)
+    else:
+        pg.transform.scale(NATIVE_SURF, (game.window_width, game.window_height), game.window_surf)
+        pg.display.update()
+    game.reset_dirty_rects()
+
+
+def _print_percentiles(update_ms: list[float], draw_ms: list[float], present_ms: list[float]) -> None:
+    """
+    Print the phase percentiles table, wall time and mean fps.
+    """
+
+    total_ms: list[float] = [u + d + p for u, d, p in zip(update_ms, draw_ms, present_ms)]
+
+    print(f"{'phase':<8} {'p50':>9} {'p95':>9} {'p99':>9}")
+    for name, samples in (("update", update_ms), ("draw", draw_ms), ("present", present_ms), ("total", total_ms)):
+        p50, p95, p99 = _percentiles(samples)
+        print(f"{name:<8} {p50:>9.3f} {p95:>9.3f} {p99:>9.3f}")
+    print(f"total wall time: {sum(total_ms):.1f} ms, mean fps: {1000 * len(total_ms) / sum(total_ms):.0f}")
+
+
+def _percentiles(samples: list[float]) -> tuple[float, float, float]:
+    """
+    Returns p50, p95, p99.
+    """
+
+    # Quantiles needs at least 2 samples
+    if len(samples) < 2:
+        return (samples[0], samples[0], samples[0])
+    cut_points: list[float] = quantiles(samples, n=100, method="inclusive")
+    return (cut_points[49], cut_points[94], cut_points[98])
+
+
+#############
+# SCENARIOS #
+#############
+def _enter_room_json_generator_edit_room(game: Game, dt: int, room_width_tu: int, room_height_tu: int) -> None:
+    """
+    Drive the room editor to edit room mode, on an empty room of the given size.
+    Dummy driver has no mouse, so the world map room pick is set directly.
+    Everything else goes through the scene own states and key input.
+    """
+
+    # Imported here, the game only imports editor scenes when they are set
+    from scenes.room_json_generator import RoomJsonGenerator
+
+    scene = game.current_scene
+    if not isinstance(scene, RoomJsonGenerator):
+        raise ValueError("RoomJsonGenerator edit room needs RoomJsonGenerator as current scene")
+
+    # Wait for the world map
+    _run_until(
+        game,
+        dt,
+        lambda: scene.state_machine_update.state == RoomJsonGenerator.State.OPENED_SCENE_CURTAIN and scene.curtain.is_done,
+    )
+
+    # Pick the room, what the second world map click does
+    scene.room_width = room_width_tu * TILE_SIZE
+    scene.room_height = room_height_tu * TILE_SIZE
+    scene.room_width_tu = room_width_tu
+    scene.room_height_tu = room_height_tu
+    scene.camera.set_rect_limit(0.0, float(scene.room_height), 0.0, float(scene.room_width))
+    scene.player.set_room_height_tu(scene.room_height_tu)
+    scene.player.set_room_width_tu(scene.room_width_tu)
+    scene.state_machine_update.change_state(RoomJsonGenerator.State.ADD_OTHER_ROOM)
+    scene.state_machine_draw.change_state(RoomJsonGenerator.State.ADD_OTHER_ROOM)
+    scene.curtain.go_to_opaque()
+
+    # File name query
+    _run_until(
+        game,
+        dt,
+        lambda: scene.state_machine_update.state == RoomJsonGenerator.State.FILE_NAME_QUERY and scene.curtain.is_done,
+    )
+    scene._set_input_text("benchmark_room")
+    _tap(pg.K_RETURN)
+
+    # Sprite sheet JSON path query
+    def _is_sprite_sheet_json_path_query_ready() -> bool:
+        is_query_state: bool = scene.state_machine_update.state == RoomJsonGenerator.State.SPRITE_SHEET_JSON_PATH_QUERY
+        return is_query_state and scene.curtain.is_done
+
+    _run_until(game, dt, _is_sprite_sheet_json_path_query_ready)
+    scene._set_input_text(join(JSONS_REPO_DIR_PATH, "stage_1_sprite_sheet_metadata.json"))
+    _tap(pg.K_RETURN)
+
+    # Edit room
+    _run_until(
+        game,
+        dt,
+        lambda: scene.state_machine_update.state == RoomJsonGenerator.State.EDIT_ROOM and scene.curtain.is_done,
+    )
+
+
+def _draw_room_json_generator_pre_renders(game: Game) -> None:
+    """
+    Draw the room editor pre render chunks and static actors the camera sees, bakes the missing chunks.
+    """
+
+    scene = game.current_scene
+    blit_sequence: list[tuple[pg.Surface, tuple[float, float]]] = []
+    scene.background_chunk_renderer.draw(scene.camera.rect, blit_sequence)
+    for static_actor_instance in scene.sprite_sheet_static_actor_instance_dict.values():
+        static_actor_instance.draw(blit_sequence)
+    scene.foreground_chunk_renderer.draw(scene.camera.rect, blit_sequence)
+    NATIVE_SURF.fblits(blit_sequence)
+
+
+def _setup_room_json_generator_play_test(game: Game, dt: int) -> None:
+    """
+    Drive the room editor to play test mode, in a 1 by 1 room with a ring of solid tiles.
+    """
+
+    _enter_room_json_generator_edit_room(game, dt, ROOM_WIDTH_TU, ROOM_HEIGHT_TU)
+    scene = game.current_scene
+
+    # Ring of solid tiles so the player collides every frame
+    for world_tu_y in range(scene.room_height_tu):
+        for world_tu_x in range(scene.room_width_tu):
+            is_border: bool = world_tu_x in (0, scene.room_width_tu - 1) or world_tu_y in (0, scene.room_height_tu - 1)
+            if not is_border:
+                continue
+            scene._set_tile_from_collision_map_list(
+                world_tu_x=world_tu_x,
+                world_tu_y=world_tu_y,
+                value=get_none_or_blob_sprite_metadata("ceramic_floor", "solid", 320, 0),
+                collision_map_list=scene.solid_collision_map_list,
+                is_update_pre_render=True,
+            )
+    scene._update_pre_render()
+
+    # Put player inside the ring
+    scene.player.collider_rect.topleft = (TILE_SIZE * 2, TILE_SIZE * 2)
+
+    # Tap enter to play test, then hold right and down to push into the corner
+    _tap(game.local_settings_metadata_instance.enter)
+    _run_until(game, dt, lambda: scene.is_play_test_mode)
+    _hold(game.local_settings_metadata_instance.right)
+    _hold(game.local_settings_metadata_instance.down)
+
+
+# Scenario name : (Game scene name, setup callback)
+SCENARIOS: dict[str, tuple[str, None | Callable[[Game, int], None]]] = {
+    "RoomJsonGeneratorPlayTest": ("RoomJsonGenerator", _setup_room_json_generator_play_test),
+}
+
+
+############
+# COMMANDS #
+############
+def frames(args: Namespace) -> None:
+    """
+    Run a scene for N frames as fast as possible with a synthetic dt.
+    Report update, draw and present frame time percentiles.
+    """
+
+    # Scenario or plain Game scene name
+    scene_name: str = args.scene
+    setup: None | Callable[[Game, int], None] = None
+    if args.scene in SCENARIOS:
+        scene_name, setup = SCENARIOS[args.scene]
+
+    game: Game = Game(scene_name)
+    game.debug_draw.is_active = args.debug_draw
+    # Window size, in memory only, settings on disk are untouched
+    if args.resolution_index is not None:
+        game.set_resolution_index(args.resolution_index)
+
+    # Get the scene to the state being measured
+    if setup is not None:
+        setup(game, args.dt)
+
+    # Warm up caches and allocators, untimed
+    for _ in range(args.warmup):
+        _step(game, args.dt)
+
+    update_ms: list[float] = []
+    draw_ms: list[float] = []
+    present_ms: list[float] = []
+    idle_frame_count: int = 0
+
+    for _ in range(args.frames):
+        for event in pg.event.get(EVENTS):
+            game.event_handler.event(event)
+
+        # Update
+        start: float = perf_counter()
+        game.current_scene.update(args.dt)
+        game.event_handler.reset_just_events()
+        after_update: float = perf_counter()
+
+        # Draw
+        if game.debug_draw.is_active:
+            game.set_is_full_redraw(True)
+        is_drawn: bool = game.current_scene.draw()
+        if game.debug_draw.is_active:
+            game.debug_draw.draw()
+        after_draw: float = perf_counter()
+
+        # Present, idle frames skip it like the main loop
+        if is_drawn:
+            _present(game, args.dirty_rects)
+        else:
+            idle_frame_count += 1
+            game.reset_dirty_rects()
+        after_present: float = perf_counter()
+
+        update_ms.append((after_update - start) * 1000)
+        draw_ms.append((after_draw - after_update) * 1000)
+        present_ms.append((after_present - after_draw) * 1000)
+
+    print(
+        f"scene: {args.scene} | frames: {args.frames} | dt: {args.dt} ms | "
+        f"window: {game.window_width}x{game.window_height} | dirty rects: {args.dirty_rects}"
+    )
+    _print_percentiles(update_ms, draw_ms, present_ms)
+    print(f"idle frames, no scale or present: {idle_frame_count}")
+
+
+def replay(args: Namespace) -> None:
+    """
+    Feed an input log from main.py --record through the game as fast as possible.
+    Same fixed steps as the main loop, so the same log runs the same frames on every build.
+    Report update, draw and present frame time percentiles, and a checksum of the last frame.
+    """
+
+    input_replayer: InputReplayer = InputReplayer(args.log)
+
+    # Same first scene and window scale as the recorded session
+    game: Game = Game(input_replayer.initial_scene)
+    options_menu: OptionsMenu = OptionsMenu(game)
+    game.set_resolution_index(input_replayer.resolution_index)
+    game.debug_draw.is_active = args.debug_draw
+
+    update_ms: list[float] = []
+    draw_ms: list[float] = []
+    present_ms: list[float] = []
+    accumulator: float = 0.0
+    step_dt_remainder: float = 0.0
+
+    while 1:
+        replay_frame: None | tuple[int, tuple[int, int], list[pg.Event]] = input_replayer.next_frame()
+        if replay_frame is None:
+            break
+        dt, mouse_position_tuple, events = replay_frame
+
+        # Window closed in the session? Replay ends here, the event handler would exit
+        if any(event.type == pg.QUIT for event in events):
+            break
+
+        game.event_handler.set_mouse_position_tuple(mouse_position_tuple)
+        for event in events:
+            game.event_handler.event(event)
+
+        # Update, fixed steps like the main loop
+        start: float = perf_counter()
+        accumulator += dt
+        steps: int = 0
+        while accumulator >= FIXED_STEP_MS and steps < MAX_CATCH_UP_STEPS:
+            step_dt_remainder += FIXED_STEP_MS
+            step_dt: int = int(step_dt_remainder)
+            step_dt_remainder -= step_dt
+            if game.is_options_menu_active:
+                options_menu.update(step_dt)
+            else:
+                game.current_scene.update(step_dt)
+            accumulator -= FIXED_STEP_MS
+            steps += 1
+            game.event_handler.reset_just_events()
+        if accumulator >= FIXED_STEP_MS:
+            accumulator %= FIXED_STEP_MS
+        after_update: float = perf_counter()
+
+        # Draw
+        if game.debug_draw.is_active:
+            game.set_is_full_redraw(True)
+        if game.is_options_menu_active and options_menu.get_is_fading():
+            game.set_is_full_redraw(True)
+        is_drawn: bool = game.current_scene.draw(accumulator / FIXED_STEP_MS)
+        if game.is_options_menu_active:
+            is_drawn = options_menu.draw() or is_drawn
+        if game.debug_draw.is_active:
+            game.debug_draw.draw()
+        after_draw: float = perf_counter()
+
+        # Present, idle frames skip it like the main loop
+        if is_drawn:
+            _present(game, args.dirty_rects)
+        else:
+            game.reset_dirty_rects()
+        after_present: float = perf_counter()
+
+        update_ms.append((after_update - start) * 1000)
+        draw_ms.append((after_draw - after_update) * 1000)
+        present_ms.append((after_present - after_draw) * 1000)
+
+    if not update_ms:
+        raise ValueError(f"{args.log} has no frames to replay")
+
+    print(
+        f"log: {args.log} | frames: {input_replayer.frame_count} | first scene: {input_replayer.initial_scene} | "
+        f"window: {game.window_width}x{game.window_height} | dirty rects: {args.dirty_rects}"
+    )
+    _print_percentiles(update_ms, draw_ms, present_ms)
+    # Same log and same game logic give the same last frame
+    print(f"last frame: {type(game.current_scene).__name__}, native crc32 {crc32(pg.image.tobytes(NATIVE_SURF, 'RGB')):08x}")
+
+
+def first_frame(args: Namespace) -> None:
+    """
+    Child process of startup.
+    Build the game, draw and present its first frame, print the phase times and exit.
+    """
+
+    after_import: float = perf_counter()
+
+    game: Game = Game(args.scene)
+    after_game: float = perf_counter()
+
+    game.current_scene.update(FIXED_DT)
+    game.current_scene.draw()
+    pg.transform.scale(NATIVE_SURF, (game.window_width, game.window_height), game.window_surf)
+    pg.display.update()
+    after_first_frame: float = perf_counter()
+
+    print(
+        f"{(after_import - IMPORT_START) * 1000} {(after_game - after_import) * 1000} {(after_first_frame - after_game) * 1000}",
+        flush=True,
+    )
+
+
+def startup(args: Namespace) -> None:
+    """
+    Time to first frame, from process spawn to the first presented frame.
+    Each run is a fresh interpreter, the first one may also pay for writing bytecode caches.
+    """
+
+    wall_ms: list[float] = []
+    import_ms: list[float] = []
+    game_ms: list[float] = []
+    first_frame_ms: list[float] = []
+
+    for _ in range(args.runs):
+        start: float = perf_counter()
+        process: Popen = Popen([executable, __file__, "first-frame", "--scene", args.scene], stdout=PIPE, text=True)
+        # Last line is the phase times, pygame prints its banner first
+        output_lines: list[str] = process.communicate()[0].strip().splitlines()
+        wall_ms.append((perf_counter() - start) * 1000)
+        if process.returncode != 0 or not output_lines:
+            raise ValueError(f"first-frame child exited with {process.returncode}")
+        child_import_ms, child_game_ms, child_first_frame_ms = (float(value) for value in output_lines[-1].split())
+        import_ms.append(child_import_ms)
+        game_ms.append(child_game_ms)
+        first_frame_ms.append(child_first_frame_ms)
+
+    print(f"scene: {args.scene} | runs: {args.runs}")
+    print(f"{'phase':<12} {'min':>10} {'median':>10} {'max':>10}")
+    for name, samples in (
+        ("import", import_ms),
+        ("game init", game_ms),
+        ("first frame", first_frame_ms),
+        ("wall", wall_ms),
+    ):
+        print(f"{name:<12} {min(samples):>10.1f} {median(samples):>10.1f} {max(samples):>10.1f}")
+
+
+def typecheck(args: Namespace) -> None:
+    """
+    Per frame overhead of typeguard runtime checks.
+    Run the frames command of a scene twice in fresh processes, with GAME_TYPECHECK on and off.
+    """
+
+    wall_ms: dict[str, float] = {}
+
+    for label, value in (("on", "1"), ("off", "0")):
+        command: list[str] = [
+            executable,
+            __file__,
+            "frames",
+            "--scene",
+            args.scene,
+            "--frames",
+            str(args.frames),
+            "--warmup",
+            str(args.warmup),
+        ]
+        process: Popen = Popen(command, stdout=PIPE, text=True, env={**environ, "GAME_TYPECHECK": value})
+        output: str = process.communicate()[0]
+        if process.returncode != 0:
+            raise ValueError(f"frames child exited with {process.returncode}")
+
+        print(f"typecheck {label}")
+        # Drop the pygame banner
+        print("\n".join(line for line in output.splitlines() if not line.startswith("pygame")))
+
+        match = search(r"total wall time: ([0-9.]+) ms", output)
+        if match is None:
+            raise ValueError("frames child output has no total wall time")
+        wall_ms[label] = float(match.group(1))
+
+    print(f"mean frame time on {wall_ms['on'] / args.frames:.3f} ms, off {wall_ms['off'] / args.frames:.3f} ms")
+    print(f"typecheck overhead per frame: {(wall_ms['on'] - wall_ms['off']) / args.frames:.3f} ms")
+
+
+def rooms(args: Namespace) -> None:
+    """
+    Load time of a synthetic room, every layer half filled, as JSON and as a binary room.
+    JSON is parsed and every tile turned into a NoneOrBlobSpriteMetadata, like the room editor holds it.
+    Binary is mapped from disk, then turned into the same collision map lists, and into tile layers, for comparison.
+    Memory compares 1 list layer, its pointers, with 1 tile layer, its arrays, small ints and sprites are shared by both.
+    """
+
+    width_tu: int = args.scale * ROOM_WIDTH_TU
+    height_tu: int = args.scale * ROOM_HEIGHT_TU
+
+    def _tile_layer(region_x: int) -> list:
+        return [
+            (
+                {
+                    "name": "ceramic_floor",
+                    "type": "solid",
+                    "x": (cell_index % width_tu) * TILE_SIZE,
+                    "y": (cell_index // width_tu) * TILE_SIZE,
+                    "region_x": region_x + (cell_index % 3) * TILE_SIZE,
+                    "region_y": 0,
+                }
+                if cell_index % 2
+                else 0
+            )
+            for cell_index in range(width_tu * height_tu)
+        ]
+
+    room_json_dict: dict = {
+        "file_name": "benchmark_room.json",
+        "room_x_ru": 0,
+        "room_y_ru": 0,
+        "room_scale_x": args.scale,
+        "room_scale_y": args.scale,
+        "sprite_sheet_png_name": "stage_1_sprite_sheet.png",
+        "sprite_room_map_body_color": "#492a1e",
+        "sprite_room_map_sub_division_color": "#5a3729",
+        "sprite_room_map_border_color": "#e5e3bc",
+        "background_collision_map_list": [_tile_layer(320) for _ in range(args.layers)],
+        "solid_collision_map_list": _tile_layer(320),
+        "foreground_collision_map_list": [_tile_layer(384) for _ in range(args.layers)],
+        "static_actor_collision_map_list": [[cell_index % 2 for cell_index in range(width_tu * height_tu)]],
+    }
+    room_json: str = dumps(room_json_dict)
+    room_bytes: bytes = room_json_to_bytes(room_json_dict)
+
+    json_ms: list[float] = []
+    binary_ms: list[float] = []
+    binary_lists_ms: list[float] = []
+    binary_layers_ms: list[float] = []
+    with TemporaryDirectory() as dir_path:
+        room_path: str = join(dir_path, "benchmark_room.room")
+        with open(room_path, "wb") as room_file:
+            room_file.write(room_bytes)
+
+        for _ in range(args.runs):
+            start: float = perf_counter()
+            loaded_json_dict: dict = loads(room_json)
+            for layer in (
+                *loaded_json_dict["background_collision_map_list"],
+                loaded_json_dict["solid_collision_map_list"],
+                *loaded_json_dict["foreground_collision_map_list"],
+            ):
+                [cell if cell == 0 else instance_none_or_blob_sprite_metadata(cell) for cell in layer]
+            json_ms.append((perf_counter() - start) * 1000)
+
+            start = perf_counter()
+            room_binary = load_room_binary(room_path)
+            binary_ms.append((perf_counter() - start) * 1000)
+
+            start = perf_counter()
+            for layer_key, layers in room_binary.layers.items():
+                for layer_index in range(len(layers)):
+                    room_binary.to_collision_map_list(layer_key, layer_index)
+            binary_lists_ms.append((perf_counter() - start) * 1000)
+
+            start = perf_counter()
+            for layer_key, layers in room_binary.layers.items():
+                for layer_index in range(len(layers)):
+                    room_binary.to_tile_layer(layer_key, layer_index)
+            binary_layers_ms.append((perf_counter() - start) * 1000)
+
+            # Memory of the solid layer, shared sprites are not counted in either
+            solid_list: list = room_binary.to_collision_map_list("solid_collision_map_list", 0)
+            list_bytes: int = getsizeof(solid_list)
+            layer_bytes: int = room_binary.to_tile_layer("solid_collision_map_list", 0).get_byte_size()
+            del solid_list
+            # Views into the map, release them before the file goes
+            del room_binary
+
+    print(f"room: {width_tu}x{height_tu} tu, {2 * args.layers + 2} layers | runs: {args.runs}")
+    print(f"size: JSON {len(room_json) / 1024:.1f} KB, binary {len(room_bytes) / 1024:.1f} KB")
+    print(f"1 layer in memory: list {list_bytes / 1024:.1f} KB, tile layer {layer_bytes / 1024:.1f} KB")
+    print(f"{'load':<24} {'min':>10} {'median':>10} {'max':>10}")
+    for name, samples in (
+        ("JSON + tile instances", json_ms),
+        ("binary map", binary_ms),
+        ("binary to tile lists", binary_lists_ms),
+        ("binary to tile layers", binary_layers_ms),
+    ):
+        print(f"{name:<24} {min(samples):>10.2f} {median(samples):>10.2f} {max(samples):>10.2f}")
+
+
+def paint(args: Namespace) -> None:
+    """
+    Cost of painting 1 tile in the room editor, per room size, every room half filled with solid tiles.
+    Each sample sets or erases 1 tile like the brush, then updates the pre render.
+    Dirty cells is what the editor does, full rebake is a whole room pre render update and the camera view baked again.
+    Dirty cells should stay flat as the room grows.
+    """
+
+    game: Game = Game("RoomJsonGenerator")
+    tile: NoneOrBlobSpriteMetadata = get_none_or_blob_sprite_metadata("ceramic_floor", "solid", 320, 0)
+
+    print(f"runs: dirty cells {args.runs}, full rebake {args.full_runs}")
+    print(f"{'room tu':<12} {'dirty cells median':>20} {'dirty cells max':>18} {'full rebake median':>20}")
+    for room_size_tu in args.sizes:
+        game.set_scene("RoomJsonGenerator")
+        _enter_room_json_generator_edit_room(game, FIXED_DT, room_size_tu, room_size_tu)
+        scene = game.current_scene
+
+        # Half filled, untimed
+        for world_tu_y in range(room_size_tu):
+            for world_tu_x in range(world_tu_y % 2, room_size_tu, 2):
+                scene.solid_collision_map_list.set_tile(world_tu_x, world_tu_y, tile)
+        scene._update_pre_render()
+        _draw_room_json_generator_pre_renders(game)
+
+        def _paint_one_tile(sample_index: int) -> None:
+            # Walk the room, flip the cell between the tile and empty
+            world_tu_x: int = (sample_index * 7) % room_size_tu
+            world_tu_y: int = (sample_index * 13) % room_size_tu
+            scene._set_tile_from_collision_map_list(
+                world_tu_x=world_tu_x,
+                world_tu_y=world_tu_y,
+                value=0 if scene.solid_collision_map_list.get_tile(world_tu_x, world_tu_y) != 0 else tile,
+                collision_map_list=scene.solid_collision_map_list,
+                is_update_pre_render=True,
+            )
+
+        dirty_ms: list[float] = []
+        for sample_index in range(args.runs):
+            start: float = perf_counter()
+            _paint_one_tile(sample_index)
+            scene._update_pre_render_dirty_cells()
+            dirty_ms.append((perf_counter() - start) * 1000)
+
+        full_ms: list[float] = []
+        for sample_index in range(args.full_runs):
+            start = perf_counter()
+            _paint_one_tile(sample_index)
+            scene._update_pre_render()
+            _draw_room_json_generator_pre_renders(game)
+            full_ms.append((perf_counter() - start) * 1000)
+
+        print(
+            f"{f'{room_size_tu}x{room_size_tu}':<12} {median(dirty_ms):>17.3f} ms {max(dirty_ms):>15.3f} ms "
+            f"{median(full_ms):>17.2f} ms"
+        )
+
+
+def chunks(args: Namespace) -> None:
+    """
+    Room editor pre render memory and draw time, per room size, with the camera sweeping the whole room.
+    Every room is half filled with solid tiles and every static actor is placed on a quarter of the cells.
+    Full room surfs is what 1 surf as big as the room per pre render and per static actor frame would hold.
+    Resident is the tile chunks held after the sweep, bounded by max chunks per renderer, not by the room size.
+    Static actors hold no pre render, they draw their frame strip on the cells the camera sees.
+    Draw includes baking the chunks the camera sees first.
+    """
+
+    game: Game = Game("RoomJsonGenerator")
+    tile: NoneOrBlobSpriteMetadata = get_none_or_blob_sprite_metadata("ceramic_floor", "solid", 320, 0)
+    bytes_per_pixel: int = NATIVE_SURF.get_bytesize()
+
+    print(f"{'room tu':<12} {'full room surfs':>16} {'resident':>12} {'draw median':>14} {'draw max':>12} {'bakes':>8}")
+    for room_size_tu in args.sizes:
+        game.set_scene("RoomJsonGenerator")
+        _enter_room_json_generator_edit_room(game, FIXED_DT, room_size_tu, room_size_tu)
+        scene = game.current_scene
+
+        # Half filled solid, static actors on a quarter of the cells, untimed
+        for world_tu_y in range(room_size_tu):
+            for world_tu_x in range(world_tu_y % 2, room_size_tu, 2):
+                scene.solid_collision_map_list.set_tile(world_tu_x, world_tu_y, tile)
+        scene._update_pre_render()
+        frame_count: int = 0
+        for static_actor_instance in scene.sprite_sheet_static_actor_instance_dict.values():
+            for world_tu_y in range(0, room_size_tu, 2):
+                for world_tu_x in range(0, room_size_tu, 2):
+                    static_actor_instance.collision_map_list.set_tile(world_tu_x, world_tu_y, 1)
+            frame_count += static_actor_instance.animation_sprites_list_len
+
+        # Sweep the camera over every row of screens, left to right, a tile per frame
+        draw_ms: list[float] = []
+        for camera_y in range(0, max(scene.room_height - NATIVE_HEIGHT, 0) + 1, NATIVE_HEIGHT):
+            for camera_x in range(0, max(scene.room_width - NATIVE_WIDTH, 0) + 1, TILE_SIZE):
+                scene.camera.rect.topleft = (camera_x, camera_y)
+                for static_actor_instance in scene.sprite_sheet_static_actor_instance_dict.values():
+                    static_actor_instance.update(FIXED_DT)
+                start: float = perf_counter()
+                _draw_room_json_generator_pre_renders(game)
+                draw_ms.append((perf_counter() - start) * 1000)
+
+        chunk_renderers = [scene.background_chunk_renderer, scene.foreground_chunk_renderer]
+        full_room_bytes: int = (2 + frame_count) * scene.room_width * scene.room_height * bytes_per_pixel
+        resident_bytes: int = sum(chunk_renderer.get_resident_bytes() for chunk_renderer in chunk_renderers)
+        bake_count: int = sum(chunk_renderer.bake_count for chunk_renderer in chunk_renderers)
+        print(
+            f"{f'{room_size_tu}x{room_size_tu}':<12} {full_room_bytes / 2**20:>13.1f} MB {resident_bytes / 2**20:>9.1f} MB "
+            f"{median(draw_ms):>11.3f} ms {max(draw_ms):>9.3f} ms {bake_count:>8}"
+        )
+
+
+def collision(args: Namespace) -> None:
+    """
+    Kinematic swept AABB cost.
+    Per tile compares the Vector2 path, utils dynamic rect vs rect and ray vs rect with fresh contact lists like the old resolver,
+    against utils swept rect vs rect on plain floats with a reused hit list, what the resolver uses now.
+    Resolve times a whole resolve vel against solid tiles per scenario, in a walled room with a floor.
+    Peak is the most memory 1 call holds at once, traced, so it counts every object it makes.
+    """
+
+    game: Game = Game("MainMenu")
+    dt: int = FIXED_DT
+
+    def _time_us(call: Callable[[], object]) -> float:
+        start: float = perf_counter()
+        for _ in range(args.runs):
+            call()
+        return (perf_counter() - start) / args.runs * 1e6
+
+    def _peak_bytes(call: Callable[[], object]) -> int:
+        start_tracemalloc()
+        call()
+        current, _ = get_traced_memory()
+        reset_peak()
+        call()
+        _, peak = get_traced_memory()
+        stop_tracemalloc()
+        return peak - current
+
+    # Per tile, a collider falling on a tile
+    collider_rect: pg.FRect = pg.FRect(100.0, 60.0, 6.0, 25.0)
+    tile_rect: pg.FRect = pg.FRect(96.0, 96.0, TILE_SIZE, TILE_SIZE)
+    velocity: pg.Vector2 = pg.Vector2(0.02, 0.4)
+    sweep_hit: list[float] = [0.0, 0.0, 0.0, 0.0, 0.0]
+
+    def _vector2_path() -> object:
+        return dynamic_rect_vs_rect(velocity, collider_rect, tile_rect, [pg.Vector2(0, 0)], [pg.Vector2(0, 0)], [0.0], dt)
+
+    def _floats_path() -> object:
+        return swept_rect_vs_rect(
+            velocity.x,
+            velocity.y,
+            dt,
+            collider_rect.x,
+            collider_rect.y,
+            collider_rect.width,
+            collider_rect.height,
+            tile_rect.x,
+            tile_rect.y,
+            tile_rect.width,
+            tile_rect.height,
+            sweep_hit,
+        )
+
+    print(f"runs: {args.runs}")
+    print(f"{'per tile':<32} {'time':>10} {'peak':>10}")
+    for name, call in (
+        ("vector2, dynamic rect vs rect", _vector2_path),
+        ("floats, swept rect vs rect", _floats_path),
+    ):
+        print(f"{name:<32} {_time_us(call):>7.2f} us {_peak_bytes(call):>8} B")
+
+    # Resolve, a room walled on the left and right with a floor
+    solid_collision_map_list: TileLayer = TileLayer(20, 11)
+    solid_collision_map_list.fill_region(0, 10, 20, 1, 1)
+    solid_collision_map_list.fill_region(0, 0, 1, 11, 1)
+    solid_collision_map_list.fill_region(19, 0, 1, 11, 1)
+    collider_rect = pg.FRect(0.0, 0.0, 6.0, 25.0)
+    kinematic: Kinematic = Kinematic(
+        collider_rect,
+        solid_collision_map_list,
+        20,
+        11,
+        game.debug_draw,
+        Camera(pg.Vector2(0.0, 0.0), game.debug_draw),
+    )
+
+    print(f"{'resolve':<32} {'time':>10} {'peak':>10}")
+    for name, collider_topleft, scenario_velocity in (
+        ("air", (150.0, 40.0), (0.05, 0.05)),
+        ("landing on floor", (150.0, 130.0), (0.1, 0.4)),
+        ("running into wall", (20.0, 135.0), (-0.3, 0.01)),
+        ("into floor and wall corner", (20.0, 130.0), (-0.3, 0.4)),
+    ):
+
+        def _resolve() -> object:
+            collider_rect.topleft = collider_topleft
+            return kinematic.resolve_vel_against_solid_tiles(dt, pg.Vector2(scenario_velocity))
+
+        print(f"{name:<32} {_time_us(_resolve):>7.2f} us {_peak_bytes(_resolve):>8} B")
+
+
+def batch(args: Namespace) -> None:
+    """
+    Many bodies resolved against solid tiles, per body count.
+    Kinematic is 1 resolve vel against solid tiles per body, like every body owning its kinematic.
+    Batch per body is the batch kinematic fallback, batch numpy resolves every body in 1 go, if NumPy is installed.
+    Bodies are seeded, falling and running in a walled room with a floor and platforms, so every count lands on tiles.
+    """
+
+    game: Game = Game("MainMenu")
+    dt: int = FIXED_DT
+
+    # A walled room with a floor and seeded platforms
+    random: Random = Random(0)
+    room_width_tu: int = 120
+    room_height_tu: int = 60
+    solid_collision_map_list: TileLayer = TileLayer(room_width_tu, room_height_tu)
+    solid_collision_map_list.fill_region(0, room_height_tu - 1, room_width_tu, 1, 1)
+    solid_collision_map_list.fill_region(0, 0, 1, room_height_tu, 1)
+    solid_collision_map_list.fill_region(room_width_tu - 1, 0, 1, room_height_tu, 1)
+    for _ in range(200):
+        solid_collision_map_list.fill_region(
+            random.randrange(room_width_tu - 8), random.randrange(room_height_tu - 1), random.randrange(2, 8), 1, 1
+        )
+
+    # 1 kinematic moved onto each body, and the batch
+    collider_rect: pg.FRect = pg.FRect(0.0, 0.0, 6.0, 25.0)
+    kinematic: Kinematic = Kinematic(
+        collider_rect,
+        solid_collision_map_list,
+        room_width_tu,
+        room_height_tu,
+        game.debug_draw,
+        Camera(pg.Vector2(0.0, 0.0), game.debug_draw),
+    )
+    batch_kinematic: BatchKinematic = BatchKinematic(solid_collision_map_list)
+
+    print(f"runs: {args.runs}, numpy: {'yes' if IS_NUMPY_AVAILABLE else 'no, pip install numpy'}")
+    print(f"{'bodies':>8} {'kinematic':>12} {'batch per body':>16} {'batch numpy':>14} {'resolved':>10}")
+    for count in args.counts:
+        # Seeded bodies, float32 exact like a FRect holds them
+        rects: array = array("d")
+        input_velocities: array = array("d")
+        for _ in range(count):
+            collider_rect.topleft = (
+                random.uniform(TILE_SIZE, (room_width_tu - 2) * TILE_SIZE),
+                random.uniform(0.0, (room_height_tu - 3) * TILE_SIZE),
+            )
+            rects.extend((collider_rect.x, collider_rect.y, collider_rect.width, collider_rect.height))
+            input_velocities.extend((random.uniform(-0.3, 0.3), random.uniform(-0.1, 0.5)))
+
+        def _kinematic() -> array:
+            velocities: array = array("d", input_velocities)
+            for body_index in range(count):
+                collider_rect.topleft = (rects[body_index * 4], rects[body_index * 4 + 1])
+                velocity: pg.Vector2 = kinematic.resolve_vel_against_solid_tiles(
+                    dt, pg.Vector2(velocities[body_index * 2], velocities[body_index * 2 + 1])
+                )
+                velocities[body_index * 2] = velocity.x
+                velocities[body_index * 2 + 1] = velocity.y
+            return velocities
+
+        def _batch_per_body() -> array:
+            return batch_kinematic._resolve_vels_per_body(dt, rects, array("d", input_velocities))
+
+        def _batch_numpy() -> array:
+            return batch_kinematic._resolve_vels_with_numpy(dt, rects, array("d", input_velocities))
+
+        # Median of runs, in ms
+        def _time_ms(call: Callable[[], array]) -> float:
+            samples: list[float] = []
+            for _ in range(args.runs):
+                start: float = perf_counter()
+                call()
+                samples.append((perf_counter() - start) * 1000)
+            return median(samples)
+
+        # Every path must resolve the same velocities
+        expected_velocities: array = _kinematic()
+        if _batch_per_body() != expected_velocities:
+            raise ValueError("batch per body resolved other velocities than kinematic")
+        numpy_ms: str = "-"
+        if IS_NUMPY_AVAILABLE:
+            if _batch_numpy() != expected_velocities:
+                raise ValueError("batch numpy resolved other velocities than kinematic")
+            numpy_ms = f"{_time_ms(_batch_numpy):.3f} ms"
+        # Bodies whose velocity changed
+        resolved_count: int = sum(
+            1
+            for expected_x, expected_y, input_x, input_y in zip(
+                expected_velocities[::2], expected_velocities[1::2], input_velocities[::2], input_velocities[1::2]
+            )
+            if (expected_x, expected_y) != (input_x, input_y)
+        )
+
+        print(
+            f"{count:>8} {_time_ms(_kinematic):>9.3f} ms {_time_ms(_batch_per_body):>13.3f} ms {numpy_ms:>14} {resolved_count:>10}"
+        )
+
+
+def schemas(args: Namespace) -> None:
+    """
+    Load time of the stage 1 sprite sheet JSON and every animation JSON, parse and dataclass instances.
+    Validate per call builds a jsonschema validator every call, the old validate json.
+    Compiled uses the validators compiled at import, trusted skips validation like bundled JSONs in the release.
+    """
+
+    # (file bytes, schema, loader), read once so only parse and load are timed
+    jsons: list[tuple[bytes, dict, Callable]] = []
+    with open(join(JSONS_REPO_DIR_PATH, "stage_1_sprite_sheet_metadata.json"), "rb") as json_file:
+        jsons.append((json_file.read(), SPRITE_SHEET_METADATA_SCHEMA, instance_sprite_sheet_metadata))
+    for file_name in sorted(listdir(JSONS_REPO_DIR_PATH)):
+        if file_name.endswith("_animation.json"):
+            with open(join(JSONS_REPO_DIR_PATH, file_name), "rb") as json_file:
+                jsons.append((json_file.read(), ANIMATION_SCHEMA, instance_animation_metadata))
+
+    def _validate_per_call(json_bytes: bytes, schema: dict, loader: Callable) -> None:
+        json_dict: dict = loads(json_bytes)
+        validate(instance=json_dict, schema=schema)
+        loader(json_dict, True)
+
+    def _compiled(json_bytes: bytes, _schema: dict, loader: Callable) -> None:
+        loader(loads(json_bytes))
+
+    def _trusted(json_bytes: bytes, _schema: dict, loader: Callable) -> None:
+        loader(loads(json_bytes), True)
+
+    print(f"jsons: {len(jsons)}, {sum(len(json_bytes) for json_bytes, _, _ in jsons) / 1024:.1f} KB | runs: {args.runs}")
+    print(f"{'load all':<24} {'min':>10} {'median':>10} {'max':>10}")
+    for name, load_json in (
+        ("validate per call", _validate_per_call),
+        ("compiled validator", _compiled),
+        ("trusted", _trusted),
+    ):
+        samples: list[float] = []
+        for _ in range(args.runs):
+            start: float = perf_counter()
+            for json_bytes, schema, loader in jsons:
+                load_json(json_bytes, schema, loader)
+            samples.append((perf_counter() - start) * 1000)
+        print(f"{name:<24} {min(samples):>10.3f} {median(samples):>10.3f} {max(samples):>10.3f}")
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser(description="Headless benchmarks, run from the repo root.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    frames_parser: ArgumentParser = subparsers.add_parser("frames", help="Frame time percentiles of a scene.")
+    frames_parser.add_argument("--scene", default="MainMenu", help=f"Game scene name or one of {list(SCENARIOS)}.")
+    frames_parser.add_argument("--frames", type=int, default=1000)
+    frames_parser.add_argument("--warmup", type=int, default=60)
+    frames_parser.add_argument("--dt", type=int, default=FIXED_DT, help="Synthetic dt in ms fed to update.")
+    frames_parser.add_argument("--debug-draw", action="store_true", help="Include the debug draw overlay.")
+    frames_parser.add_argument("--resolution-index", type=int, default=None, help="Window resolution index, 0 - 6.")
+    frames_parser.add_argument("--dirty-rects", action="store_true", help="Present dirty rects only, like the main loop.")
+    frames_parser.set_defaults(func=frames)
+
+    replay_parser: ArgumentParser = subparsers.add_parser("replay", help="Frame time percentiles of a recorded session.")
+    replay_parser.add_argument("--log", required=True, help="Input log written by main.py --record.")
+    replay_parser.add_argument("--debug-draw", action="store_true", help="Include the debug draw overlay.")
+    replay_parser.add_argument("--dirty-rects", action="store_true", help="Present dirty rects only, like the main loop.")
+    replay_parser.set_defaults(func=replay)
+
+    startup_parser: ArgumentParser = subparsers.add_parser("startup", help="Time to first frame in fresh processes.")
+    startup_parser.add_argument("--scene", default="CreatedBySplashScreen", help="Game scene name.")
+    startup_parser.add_argument("--runs", type=int, default=5)
+    startup_parser.set_defaults(func=startup)
+
+    typecheck_parser: ArgumentParser = subparsers.add_parser("typecheck", help="Frame time with typeguard checks on and off.")
+    typecheck_parser.add_argument(
+        "--scene", default="RoomJsonGeneratorPlayTest", help=f"Game scene name or one of {list(SCENARIOS)}."
+    )
+    typecheck_parser.add_argument("--frames", type=int, default=1000)
+    typecheck_parser.add_argument("--warmup", type=int, default=60)
+    typecheck_parser.set_defaults(func=typecheck)
+
+    rooms_parser: ArgumentParser = subparsers.add_parser("rooms", help="Room load time, JSON against binary.")
+    rooms_parser.add_argument("--scale", type=int, default=2, help="Room scale, in room units on each side.")
+    rooms_parser.add_argument("--layers", type=int, default=3, help="Background and foreground layer count each.")
+    rooms_parser.add_argument("--runs", type=int, default=5)
+    rooms_parser.set_defaults(func=rooms)
+
+    paint_parser: ArgumentParser = subparsers.add_parser("paint", help="Room editor paint 1 tile cost, per room size.")
+    paint_parser.add_argument("--sizes", type=int, nargs="+", default=[20, 50, 100, 200], help="Square room sizes in tiles.")
+    paint_parser.add_argument("--runs", type=int, default=200, help="Dirty cells samples per size.")
+    paint_parser.add_argument("--full-runs", type=int, default=5, help="Full rebake samples per size.")
+    paint_parser.set_defaults(func=paint)
+
+    chunks_parser: ArgumentParser = subparsers.add_parser(
+        "chunks", help="Room editor pre render memory and draw time, per room size."
+    )
+    chunks_parser.add_argument("--sizes", type=int, nargs="+", default=[20, 100, 400], help="Square room sizes in tiles.")
+    chunks_parser.set_defaults(func=chunks)
+
+    collision_parser: ArgumentParser = subparsers.add_parser(
+        "collision", help="Kinematic swept AABB cost, per tile and per resolve."
+    )
+    collision_parser.add_argument("--runs", type=int, default=20000)
+    collision_parser.set_defaults(func=collision)
+
+    batch_parser: ArgumentParser = subparsers.add_parser(
+        "batch", help="Many bodies resolved against solid tiles, per body count."
+    )
+    batch_parser.add_argument("--counts", type=int, nargs="+", default=[100, 1000, 5000], help="Body counts.")
+    batch_parser.add_argument("--runs", type=int, default=20)
+    batch_parser.set_defaults(func=batch)
+
+    schemas_parser: ArgumentParser = subparsers.add_parser("schemas", help="Sprite sheet and animation JSON load time.")
+    schemas_parser.add_argument("--runs", type=int, default=200)
+    schemas_parser.set_defaults(func=schemas)
+
+    # Startup child, not meant to be run by hand
+    first_frame_parser: ArgumentParser = subparsers.add_parser("first-frame")
+    first_frame_parser.add_argument("--scene", default="CreatedBySplashScreen")
+    first_frame_parser.set_defaults(func=first_frame)
+
+    args: Namespace = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,479 @@
+"""
+Release build.
+
+Strips every "# REMOVE IN BUILD" group with an AST transform, drops the imports only those groups used,
+then byte-compiles the modules the game can reach into a release tree, next to a bundle of the assets.
+Asset JSONs the release loads without validation, see schemas is trusted json, are validated first.
+Run from the repo root, then run the release from its own root:
+
+python src/build.py
+python src/build.py --output build/release --keep-source
+python src/build.py --list
+cd build/release && python src/main.pyc
+
+A marker comment removes the group that follows it, leading comments right after the marker are part of it.
+The group is the run of sibling statements, dict entries, list items, call arguments or function parameters
+that starts on the first code line after the marker. It ends at a blank line, a comment line or its closing bracket.
+A marked if or elif removes only its own branch, the else or the next elif stays.
+A marker followed by a blank line removes nothing.
+"""
+
+from argparse import ArgumentParser
+from argparse import Namespace
+from ast import arguments
+from ast import AST
+from ast import Attribute
+from ast import Call
+from ast import ClassDef
+from ast import Constant
+from ast import Dict
+from ast import If
+from ast import Import
+from ast import ImportFrom
+from ast import List
+from ast import Module
+from ast import Name
+from ast import NodeTransformer
+from ast import parse
+from ast import Pass
+from ast import Set
+from ast import Tuple
+from ast import unparse
+from ast import walk
+from json import load
+from os import makedirs
+from os import walk as walk_dir
+from os.path import abspath
+from os.path import dirname
+from os.path import exists
+from os.path import getsize
+from os.path import isfile
+from os.path import join
+from os.path import relpath
+from py_compile import compile as compile_file
+from re import compile as compile_pattern
+from re import Pattern
+from shutil import rmtree
+from typing import Any
+
+from asset_bundle import BUNDLE_FILE_NAME
+from asset_bundle import write_bundle
+from schemas import TRUSTED_JSON_SCHEMAS_DICT
+from schemas import validate_json
+
+# Marker comment, alone on its line
+MARKER: str = "# REMOVE IN BUILD"
+
+# Repo layout, assets paths in the game are relative to the repo root
+SRC_DIR_PATH: str = dirname(abspath(__file__))
+REPO_DIR_PATH: str = dirname(SRC_DIR_PATH)
+ASSET_DIR_NAMES: tuple[str, ...] = ("jsons", "oggs", "pngs", "ttf")
+
+# Module the release starts from, everything it can reach is shipped
+ENTRY_MODULE_NAME: str = "main"
+
+# 2 drops docstrings and asserts, and turns __debug__ off, so typechecking is off too
+OPTIMIZATION_LEVEL: int = 2
+
+# Names in strings, annotations like "DebugDraw" and mem paths like "scenes.main_menu.MainMenu"
+NAME_PATTERN: Pattern = compile_pattern(r"[A-Za-z_][A-Za-z0-9_]*")
+MEM_PATH_PATTERN: Pattern = compile_pattern(r"^[a-z_][a-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)+$")
+
+
+def _find_group_starts(source_lines: list[str]) -> tuple[dict[tuple[int, int], int], list[int]]:
+    """
+    Returns group first code line and column : marker line, and the markers that remove nothing.
+    Lines are 1 based like the AST.
+    """
+
+    group_starts: dict[tuple[int, int], int] = {}
+    empty_marker_lines: list[int] = []
+
+    for index, line in enumerate(source_lines):
+        if line.strip() != MARKER:
+            continue
+        marker_line: int = index + 1
+        marker_column: int = len(line) - len(line.lstrip())
+
+        # Skip the comments right after the marker, blank line first? Nothing to remove
+        next_index: int = index + 1
+        while next_index < len(source_lines) and source_lines[next_index].strip().startswith("#"):
+            next_index += 1
+        if next_index >= len(source_lines) or source_lines[next_index].strip() == "":
+            empty_marker_lines.append(marker_line)
+            continue
+
+        group_starts[(next_index + 1, marker_column)] = marker_line
+
+    return group_starts, empty_marker_lines
+
+
+def _names(tree: AST) -> set[str]:
+    """
+    Every name the tree refers to, names in strings count, so string annotations keep their imports.
+    """
+
+    names: set[str] = set()
+    for node in walk(tree):
+        if isinstance(node, Name):
+            names.add(node.id)
+        elif isinstance(node, Attribute):
+            continue
+        elif isinstance(node, Constant) and isinstance(node.value, str):
+            names.update(NAME_PATTERN.findall(node.value))
+    return names
+
+
+def _bound_name(node: Import | ImportFrom, alias_name: str, alias_asname: None | str) -> str:
+    """
+    Name an import alias binds in the module.
+    """
+
+    if alias_asname is not None:
+        return alias_asname
+    if isinstance(node, Import):
+        return alias_name.split(".")[0]
+    return alias_name
+
+
+class _MarkerStripper(NodeTransformer):
+    """
+    Removes the marked groups from every sibling list of the tree.
+    """
+
+    def __init__(self, source_lines: list[str], group_starts: dict[tuple[int, int], int]):
+        self.source_lines: list[str] = source_lines
+        self.group_starts: dict[tuple[int, int], int] = group_starts
+
+        # Marker line : removed node count
+        self.removed_counts: dict[int, int] = {}
+
+        # Removed line ranges, markers inside them need no match
+        self.removed_line_ranges: list[tuple[int, int]] = []
+
+    def _is_contiguous(self, previous_end_line: int, next_line: int) -> bool:
+        """
+        True when only code lines sit between 2 siblings, a blank or a comment line ends a group.
+        """
+
+        # Lines are 1 based, so the previous end line index is the first line after it
+        last_line_index: int = next_line - 1
+        for line in self.source_lines[previous_end_line:last_line_index]:
+            stripped_line: str = line.strip()
+            if stripped_line == "" or stripped_line.startswith("#"):
+                return False
+        return True
+
+    def _get_removed_mask(self, nodes: list[Any]) -> list[bool]:
+        """
+        Pass the first node of each sibling, in source order.
+        Returns which siblings are in a marked group.
+        """
+
+        removed_mask: list[bool] = []
+        marker_line: None | int = None
+        previous_end_line: int = 0
+
+        for node in nodes:
+            position: tuple[int, int] = (node.lineno, node.col_offset)
+            # Group starts here?
+            if position in self.group_starts:
+                marker_line = self.group_starts[position]
+            # Group goes on only with no gap
+            elif marker_line is not None and not self._is_contiguous(previous_end_line, node.lineno):
+                marker_line = None
+
+            if marker_line is not None:
+                self.removed_counts[marker_line] = self.removed_counts.get(marker_line, 0) + 1
+                self.removed_line_ranges.append((node.lineno, node.end_lineno))
+
+            removed_mask.append(marker_line is not None)
+            previous_end_line = node.end_lineno
+
+        return removed_mask
+
+    def _strip_statements(self, node: AST) -> None:
+        """
+        Statement bodies, a marked if with an else keeps its else body.
+        """
+
+        for field_name in ("body", "orelse", "finalbody", "handlers"):
+            statements: Any = getattr(node, field_name, None)
+            if not isinstance(statements, list) or not statements or not hasattr(statements[0], "lineno"):
+                continue
+
+            kept_statements: list[Any] = []
+            for statement, is_removed in zip(statements, self._get_removed_mask(statements)):
+                if not is_removed:
+                    kept_statements.append(statement)
+                elif isinstance(statement, If) and statement.orelse:
+                    # Else body may have marked groups of its own
+                    self._strip_statements(statement)
+                    kept_statements.extend(statement.orelse)
+
+            # Bodies cannot be empty
+            if not kept_statements and field_name == "body" and not isinstance(node, Module):
+                kept_statements.append(Pass())
+            setattr(node, field_name, kept_statements)
+
+    def _strip_dict(self, node: Dict) -> None:
+        """
+        Dict entries, **spread entries have no key.
+        """
+
+        entry_nodes: list[AST] = [key if key is not None else value for key, value in zip(node.keys, node.values)]
+        removed_mask: list[bool] = self._get_removed_mask(entry_nodes)
+        node.keys = [key for key, is_removed in zip(node.keys, removed_mask) if not is_removed]
+        node.values = [value for value, is_removed in zip(node.values, removed_mask) if not is_removed]
+
+    def _strip_call(self, node: Call) -> None:
+        """
+        Positional and keyword arguments, in source order.
+        """
+
+        argument_nodes: list[Any] = sorted(node.args + node.keywords, key=lambda argument: (argument.lineno, argument.col_offset))
+        removed_ids: set[int] = {
+            id(argument) for argument, is_removed in zip(argument_nodes, self._get_removed_mask(argument_nodes)) if is_removed
+        }
+        node.args = [argument for argument in node.args if id(argument) not in removed_ids]
+        node.keywords = [keyword for keyword in node.keywords if id(keyword) not in removed_ids]
+
+    def _strip_arguments(self, node: arguments) -> None:
+        """
+        Function parameters, defaults are aligned to the last parameters.
+        """
+
+        # Positional parameters and their defaults
+        positional_parameters: list[Any] = node.posonlyargs + node.args
+        defaults: list[Any] = [None] * (len(positional_parameters) - len(node.defaults)) + node.defaults
+        removed_mask: list[bool] = self._get_removed_mask(positional_parameters)
+        posonly_count: int = len(node.posonlyargs) - sum(removed_mask[: len(node.posonlyargs)])
+        kept_parameters: list[Any] = [
+            parameter for parameter, is_removed in zip(positional_parameters, removed_mask) if not is_removed
+        ]
+        node.posonlyargs = kept_parameters[:posonly_count]
+        node.args = kept_parameters[posonly_count:]
+        node.defaults = [default for default, is_removed in zip(defaults, removed_mask) if not is_removed and default is not None]
+
+        # Keyword only parameters and their defaults
+        removed_mask = self._get_removed_mask(node.kwonlyargs)
+        node.kw_defaults = [default for default, is_removed in zip(node.kw_defaults, removed_mask) if not is_removed]
+        node.kwonlyargs = [parameter for parameter, is_removed in zip(node.kwonlyargs, removed_mask) if not is_removed]
+
+    def generic_visit(self, node: AST) -> AST:
+        # Strip this node siblings first, then walk into what is left
+        self._strip_statements(node)
+        if isinstance(node, Dict):
+            self._strip_dict(node)
+        elif isinstance(node, (List, Tuple, Set)):
+            node.elts = [element for element, is_removed in zip(node.elts, self._get_removed_mask(node.elts)) if not is_removed]
+        elif isinstance(node, Call):
+            self._strip_call(node)
+        elif isinstance(node, arguments):
+            self._strip_arguments(node)
+        return super().generic_visit(node)
+
+
+class _OrphanImportPruner(NodeTransformer):
+    """
+    Removes import names only the stripped code used.
+    """
+
+    def __init__(self, orphan_names: set[str]):
+        self.orphan_names: set[str] = orphan_names
+
+    def _prune(self, node: Import | ImportFrom) -> None:
+        node.names = [alias for alias in node.names if _bound_name(node, alias.name, alias.asname) not in self.orphan_names]
+
+    def visit_Import(self, node: Import) -> None | Import:
+        self._prune(node)
+        return node if node.names else None
+
+    def visit_ImportFrom(self, node: ImportFrom) -> None | ImportFrom:
+        self._prune(node)
+        return node if node.names else None
+
+    def generic_visit(self, node: AST) -> AST:
+        super().generic_visit(node)
+        # Import was the only statement of an if TYPE_CHECKING body?
+        if isinstance(node, (If, ClassDef)) and not node.body:
+            node.body = [Pass()]
+        return node
+
+
+def strip_source(source: str, file_path: str) -> tuple[str, dict[int, int], list[int]]:
+    """
+    Returns the stripped source, marker line : removed node count, and the markers that remove nothing.
+    Raises ValueError on a marker that starts no group.
+    """
+
+    source_lines: list[str] = source.splitlines()
+    tree: Module = parse(source, file_path)
+    names_before: set[str] = _names(tree)
+
+    # Remove the marked groups
+    group_starts, empty_marker_lines = _find_group_starts(source_lines)
+    marker_stripper: _MarkerStripper = _MarkerStripper(source_lines, group_starts)
+    tree = marker_stripper.visit(tree)
+
+    # Every marker must start a group, unless its group is inside one that was removed
+    for marker_line in group_starts.values():
+        if marker_line in marker_stripper.removed_counts:
+            continue
+        if any(start_line <= marker_line <= end_line for start_line, end_line in marker_stripper.removed_line_ranges):
+            continue
+        raise ValueError(f"{file_path}:{marker_line} marker does not start a group")
+
+    # Remove the imports that only the removed code used
+    orphan_names: set[str] = names_before - _names(tree)
+    tree = _OrphanImportPruner(orphan_names).visit(tree)
+
+    return unparse(tree) + "\n", marker_stripper.removed_counts, empty_marker_lines
+
+
+def _get_module_file_path(module_name: str) -> None | str:
+    """
+    Returns the src file of a module, None when it is not a game module.
+    """
+
+    module_path: str = join(SRC_DIR_PATH, *module_name.split("."))
+    if isfile(module_path + ".py"):
+        return module_path + ".py"
+    if isfile(join(module_path, "__init__.py")):
+        return join(module_path, "__init__.py")
+    return None
+
+
+def _get_imported_module_names(tree: AST) -> set[str]:
+    """
+    Modules the tree imports, and modules named by mem paths, those are imported lazily with import_mem.
+    """
+
+    module_names: set[str] = set()
+    for node in walk(tree):
+        if isinstance(node, Import):
+            module_names.update(alias.name for alias in node.names)
+        elif isinstance(node, ImportFrom) and node.module is not None and node.level == 0:
+            module_names.add(node.module)
+            # from package import module
+            module_names.update(f"{node.module}.{alias.name}" for alias in node.names)
+        elif isinstance(node, Constant) and isinstance(node.value, str) and MEM_PATH_PATTERN.match(node.value):
+            module_names.add(node.value)
+            module_names.add(node.value.rpartition(".")[0])
+
+    # Packages of each module too
+    for module_name in list(module_names):
+        parts: list[str] = module_name.split(".")
+        module_names.update(".".join(parts[:index]) for index in range(1, len(parts)))
+
+    return {module_name for module_name in module_names if _get_module_file_path(module_name) is not None}
+
+
+def validate_trusted_jsons() -> int:
+    """
+    Validate every asset JSON named like a trusted one against its schema.
+    The release loads them without validation, so an invalid one fails the build here.
+    Returns the JSON count.
+    """
+
+    json_count: int = 0
+    for dir_name in ASSET_DIR_NAMES:
+        for dir_path, _, file_names in walk_dir(join(REPO_DIR_PATH, dir_name)):
+            for file_name in sorted(file_names):
+                for suffix, schema in TRUSTED_JSON_SCHEMAS_DICT.items():
+                    if not file_name.endswith(suffix):
+                        continue
+                    with open(join(dir_path, file_name), "r", encoding="utf-8") as json_file:
+                        if not validate_json(load(json_file), schema):
+                            raise ValueError(f"{join(dir_path, file_name)} does not match its schema")
+                    json_count += 1
+    return json_count
+
+
+def build(args: Namespace) -> None:
+    """
+    Strip, compile and copy the release tree.
+    """
+
+    output_dir_path: str = abspath(args.output)
+    output_src_dir_path: str = join(output_dir_path, "src")
+    # A .py next to its .pyc would be imported instead, stripped sources live apart
+    output_stripped_src_dir_path: str = join(output_dir_path, "stripped_src")
+
+    if not args.list:
+        # Fresh tree every build, never the repo itself
+        if output_dir_path in (REPO_DIR_PATH, SRC_DIR_PATH):
+            raise ValueError(f"{output_dir_path} is not a build directory")
+        if exists(output_dir_path):
+            rmtree(output_dir_path)
+        makedirs(output_src_dir_path)
+
+    # Strip each module the entry can reach, stripped imports are not followed
+    pending_module_names: list[str] = [ENTRY_MODULE_NAME]
+    shipped_module_names: set[str] = set()
+    total_removed_count: int = 0
+    total_byte_count: int = 0
+    while pending_module_names:
+        module_name: str = pending_module_names.pop()
+        if module_name in shipped_module_names:
+            continue
+        shipped_module_names.add(module_name)
+
+        source_file_path: str = str(_get_module_file_path(module_name))
+        relative_file_path: str = relpath(source_file_path, SRC_DIR_PATH)
+        with open(source_file_path, "r", encoding="utf-8") as source_file:
+            source: str = source_file.read()
+
+        stripped_source, removed_counts, empty_marker_lines = strip_source(source, relative_file_path)
+        total_removed_count += sum(removed_counts.values())
+        pending_module_names.extend(_get_imported_module_names(parse(stripped_source)))
+
+        # List only? Print what goes
+        if args.list:
+            for marker_line, removed_count in sorted(removed_counts.items()):
+                print(f"{relative_file_path}:{marker_line} removes {removed_count}")
+            for marker_line in empty_marker_lines:
+                print(f"{relative_file_path}:{marker_line} removes nothing")
+            continue
+
+        # Stripped source, then its sourceless byte code in the release src
+        stripped_file_path: str = join(output_stripped_src_dir_path, relative_file_path)
+        release_file_path: str = join(output_src_dir_path, relative_file_path + "c")
+        makedirs(dirname(stripped_file_path), exist_ok=True)
+        makedirs(dirname(release_file_path), exist_ok=True)
+        with open(stripped_file_path, "w", encoding="utf-8") as stripped_file:
+            stripped_file.write(stripped_source)
+        compile_file(
+            stripped_file_path, cfile=release_file_path, dfile=relative_file_path, doraise=True, optimize=OPTIMIZATION_LEVEL
+        )
+        total_byte_count += getsize(release_file_path)
+
+    print(f"modules: {len(shipped_module_names)}, removed nodes: {total_removed_count}")
+    if args.list:
+        return
+
+    # Trusted JSONs skip validation in the release, validate them once here
+    print(f"validated JSONs: {validate_trusted_jsons()}")
+
+    # Assets, packed in 1 bundle at the release root, game paths resolve through its index
+    asset_count: int = write_bundle(join(output_dir_path, BUNDLE_FILE_NAME), REPO_DIR_PATH, ASSET_DIR_NAMES)
+    print(f"assets: {asset_count} in {BUNDLE_FILE_NAME}, {getsize(join(output_dir_path, BUNDLE_FILE_NAME)) / 1024:.1f} KB")
+
+    # Stripped sources are only for reading
+    if not args.keep_source:
+        rmtree(output_stripped_src_dir_path)
+
+    print(f"byte code: {total_byte_count / 1024:.1f} KB")
+    print(f"release: {output_dir_path}, run it from there with python src/main.pyc")
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser(description="Strip debug code and byte-compile a release tree.")
+    parser.add_argument("--output", default=join("build", "release"), help="Release tree dir, wiped every build.")
+    parser.add_argument("--keep-source", action="store_true", help="Keep the stripped sources, in stripped_src, for reading.")
+    parser.add_argument("--list", action="store_true", help="Print what each marker removes, write nothing.")
+    build(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ from typing import Any
 
 import pygame as pg
 import pygame.freetype as font
+from asset_bundle import open_asset
 from utils import create_paths_dict
 from utils import get_os_specific_directory
 
@@ -25,7 +26,7 @@ DEFAULT_SETTINGS_DICT: dict[str, Any] = {
     "pause": 27,
     "jump": 99,
     "attack": 120,
-    # REMOVE IN BUILD
+    # Mouse, for the editors, kept in the release so dev and release share settings.json
     "lmb": 1,
     "mmb": 2,
     "rmb": 3,
@@ -52,6 +53,45 @@ OGGS_PATHS_DICT: dict[str, str] = create_paths_dict(OGGS_DIR_PATH)
 # FPS
 FPS: int = 60
 
+# Fixed timestep, simulation runs in constant steps, draw interpolates between them
+IS_FIXED_TIMESTEP: bool = True
+TICK_RATE: int = 60
+# Ms per simulation step, exact, the loop banks frame time against this
+FIXED_STEP_MS: float = 1000 / TICK_RATE
+# Whole ms per step, int because update takes int dt, the loop carries the fraction so steps average fixed step ms
+FIXED_DT: int = int(FIXED_STEP_MS)
+# Max steps per frame, anything behind this is dropped to avoid the spiral of death
+MAX_CATCH_UP_STEPS: int = 5
+
+# Dirty rect presentation, only scale and push the native regions scenes report as changed
+IS_DIRTY_RECT_PRESENTATION: bool = True
+
+# Idle frames, scene draw reports no new pixels, skip scale and present
+# After this many idle frames in a row, tick at idle fps until something draws again
+IDLE_FRAMES_BEFORE_THROTTLE: int = 30
+IDLE_FPS: int = 20
+
+# Asset cache, converted surfs nobody uses are evicted least recently used first past this many bytes
+ASSET_CACHE_BYTE_BUDGET: int = 64 * 1024 * 1024
+
+# Worker threads that decode assets and import scenes off the main thread
+PRELOAD_WORKER_COUNT: int = 2
+
+# Texture atlas, stage sprite sheet regions and static actor frames packed into pages this wide and at most this tall
+TEXTURE_ATLAS_PAGE_SIZE: int = 1024
+# Packed pages are cached here by content hash, repacked only when a sprite sheet or its regions change
+TEXTURE_ATLAS_CACHE_DIR_PATH: str = join(JSONS_USER_DIR_PATH, "texture_atlas_cache")
+
+# Hot reload, editors poll the JSONs and PNGs they loaded and rebuild only what depends on a changed one
+IS_HOT_RELOAD: bool = True
+# Ms between polls, each poll stats every watched file once
+FILE_WATCHER_POLL_INTERVAL: int = 500
+
+# Chunked room rendering, room pre renders are baked in chunks this big when the camera first sees them
+CHUNK_SIZE: int = 256
+# Resident chunks per renderer, least recently drawn ones are evicted past this, 4 cover the camera
+CHUNK_RENDERER_MAX_CHUNKS: int = 32
+
 # Fixed dimensions
 TILE_SIZE: int = 16
 
@@ -91,6 +131,8 @@ EVENTS: list[int] = [
     pg.KEYDOWN,
     pg.KEYUP,
     pg.QUIT,
+    # Window content lost, present everything even if idle
+    pg.WINDOWEXPOSED,
     # REMOVE IN BUILD
     # Because production don't use the mouse
     pg.MOUSEBUTTONUP,
@@ -101,14 +143,13 @@ EVENTS: list[int] = [
 FONT_HEIGHT: int = 5
 FONT_WIDTH: int = 3
 FONT: font.Font = font.Font(
-    join("ttf", "cg_pixel_3x5_mono.ttf"),
+    open_asset(join("ttf", "cg_pixel_3x5_mono.ttf")),
     FONT_HEIGHT,
 )
 
 # Quadtree recursion limit
 MAX_QUADTREE_DEPTH: int = 8
 
-# REMOVE IN BUILD
 # This is binary mapped to offset, for normal blob autotiles
 SPRITE_TILE_TYPE_NORMAL_BINARY_VALUE_TO_OFFSET_DICT: dict[int, dict[str, int]] = {
     208: {
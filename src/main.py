@@ -1,34 +1,89 @@
-import psutil
+from argparse import ArgumentParser
+from argparse import Namespace
+
 from constants import CLOCK
 from constants import EVENTS
+from constants import FIXED_STEP_MS
 from constants import FPS
+from constants import IDLE_FPS
+from constants import IDLE_FRAMES_BEFORE_THROTTLE
+from constants import IS_DIRTY_RECT_PRESENTATION
+from constants import IS_FIXED_TIMESTEP
+from constants import IS_HOT_RELOAD
+from constants import MAX_CATCH_UP_STEPS
 from constants import NATIVE_SURF
 from constants import NEXT_FRAME
 from constants import pg
 from nodes.game import Game
+from nodes.input_recorder import InputRecorder
+from nodes.input_replayer import InputReplayer
 from nodes.options_menu import OptionsMenu
+from nodes.profiler import Profiler
+
+# REMOVE IN BUILD
+# Record a session or replay one, python src/main.py --record session.bin, python src/main.py --replay session.bin
+argument_parser: ArgumentParser = ArgumentParser(description="Run the game, from the repo root.")
+argument_parser.add_argument("--record", default=None, help="Write each frame dt, mouse position and input events to this log.")
+argument_parser.add_argument("--replay", default=None, help="Feed this log to the game instead of the clock and input.")
+arguments: Namespace = argument_parser.parse_args()
 
 game: Game = Game("CreatedBySplashScreen")
 options_menu: OptionsMenu = OptionsMenu(game)
+# REMOVE IN BUILD
 game.debug_draw.is_active = not game.debug_draw.is_active
 
 # REMOVE IN BUILD
-process = psutil.Process()
-counter = 0
-cpu_percent: float = 0.0
+# Replaying? Same window scale and first scene as the recorded session
+input_replayer: None | InputReplayer = None
+if arguments.replay is not None:
+    input_replayer = InputReplayer(arguments.replay)
+    game.set_resolution_index(input_replayer.resolution_index)
+    game.set_scene(input_replayer.initial_scene)
+
+# REMOVE IN BUILD
+# Recording? Log starts from the current scene
+input_recorder: None | InputRecorder = None
+if arguments.record is not None:
+    input_recorder = InputRecorder(
+        arguments.record,
+        type(game.current_scene).__name__,
+        game.local_settings_metadata_instance.resolution_index,
+    )
+
+# REMOVE IN BUILD
+# Per phase frame time graph, follows debug draw toggle
+profiler: Profiler = Profiler(game.debug_draw)
+profiler.set_is_active(game.debug_draw.is_active)
+
+# Fixed timestep leftover time and how far draw is between the last 2 steps
+accumulator: float = 0.0
+interpolation_alpha: float = 1.0
+# Fraction of a ms each int step dt leaves, carried so steps run at exactly the tick rate
+step_dt_remainder: float = 0.0
+
+# Frames in a row where draw reported no new pixels
+idle_frame_count: int = 0
 
 while 1:
     # REMOVE IN BUILD
     if game.is_per_frame_debug:
+        # REMOVE IN BUILD
+        game.event_handler.set_mouse_position_tuple(pg.mouse.get_pos())
+
         for event in pg.event.get(EVENTS):
             game.event_handler.event(event)
 
             if game.event_handler.is_0_just_pressed:
                 game.debug_draw.is_active = not game.debug_draw.is_active
+                profiler.set_is_active(game.debug_draw.is_active)
+                # Overlay shows or hides everywhere
+                game.set_is_full_redraw(True)
             if game.event_handler.is_9_just_pressed:
                 game.is_per_frame_debug = not game.is_per_frame_debug
 
         if pg.key.get_just_pressed()[NEXT_FRAME]:
+            # Stepping frames, always draw everything
+            game.set_is_full_redraw(True)
             game.current_scene.draw()
 
             if game.is_options_menu_active:
@@ -40,64 +95,196 @@ while 1:
             if game.debug_draw.is_active:
                 game.debug_draw.draw()
 
-            # REMOVE IN BUILD
-            pg.display.set_caption("FPS: NAN | CPU: NAN | RAM: NAN")
-
             pg.transform.scale(NATIVE_SURF, (game.window_width, game.window_height), game.window_surf)
 
             pg.display.update()
 
             game.event_handler.reset_just_events()
+            game.reset_dirty_rects()
 
     else:
-        # Limit fps, gets dt
-        dt: int = CLOCK.tick(FPS)
+        # Limit fps, gets dt, idle for a while? Tick slower
+        dt: int = CLOCK.tick(IDLE_FPS if idle_frame_count >= IDLE_FRAMES_BEFORE_THROTTLE else FPS)
 
         # REMOVE IN BUILD
         if dt > 1000:
             dt = 16
 
+        # REMOVE IN BUILD
+        profiler.begin_frame()
+
+        # This frame events
+        events: list[pg.Event] = pg.event.get(EVENTS)
+        # REMOVE IN BUILD
+        mouse_position_tuple: tuple[int, int] = pg.mouse.get_pos()
+
+        # REMOVE IN BUILD
+        # Replaying? Dt, mouse and events come from the log, real input is dropped except closing the window
+        if input_replayer is not None:
+            replay_frame: None | tuple[int, tuple[int, int], list[pg.Event]] = input_replayer.next_frame()
+            # Log done? Exit
+            if replay_frame is None:
+                game.event_handler.quit()
+            else:
+                dt, mouse_position_tuple, replay_events = replay_frame
+                events = replay_events + [event for event in events if event.type == pg.QUIT]
+
+        # REMOVE IN BUILD
+        # Recording? Log what the game is about to see
+        if input_recorder is not None:
+            input_recorder.record_frame(dt, mouse_position_tuple, events)
+
+        # REMOVE IN BUILD
+        game.event_handler.set_mouse_position_tuple(mouse_position_tuple)
+
         # Update event handler flags
-        for event in pg.event.get(EVENTS):
+        for event in events:
             game.event_handler.event(event)
 
             # REMOVE IN BUILD
             if game.event_handler.is_0_just_pressed:
                 game.debug_draw.is_active = not game.debug_draw.is_active
+                profiler.set_is_active(game.debug_draw.is_active)
+                # Overlay shows or hides everywhere
+                game.set_is_full_redraw(True)
             if game.event_handler.is_9_just_pressed:
                 game.is_per_frame_debug = not game.is_per_frame_debug
 
-        # Current scene draw
-        game.current_scene.draw()
+        # REMOVE IN BUILD
+        profiler.mark(Profiler.EVENTS)
+
+        # Saves done on the writer thread, their callbacks run here on the main thread
+        game.file_writer.update()
+
+        # Preloads done on the workers count toward the asset budget here
+        game.asset_cache.update()
+
+        # REMOVE IN BUILD
+        # Hot reload, poll the files editors watch, they rebuild what depends on the changed ones
+        if IS_HOT_RELOAD:
+            game.file_watcher.update(dt)
+
+        # Fixed timestep?
+        if IS_FIXED_TIMESTEP:
+            # Bank the frame time
+            accumulator += dt
+
+            # Spend the bank in fixed steps, up to the catch up cap
+            steps: int = 0
+            while accumulator >= FIXED_STEP_MS and steps < MAX_CATCH_UP_STEPS:
+                # Whole ms for this step, the fraction carries to the next one, 16 17 17 at 60 Hz
+                step_dt_remainder += FIXED_STEP_MS
+                step_dt: int = int(step_dt_remainder)
+                step_dt_remainder -= step_dt
+
+                # Current scene or option menu update?
+                if game.is_options_menu_active:
+                    options_menu.update(step_dt)
+                    # REMOVE IN BUILD
+                    profiler.mark(Profiler.OPTIONS_MENU)
+                else:
+                    game.current_scene.update(step_dt)
+                    # REMOVE IN BUILD
+                    profiler.mark(Profiler.UPDATE)
+                accumulator -= FIXED_STEP_MS
+                steps += 1
+
+                # Only the first step sees the just events, a frame with no step keeps them
+                game.event_handler.reset_just_events()
+
+            # Still behind after the cap? Drop the backlog, keep the phase
+            if accumulator >= FIXED_STEP_MS:
+                accumulator %= FIXED_STEP_MS
+
+            # How far between the last step and the next one
+            interpolation_alpha = accumulator / FIXED_STEP_MS
+
+            # REMOVE IN BUILD
+            # Debug draw draws over native every frame, scenes cannot skip their draw
+            if game.debug_draw.is_active:
+                game.set_is_full_redraw(True)
+
+            # Options menu fading? Scene under it repaints every frame
+            if game.is_options_menu_active and options_menu.get_is_fading():
+                game.set_is_full_redraw(True)
+
+            # Current scene draw, interpolated
+            is_drawn: bool = game.current_scene.draw(interpolation_alpha)
+            # REMOVE IN BUILD
+            profiler.mark(Profiler.DRAW)
+
+            # Option menu draw on top
+            if game.is_options_menu_active:
+                is_drawn = options_menu.draw() or is_drawn
+                # REMOVE IN BUILD
+                profiler.mark(Profiler.OPTIONS_MENU)
 
-        # Current scene or option menu update?
-        if game.is_options_menu_active:
-            options_menu.draw()
-            options_menu.update(dt)
         else:
-            game.current_scene.update(dt)
+            # REMOVE IN BUILD
+            # Debug draw draws over native every frame, scenes cannot skip their draw
+            if game.debug_draw.is_active:
+                game.set_is_full_redraw(True)
+
+            # Options menu fading? Scene under it repaints every frame
+            if game.is_options_menu_active and options_menu.get_is_fading():
+                game.set_is_full_redraw(True)
+
+            # Current scene draw
+            is_drawn = game.current_scene.draw()
+            # REMOVE IN BUILD
+            profiler.mark(Profiler.DRAW)
+
+            # Current scene or option menu update?
+            if game.is_options_menu_active:
+                is_drawn = options_menu.draw() or is_drawn
+                options_menu.update(dt)
+                # REMOVE IN BUILD
+                profiler.mark(Profiler.OPTIONS_MENU)
+            else:
+                game.current_scene.update(dt)
+                # REMOVE IN BUILD
+                profiler.mark(Profiler.UPDATE)
+
+            # Reset the just pressed event handler flags
+            game.event_handler.reset_just_events()
+
+        # Nothing new drawn? Idle frame, native and window still have the last frame, skip scale and present
+        if not is_drawn:
+            idle_frame_count += 1
+            game.reset_dirty_rects()
+            continue
+        idle_frame_count = 0
 
         # REMOVE IN BUILD
         if game.debug_draw.is_active:
+            profiler.draw()
+            game.asset_cache.draw(game.debug_draw)
             game.debug_draw.draw()
+            profiler.mark(Profiler.DEBUG_DRAW)
 
-        # REMOVE IN BUILD
-        # Get CPU usage
-        counter += dt
-        if counter > 1020:
-            counter = 0
-            cpu_percent = process.cpu_percent()
-        # REMOVE IN BUILD
-        # Get memory info (RAM)
-        memory_info = process.memory_info()
-        memory_percent = process.memory_percent()
-        pg.display.set_caption(f"FPS: {CLOCK.get_fps():.0f} | CPU: {cpu_percent}% | RAM: {memory_percent:.2f}%")
+        # Dirty rect presentation? Needs an integer window scale, active debug draw already asked for a full redraw
+        if IS_DIRTY_RECT_PRESENTATION and not game.is_full_redraw and game.window_integer_scale != 0:
+            # Scale only the changed native regions to their window regions
+            window_dirty_rects: list[pg.Rect] = game.scale_dirty_rects_to_window()
+            # REMOVE IN BUILD
+            profiler.mark(Profiler.SCALE)
+
+            # Update changed window regions only, nothing changed? Skip the push
+            if window_dirty_rects:
+                pg.display.update(window_dirty_rects)
+            # REMOVE IN BUILD
+            profiler.mark(Profiler.DISPLAY_UPDATE)
 
-        # Scale native surf to window surf
-        pg.transform.scale(NATIVE_SURF, (game.window_width, game.window_height), game.window_surf)
+        else:
+            # Scale native surf to window surf
+            pg.transform.scale(NATIVE_SURF, (game.window_width, game.window_height), game.window_surf)
+            # REMOVE IN BUILD
+            profiler.mark(Profiler.SCALE)
 
-        # Update whole window
-        pg.display.update()
+            # Update whole window
+            pg.display.update()
+            # REMOVE IN BUILD
+            profiler.mark(Profiler.DISPLAY_UPDATE)
 
-        # Reset the just pressed event handler flags
-        game.event_handler.reset_just_events()
+        # Dirty rects are per frame
+        game.reset_dirty_rects()
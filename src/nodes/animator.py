@@ -2,7 +2,7 @@ from typing import Callable
 
 from schemas import AnimationMetadata
 from schemas import AnimationSpriteMetadata
-from typeguard import typechecked
+from typechecking import typechecked
 
 
 @typechecked
@@ -58,6 +58,30 @@ class Animator:
             # Throw error
             raise ValueError(f"Unsupported event type: {event}")
 
+    def set_animation_data(self, value: dict[str, AnimationMetadata]) -> None:
+        """
+        Swap animation data, for hot reload.
+        Current animation carries on from its frame if it still has it, else the first animation starts.
+        """
+
+        # Remember where it was
+        frame_index: int = self.frame_index
+        timer: int = self.timer
+        is_current_animation_kept: bool = self.current_animation in value
+
+        self.animation_data = value
+
+        # Current animation gone? Start the first one
+        if not is_current_animation_kept:
+            self.set_current_animation(list(value.keys())[0])
+            return
+
+        # Reload current animation metadata, then carry on from the same frame if it still has it
+        self.set_current_animation(self.current_animation)
+        if frame_index < self.frames_list_len:
+            self._set_frame_index(frame_index)
+            self.timer = timer
+
     def set_current_animation(self, value: str) -> None:
         """
         Set animation name.
@@ -0,0 +1,257 @@
+from collections import OrderedDict
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from typing import TYPE_CHECKING
+
+from asset_bundle import open_asset
+from constants import FONT
+from constants import NATIVE_WIDTH
+from constants import pg
+from typechecking import typechecked
+
+if TYPE_CHECKING:
+    from nodes.debug_draw import DebugDraw
+
+
+@typechecked
+class AssetCache:
+    """
+    | Loads and converts each PNG once, keyed by path.
+    |
+    | Users are reference counted by owner, usually a scene.
+    | Owners release their surfs, game releases the old scene ones on scene change.
+    | Surfs nobody uses stay resident for a later hit, until resident bytes go over budget.
+    | Then the least recently used ones that nobody uses are evicted.
+    |
+    | Cached surfs are shared, do not draw on them, draw on a copy.
+    |
+    | Preloaded PNGs are decoded on a worker thread, then converted on the main thread when asked for.
+    | Decoded preloads count toward the budget once done, the newest are dropped if evicting unused surfs is not enough.
+    """
+
+    def __init__(self, byte_budget: int, preload_executor: ThreadPoolExecutor):
+        # Max resident bytes before unused surfs are evicted
+        self.byte_budget: int = byte_budget
+
+        # Path : decoded not converted surf, convert needs the display so it stays on the main thread
+        self.preload_executor: ThreadPoolExecutor = preload_executor
+        self.pending_surfs: dict[str, Future[pg.Surface]] = {}
+
+        # Path : bytes of a pending surf whose decode is done, counted on the main thread
+        self.pending_surf_bytes: dict[str, int] = {}
+
+        # (path, is alpha) : surf, least recently used first
+        self.surfs: OrderedDict[tuple[str, bool], pg.Surface] = OrderedDict()
+
+        # (path, is alpha) : ids of owners using it, its reference count is the set size
+        self.owner_ids: dict[tuple[str, bool], set[int]] = {}
+
+        # Owner id : (path, is alpha) it uses, for release all
+        self.owner_keys: dict[int, set[tuple[str, bool]]] = {}
+
+        # Stats
+        self.resident_bytes: int = 0
+        self.pending_bytes: int = 0
+        self.hit_count: int = 0
+        self.miss_count: int = 0
+        self.preload_count: int = 0
+        self.eviction_count: int = 0
+
+    def preload_surf(self, path: str) -> None:
+        """
+        | Start decoding this png path on a worker thread.
+        | Get surf later converts it, it waits if the decode is not done yet.
+        """
+
+        # Cached or decoding already?
+        if path in self.pending_surfs or (path, True) in self.surfs or (path, False) in self.surfs:
+            return
+
+        # Decodes done so far count toward the budget before this one starts
+        self._evict()
+
+        self.pending_surfs[path] = self.preload_executor.submit(self._load_surf, path)
+
+    def update(self) -> None:
+        """
+        | Count preloads the workers finished toward the budget, evict if over.
+        | Call once per frame on the main thread, so a preload burst cannot sit over budget until the next get surf.
+        """
+
+        # Every pending surf counted already? Nothing to do
+        if len(self.pending_surf_bytes) == len(self.pending_surfs):
+            return
+
+        self._evict()
+
+    def get_surf(self, path: str, owner: Any, is_alpha: bool = True) -> pg.Surface:
+        """
+        | Returns the converted surf of this png path, loads it on miss.
+        | Owner holds a reference until it releases it.
+        | Is alpha False converts without per pixel alpha, for opaque backgrounds.
+        """
+
+        key: tuple[str, bool] = (path, is_alpha)
+
+        # Hit? Now the most recently used
+        if key in self.surfs:
+            self.hit_count += 1
+            self.surfs.move_to_end(key)
+        # Miss? Load and convert once, preloaded? Only convert
+        else:
+            self.miss_count += 1
+            pending_surf: None | Future[pg.Surface] = self._pop_pending_surf(path)
+            if pending_surf is not None:
+                self.preload_count += 1
+                surf: pg.Surface = pending_surf.result()
+            else:
+                surf = self._load_surf(path)
+            self.surfs[key] = surf.convert_alpha() if is_alpha else surf.convert()
+            self.owner_ids[key] = set()
+            self.resident_bytes += self._get_surf_bytes(self.surfs[key])
+
+        # Reference it, an owner holds a key once
+        self.owner_ids[key].add(id(owner))
+        self.owner_keys.setdefault(id(owner), set()).add(key)
+
+        # Over budget? Make room
+        self._evict()
+
+        return self.surfs[key]
+
+    # REMOVE IN BUILD
+    def reload_surf(self, path: str) -> None:
+        """
+        | Load this png path again, for hot reload.
+        |
+        | Same size? New pixels are copied into the cached surf, everyone holding it sees them.
+        | Else the cached surf is replaced, holders get the new one on their next get surf.
+        | Not cached? Nothing to do, the next get surf loads it.
+        """
+
+        # Decoding the old file? Drop it
+        self._pop_pending_surf(path)
+
+        for is_alpha in (True, False):
+            key: tuple[str, bool] = (path, is_alpha)
+            if key not in self.surfs:
+                continue
+            loaded_surf: pg.Surface = self._load_surf(path)
+            new_surf: pg.Surface = loaded_surf.convert_alpha() if is_alpha else loaded_surf.convert()
+            old_surf: pg.Surface = self.surfs[key]
+            # Same size? Copy in place, max over cleared pixels copies alpha as is instead of blending
+            if new_surf.get_size() == old_surf.get_size():
+                if is_alpha:
+                    old_surf.fill((0, 0, 0, 0))
+                    old_surf.blit(new_surf, (0, 0), special_flags=pg.BLEND_RGBA_MAX)
+                else:
+                    old_surf.blit(new_surf, (0, 0))
+                continue
+            # Resized? Replace
+            self.resident_bytes += self._get_surf_bytes(new_surf) - self._get_surf_bytes(old_surf)
+            self.surfs[key] = new_surf
+
+    def release_surf(self, path: str, owner: Any, is_alpha: bool = True) -> None:
+        """
+        | Owner stops using this png path.
+        """
+
+        key: tuple[str, bool] = (path, is_alpha)
+        self.owner_ids.get(key, set()).discard(id(owner))
+        self.owner_keys.get(id(owner), set()).discard(key)
+        self._evict()
+
+    def release_owner(self, owner: Any) -> None:
+        """
+        | Owner stops using every surf it got.
+        | Called by game on scene change with the old scene.
+        """
+
+        for key in self.owner_keys.pop(id(owner), set()):
+            self.owner_ids[key].discard(id(owner))
+        self._evict()
+
+    def _load_surf(self, path: str) -> pg.Surface:
+        """
+        | Decode this png path, its file is closed once decoded.
+        """
+
+        with open_asset(path) as png_file:
+            return pg.image.load(png_file, path)
+
+    def _get_surf_bytes(self, surf: pg.Surface) -> int:
+        """
+        | Pixel memory of a surf.
+        """
+
+        return surf.get_pitch() * surf.get_height()
+
+    def _pop_pending_surf(self, path: str) -> None | Future[pg.Surface]:
+        """
+        | Stop tracking this pending surf, its bytes leave the budget with it.
+        """
+
+        self.pending_bytes -= self.pending_surf_bytes.pop(path, 0)
+        return self.pending_surfs.pop(path, None)
+
+    def _count_pending_surfs(self) -> None:
+        """
+        | Add the bytes of pending surfs whose decode is done and not counted yet.
+        | Failed decodes hold no surf, get surf raises their error when asked for them.
+        """
+
+        for path, pending_surf in self.pending_surfs.items():
+            if path in self.pending_surf_bytes or not pending_surf.done() or pending_surf.exception() is not None:
+                continue
+            self.pending_surf_bytes[path] = self._get_surf_bytes(pending_surf.result())
+            self.pending_bytes += self.pending_surf_bytes[path]
+
+    def _evict(self) -> None:
+        """
+        | Evict unused surfs, least recently used first, until resident and decoded pending bytes fit the budget.
+        | Still over? Drop decoded preloads, newest first, a later get surf loads them again.
+        | Used surfs are never evicted, so resident bytes can stay over budget.
+        """
+
+        self._count_pending_surfs()
+
+        if self.resident_bytes + self.pending_bytes <= self.byte_budget:
+            return
+
+        for key in list(self.surfs):
+            if self.resident_bytes + self.pending_bytes <= self.byte_budget:
+                return
+            # Still used? Keep it
+            if self.owner_ids[key]:
+                continue
+            self.resident_bytes -= self._get_surf_bytes(self.surfs.pop(key))
+            del self.owner_ids[key]
+            self.eviction_count += 1
+
+        for path in reversed(list(self.pending_surf_bytes)):
+            if self.resident_bytes + self.pending_bytes <= self.byte_budget:
+                return
+            self._pop_pending_surf(path)
+            self.eviction_count += 1
+
+    # REMOVE IN BUILD
+    def draw(self, game_debug_draw: "DebugDraw") -> None:
+        """
+        | Add hit, miss, preloaded and resident bytes to the debug draw, top right.
+        | Call before the debug draw draws.
+        """
+
+        text: str = (
+            f"assets {len(self.surfs)} hit {self.hit_count} miss {self.miss_count} pre {self.preload_count} evict {self.eviction_count} "
+            f"{(self.resident_bytes + self.pending_bytes) / 1048576:.1f}/{self.byte_budget / 1048576:.0f}mb"
+        )
+        game_debug_draw.add(
+            {
+                "type": "text",
+                "layer": 6,
+                "x": NATIVE_WIDTH - FONT.get_rect(text).width,
+                "y": 0,
+                "text": text,
+            }
+        )
@@ -0,0 +1,296 @@
+from math import inf
+from typing import Any
+
+from constants import TILE_SIZE
+from nodes.kinematic import CandidateHits
+from nodes.kinematic import resolve_vel_against_solid_bitmap
+from tile_layer import TileLayer
+from typechecking import typechecked
+
+# NumPy is optional, not in requirements, pip install numpy to resolve a batch in 1 go
+# Without it every body goes through the same resolve as kinematic, 1 by 1
+# Resolve backend, for the benchmark and the owner, every NumPy use checks it first
+try:
+    import numpy as np
+
+    IS_NUMPY_AVAILABLE: bool = True
+except ImportError:
+    IS_NUMPY_AVAILABLE = False
+
+
+@typechecked
+class BatchKinematic:
+    """
+    Resolves velocities of many bodies against the solid tiles of 1 room in 1 call.
+    Same swept AABB and same order as kinematic, so a body here moves exactly like it would with its own kinematic.
+
+    Bodies are flat float64 buffers, array("d") or a C contiguous numpy array:
+    rects is x, y, width, height per body, velocities is x, y per body.
+    Velocities are resolved in place and returned, the owner then moves its rects with them.
+
+    With NumPy every body is queried against its candidate tiles at once, 1 column of candidates at a time.
+    Without NumPy it falls back to resolve vel against solid bitmap per body.
+    """
+
+    def __init__(self, solid_collision_map_list: TileLayer):
+        # Owner sets the solid layer of the room
+        self.solid_collision_map_list: TileLayer = solid_collision_map_list
+
+        # Scratch state for the per body fallback, reused every call
+        self.sweep_hit: list[float] = [0.0, 0.0, 0.0, 0.0, 0.0]
+        self.candidate_hits: CandidateHits = CandidateHits()
+
+    #################
+    # SETTER GETTER #
+    #################
+    def set_solid_collision_map_list(self, value: TileLayer) -> None:
+        """
+        Call when room collision map list updates.
+        """
+
+        self.solid_collision_map_list = value
+
+    #############
+    # ABILITIES #
+    #############
+    def resolve_vels_against_solid_tiles(self, dt: int, rects: Any, velocities: Any) -> Any:
+        """
+        Return velocities resolved against solid tiles, in place.
+        NumPy installed? Resolved as arrays, else body by body.
+        """
+
+        if IS_NUMPY_AVAILABLE:
+            return self._resolve_vels_with_numpy(dt, rects, velocities)
+
+        return self._resolve_vels_per_body(dt, rects, velocities)
+
+    def _resolve_vels_per_body(self, dt: int, rects: Any, velocities: Any) -> Any:
+        """
+        Fallback, the kinematic resolve for each body.
+        """
+
+        # Read once, not per body
+        solid_collision_map_list: TileLayer = self.solid_collision_map_list
+        sweep_hit: list[float] = self.sweep_hit
+        candidate_hits: CandidateHits = self.candidate_hits
+
+        # Resolve each body, write its velocity back
+        for body_index in range(len(velocities) // 2):
+            rect_index: int = body_index * 4
+            velocity_index: int = body_index * 2
+            velocities[velocity_index], velocities[velocity_index + 1] = resolve_vel_against_solid_bitmap(
+                velocities[velocity_index],
+                velocities[velocity_index + 1],
+                dt,
+                rects[rect_index],
+                rects[rect_index + 1],
+                rects[rect_index + 2],
+                rects[rect_index + 3],
+                solid_collision_map_list,
+                sweep_hit,
+                candidate_hits,
+            )
+
+        return velocities
+
+    def _resolve_vels_with_numpy(self, dt: int, rects: Any, velocities: Any) -> Any:
+        """
+        Every body at once.
+        Candidates are the solid tiles in each body present future combined rect, in the kinematic scan order.
+        Stable sort by input hit time, then resolve 1 candidate column for every body that still has one.
+        """
+
+        # No NumPy? Callers use the per body fallback
+        if not IS_NUMPY_AVAILABLE:
+            raise ImportError("Resolving with NumPy needs numpy installed")
+
+        # Views on the caller buffers, velocity view writes through
+        rect_array: Any = np.frombuffer(rects, dtype=np.float64).reshape(-1, 4)
+        velocity_array: Any = np.frombuffer(velocities, dtype=np.float64).reshape(-1, 2)
+        if len(velocity_array) == 0:
+            return velocities
+
+        # Bodies as columns
+        collider_x: Any = rect_array[:, 0:1]
+        collider_y: Any = rect_array[:, 1:2]
+        collider_width: Any = rect_array[:, 2:3]
+        collider_height: Any = rect_array[:, 3:4]
+        velocity_x: Any = velocity_array[:, 0:1].copy()
+        velocity_y: Any = velocity_array[:, 1:2].copy()
+
+        # Compute future rect positions with vel
+        future_rect_x: Any = collider_x + velocity_x * dt
+        future_rect_y: Any = collider_y + velocity_y * dt
+
+        # Truncate the 4 points of each present future combined rect, floor divide like int(point // TILE_SIZE)
+        l_tu: Any = np.floor_divide(np.minimum(collider_x, future_rect_x), TILE_SIZE).astype(np.int64)
+        t_tu: Any = np.floor_divide(np.minimum(collider_y, future_rect_y), TILE_SIZE).astype(np.int64)
+        r_tu: Any = np.floor_divide(np.maximum(collider_x, future_rect_x) + collider_width, TILE_SIZE).astype(np.int64)
+        b_tu: Any = np.floor_divide(np.maximum(collider_y, future_rect_y) + collider_height, TILE_SIZE).astype(np.int64)
+
+        # Solid layer, bitmap read as bytes without a copy
+        solid_collision_map_list: TileLayer = self.solid_collision_map_list
+        solid_bitmap: Any = np.frombuffer(solid_collision_map_list.solid_bitmap, dtype=np.uint8)
+        padded_width_tu: int = solid_collision_map_list.padded_width_tu
+        width_tu: int = solid_collision_map_list.width_tu
+        height_tu: int = solid_collision_map_list.height_tu
+
+        # Reads 1 tile around the room land on the border, further out is air too, so clamp like kinematic
+        first_tu_x: Any = np.maximum(l_tu, -1)
+        last_tu_x: Any = np.minimum(r_tu, width_tu)
+        first_tu_y: Any = np.maximum(t_tu, -1)
+        last_tu_y: Any = np.minimum(b_tu, height_tu)
+
+        # Candidate grid, x outer y inner like the kinematic loops, widest body sets the size
+        count_x: Any = last_tu_x - first_tu_x + 1
+        count_y: Any = last_tu_y - first_tu_y + 1
+        grid_width: int = max(int(count_x.max()), 0)
+        grid_height: int = max(int(count_y.max()), 0)
+        if grid_width == 0 or grid_height == 0:
+            return velocities
+        step_x: Any = np.repeat(np.arange(grid_width), grid_height)[np.newaxis, :]
+        step_y: Any = np.tile(np.arange(grid_height), grid_width)[np.newaxis, :]
+
+        # Iterate toward the movement, moving left or up counts down from the last tile
+        world_tu_x: Any = np.where(velocity_x < -0.01, last_tu_x - step_x, first_tu_x + step_x)
+        world_tu_y: Any = np.where(velocity_y < -0.01, last_tu_y - step_y, first_tu_y + step_y)
+
+        # Candidate is a cell of its body region that is solid, bodies with smaller regions pad with non candidates
+        is_candidate: Any = (step_x < count_x) & (step_y < count_y)
+        bitmap_index: Any = np.where(is_candidate, (world_tu_y + 1) * padded_width_tu + world_tu_x + 1, 0)
+        is_candidate &= solid_bitmap[bitmap_index] != 0
+
+        # Time the input velocity hits each candidate this step, misses and non candidates go last
+        is_hit, t_hit_near, normal_x, normal_y = _swept_rects_vs_tiles(
+            velocity_x,
+            velocity_y,
+            dt,
+            collider_x,
+            collider_y,
+            collider_width,
+            collider_height,
+            world_tu_x * TILE_SIZE,
+            world_tu_y * TILE_SIZE,
+        )
+        is_hit &= is_candidate
+        t_hit_near = np.where(is_hit, t_hit_near, inf)
+
+        # Nearest hit first, stable so equal times and misses keep the scan order
+        order: Any = np.argsort(t_hit_near, axis=1, kind="stable")
+        world_tu_x = np.take_along_axis(world_tu_x, order, axis=1)
+        world_tu_y = np.take_along_axis(world_tu_y, order, axis=1)
+        is_candidate = np.take_along_axis(is_candidate, order, axis=1)
+        t_hit_near = np.take_along_axis(t_hit_near, order, axis=1)
+        normal_x = np.take_along_axis(normal_x, order, axis=1)
+        normal_y = np.take_along_axis(normal_y, order, axis=1)
+
+        # Resolved velocities, 1 column per body
+        velocity_x = velocity_x[:, 0]
+        velocity_y = velocity_y[:, 0]
+        is_velocity_resolved: Any = np.zeros(len(velocity_array), dtype=bool)
+
+        # Resolve 1 candidate column at a time, only the bodies that have a candidate there
+        for column_index in range(grid_width * grid_height):
+            body_indices: Any = np.flatnonzero(is_candidate[:, column_index])
+            if len(body_indices) == 0:
+                continue
+
+            # Until the first resolve the velocity is the input one, so the collected hits are still right
+            column_t_hit_near: Any = t_hit_near[body_indices, column_index]
+            column_normal_x: Any = normal_x[body_indices, column_index]
+            column_normal_y: Any = normal_y[body_indices, column_index]
+            column_is_hit: Any = column_t_hit_near != inf
+
+            # Resolved bodies query again with the resolved velocity
+            is_column_velocity_resolved: Any = is_velocity_resolved[body_indices]
+            if is_column_velocity_resolved.any():
+                resolved_indices: Any = body_indices[is_column_velocity_resolved]
+                is_requery_hit, requery_t_hit_near, requery_normal_x, requery_normal_y = _swept_rects_vs_tiles(
+                    velocity_x[resolved_indices],
+                    velocity_y[resolved_indices],
+                    dt,
+                    collider_x[resolved_indices, 0],
+                    collider_y[resolved_indices, 0],
+                    collider_width[resolved_indices, 0],
+                    collider_height[resolved_indices, 0],
+                    world_tu_x[resolved_indices, column_index] * TILE_SIZE,
+                    world_tu_y[resolved_indices, column_index] * TILE_SIZE,
+                )
+                column_is_hit[is_column_velocity_resolved] = is_requery_hit
+                column_t_hit_near[is_column_velocity_resolved] = requery_t_hit_near
+                column_normal_x[is_column_velocity_resolved] = requery_normal_x
+                column_normal_y[is_column_velocity_resolved] = requery_normal_y
+
+            # RESOLVE VEL, hits only
+            hit_indices: Any = body_indices[column_is_hit]
+            column_t_hit_near = column_t_hit_near[column_is_hit]
+            velocity_x[hit_indices] += column_normal_x[column_is_hit] * np.abs(velocity_x[hit_indices]) * (1 - column_t_hit_near)
+            velocity_y[hit_indices] += column_normal_y[column_is_hit] * np.abs(velocity_y[hit_indices]) * (1 - column_t_hit_near)
+            is_velocity_resolved[hit_indices] = True
+
+        # Write the resolved velocities back
+        velocity_array[:, 0] = velocity_x
+        velocity_array[:, 1] = velocity_y
+
+        return velocities
+
+
+def _swept_rects_vs_tiles(
+    velocity_x: Any,
+    velocity_y: Any,
+    dt: int,
+    collider_x: Any,
+    collider_y: Any,
+    collider_width: Any,
+    collider_height: Any,
+    target_x: Any,
+    target_y: Any,
+) -> tuple[Any, Any, Any, Any]:
+    """
+    Swept rect vs rect on arrays, targets are tiles, arguments broadcast.
+    Same steps and comparisons as swept rect vs rect, nan included, so hits and times match it exactly.
+    Return is hit, t hit near, contact normal x, contact normal y.
+    """
+
+    # Inf times nothing is nan, like the float version, compares false
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Ray from the collider center, target grown by half the collider on each side
+        ray_origin_x: Any = collider_x + collider_width / 2
+        ray_origin_y: Any = collider_y + collider_height / 2
+        ray_dir_x: Any = velocity_x * dt
+        ray_dir_y: Any = velocity_y * dt
+        expanded_target_x: Any = target_x - collider_width / 2
+        expanded_target_y: Any = target_y - collider_height / 2
+
+        # Cache division, handle infinity
+        one_over_ray_dir_x: Any = np.where(np.abs(ray_dir_x) < 0.1, np.where(ray_dir_x > 0.0, inf, -inf), 1.0 / ray_dir_x)
+        one_over_ray_dir_y: Any = np.where(np.abs(ray_dir_y) < 0.1, np.where(ray_dir_y > 0.0, inf, -inf), 1.0 / ray_dir_y)
+
+        # Get near far time
+        t_near_x: Any = (expanded_target_x - ray_origin_x) * one_over_ray_dir_x
+        t_near_y: Any = (expanded_target_y - ray_origin_y) * one_over_ray_dir_y
+        t_far_x: Any = (expanded_target_x + TILE_SIZE + collider_width - ray_origin_x) * one_over_ray_dir_x
+        t_far_y: Any = (expanded_target_y + TILE_SIZE + collider_height - ray_origin_y) * one_over_ray_dir_y
+
+    # Sort near far time
+    is_swapped_x: Any = t_near_x > t_far_x
+    t_near_x, t_far_x = np.where(is_swapped_x, t_far_x, t_near_x), np.where(is_swapped_x, t_near_x, t_far_x)
+    is_swapped_y: Any = t_near_y > t_far_y
+    t_near_y, t_far_y = np.where(is_swapped_y, t_far_y, t_near_y), np.where(is_swapped_y, t_near_y, t_far_y)
+
+    # Get near far time, max and min keep the first one unless the second compares past it
+    t_hit_near: Any = np.where(t_near_y > t_near_x, t_near_y, t_near_x)
+    t_hit_far: Any = np.where(t_far_y < t_far_x, t_far_y, t_far_x)
+
+    # Compute contact normal
+    normal_x: Any = np.where(t_near_x > t_near_y, np.where(ray_dir_x < 0, 1.0, -1.0), 0.0)
+    normal_y: Any = np.where(t_near_x < t_near_y, np.where(ray_dir_y < 0, 1.0, -1.0), 0.0)
+
+    # Moving, COLLISION RULE, not behind, hit within this step
+    is_moving: Any = (np.abs(velocity_x) > 0.0) | (np.abs(velocity_y) > 0.0)
+    is_colliding: Any = ~((t_near_x > t_far_y) | (t_near_y > t_far_x))
+    is_ahead: Any = ~(t_hit_far < 0)
+    is_within_step: Any = (0.0 <= t_hit_near) & (t_hit_near < 1.0)
+    is_hit: Any = is_moving & is_colliding & is_ahead & is_within_step
+
+    return is_hit, t_hit_near, normal_x, normal_y
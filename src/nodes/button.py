@@ -2,7 +2,7 @@ from constants import FONT
 from constants import NATIVE_RECT
 from constants import pg
 from nodes.curtain import Curtain
-from typeguard import typechecked
+from typechecking import typechecked
 
 
 @typechecked
@@ -143,6 +143,11 @@ class Button:
         # Set initial state to INACTIVE
         self.state: int = self.INACTIVE
 
+        # True when my surfs, position or state changed since my last draw
+        self.is_dirty: bool = True
+        # Regions I changed on my last draw
+        self.dirty_rects: list[pg.Rect] = []
+
     # Callbacks
     def _on_hover_curtain_invisible(self) -> None:
         # Only hover bounce curtain fade in ACTIVE STATE
@@ -161,6 +166,8 @@ class Button:
         - description text.
         - surf.
         - active curtain.
+
+        Report changed regions in dirty rects.
         """
 
         # Draw my description text if I am active
@@ -181,6 +188,24 @@ class Button:
         # Draw my hover surf
         self.hover_curtain.draw(surf, y_offset)
 
+        # Whole button changed? Report my area, curtain is 1 px wider than me, and description
+        self.dirty_rects.clear()
+        if self.is_dirty:
+            self.dirty_rects.append(self.active_curtain.rect.move(0, y_offset))
+            self.dirty_rects.append(self.description_text_rect.copy())
+            self.is_dirty = False
+        # Only curtains fading? Report what they changed
+        else:
+            self.dirty_rects.extend(self.active_curtain.dirty_rects)
+            self.dirty_rects.extend(self.hover_curtain.dirty_rects)
+
+    def get_is_dirty(self) -> bool:
+        """
+        True if my next draw changes pixels.
+        """
+
+        return self.is_dirty or self.active_curtain.is_dirty or self.hover_curtain.is_dirty
+
     # Update
     def update(self, dt: int) -> None:
         """
@@ -203,6 +228,9 @@ class Button:
         old_state: int = self.state
         self.state = value
 
+        # Description text shows or hides
+        self.is_dirty = True
+
         # From INACTIVE?
         if old_state == self.INACTIVE:
             # To ACTIVE?
@@ -235,6 +263,9 @@ class Button:
         self.active_curtain.rect.y += value
         self.hover_curtain.rect.y += value
 
+        # Moved
+        self.is_dirty = True
+
     def draw_extra_text_on_surf(
         self,
         text: str,
@@ -247,6 +278,9 @@ class Button:
         Draw given texts on them.
         """
 
+        # Surfs redrawn
+        self.is_dirty = True
+
         # Clear all surfs
         self.surf.fill(self.BUTTON_INACTIVE_BODY_COLOR)
         self.active_curtain.surf.fill(self.BUTTON_ACTIVE_BODY_COLOR)
@@ -344,6 +378,9 @@ class Button:
         Draw given surf on them.
         """
 
+        # Surfs redrawn
+        self.is_dirty = True
+
         # Clear all surfs
         self.surf.fill(self.BUTTON_INACTIVE_BODY_COLOR)
         self.active_curtain.surf.fill(self.BUTTON_ACTIVE_BODY_COLOR)
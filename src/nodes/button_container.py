@@ -7,7 +7,7 @@ from constants import pg
 from nodes.button import Button
 from pygame.math import clamp
 from pygame.math import lerp
-from typeguard import typechecked
+from typechecking import typechecked
 
 
 if TYPE_CHECKING:
@@ -78,6 +78,11 @@ class ButtonContainer:
         # Input blocker
         self.is_input_allowed: bool = False
 
+        # True when index, page or input blocker changed since my last draw
+        self.is_dirty: bool = True
+        # Regions I changed on my last draw
+        self.dirty_rects: list[pg.Rect] = []
+
         # Description surf, rect and position
         self.description_surf: pg.Surface = pg.Surface((self.DESCRIPTION_SURF_WIDTH, self.DESCRIPTION_SURF_HEIGHT))
         self.description_surf.fill(self.DESCRIPTION_SURF_COLOR)
@@ -140,6 +145,9 @@ class ButtonContainer:
 
         self.is_input_allowed = value
 
+        # Current button look changes
+        self.is_dirty = True
+
         # Activate / deactivate current button
         current_button: Button = self.buttons[self.index]
         if self.is_input_allowed:
@@ -159,6 +167,21 @@ class ButtonContainer:
         self.end_offset = self.offset + self.limit
         self.button_draw_y_offset = -self.button_height_with_margin * self.offset
 
+        # Other buttons are visible now
+        self.is_dirty = True
+
+    def get_is_dirty(self) -> bool:
+        """
+        True if my next draw changes pixels.
+        """
+
+        if self.is_dirty:
+            return True
+        for index in range(self.offset, self.end_offset):
+            if self.buttons[index].get_is_dirty():
+                return True
+        return False
+
     def draw(self, surf: pg.Surface) -> None:
         """
         Draw:
@@ -167,6 +190,8 @@ class ButtonContainer:
 
         - Got pagination?
             - Scrollbar.
+
+        Report changed regions in dirty rects.
         """
 
         # Description
@@ -188,6 +213,31 @@ class ButtonContainer:
                 ),
             )
 
+        self.dirty_rects.clear()
+        # Index, page or input blocker changed? Report description and whole visible buttons area
+        if self.is_dirty:
+            first_button: Button = self.buttons[self.offset]
+            last_button: Button = self.buttons[self.end_offset - 1]
+            area: pg.Rect = first_button.active_curtain.rect.union(last_button.active_curtain.rect)
+            area.y += self.button_draw_y_offset
+            # Pagination? Include the scrollbar track
+            if self.is_pagination:
+                area.union_ip(
+                    pg.Rect(
+                        self.scrollbar_x - self.scrollbar_right_margin,
+                        self.scrollbar_y,
+                        1,
+                        self.limit_height,
+                    )
+                )
+            self.dirty_rects.append(area)
+            self.dirty_rects.append(self.description_rect.copy())
+            self.is_dirty = False
+        # Only buttons animating? Report what they changed
+        else:
+            for index in range(self.offset, self.end_offset):
+                self.dirty_rects.extend(self.buttons[index].dirty_rects)
+
     def update(self, dt: int) -> None:
         """
         Update:
@@ -225,6 +275,9 @@ class ButtonContainer:
             old_button.set_state(Button.INACTIVE)
             new_button.set_state(Button.ACTIVE)
 
+            # Description and scrollbar move
+            self.is_dirty = True
+
             # Fire INDEX_CHANGED event
             for callback in self.event_listeners[self.INDEX_CHANGED]:
                 callback(new_button)
@@ -7,7 +7,7 @@ from constants import NATIVE_RECT
 from constants import NATIVE_WIDTH
 from constants import pg
 from pygame.math import clamp
-from typeguard import typechecked
+from typechecking import typechecked
 from utils import exp_decay
 
 
@@ -54,6 +54,14 @@ class Camera:
         # Tolerance to snap to target if close enough
         self.distance_tolerance: float = 1.0
 
+        # Rect position before the last update, for draw interpolation
+        self.previous_rect_x: float = self.rect.x
+        self.previous_rect_y: float = self.rect.y
+
+        # Rect position after the last update, held while rect is interpolated
+        self.simulated_rect_x: float = self.rect.x
+        self.simulated_rect_y: float = self.rect.y
+
     def set_target_vector(self, value: Vector2) -> None:
         """
         Set my target to follow and limit.
@@ -84,7 +92,34 @@ class Camera:
         self.top_limit_target_vector = self.limit_top_rect + NATIVE_HALF_HEIGHT
         self.bottom_limit_target_vector = self.limit_bottom_rect - NATIVE_HALF_HEIGHT
 
+    def interpolate_rect(self, interpolation_alpha: float) -> None:
+        """
+        Move my rect between my previous and current update position.
+        Call before drawing, call restore_rect after drawing.
+        """
+
+        # Hold the simulated position
+        self.simulated_rect_x = self.rect.x
+        self.simulated_rect_y = self.rect.y
+
+        # Lerp from previous to simulated position
+        self.rect.x = self.previous_rect_x + (self.simulated_rect_x - self.previous_rect_x) * interpolation_alpha
+        self.rect.y = self.previous_rect_y + (self.simulated_rect_y - self.previous_rect_y) * interpolation_alpha
+
+    def restore_rect(self) -> None:
+        """
+        Put my rect back to the simulated position.
+        Call after drawing with interpolate_rect.
+        """
+
+        self.rect.x = self.simulated_rect_x
+        self.rect.y = self.simulated_rect_y
+
     def update(self, dt: int) -> None:
+        # Remember where I was for draw interpolation
+        self.previous_rect_x = self.rect.x
+        self.previous_rect_y = self.rect.y
+
         # No target_vector? Return
         if self.target_vector is None:
             return
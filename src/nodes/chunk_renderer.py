@@ -0,0 +1,144 @@
+from collections import OrderedDict
+from typing import Callable
+
+from constants import pg
+from typechecking import typechecked
+
+
+@typechecked
+class ChunkRenderer:
+    """
+    | Draws a room pre render in fixed size chunks, instead of 1 surf as big as the room.
+    |
+    | A chunk is baked the first time the camera sees it, by the bake callback of the owner.
+    | Chunks are kept least recently drawn first, past max chunks the oldest ones are evicted and baked again when seen.
+    | Memory is bounded by max chunks, not by the room size.
+    |
+    | Variant picks 1 of many pre renders of the same room, like 1 per animation frame, each variant has its own chunks.
+    |
+    | Bake callback gets (chunk surf, chunk world rect, dirty world rect, variant).
+    | It draws everything touching dirty world rect at its world position minus chunk world rect topleft.
+    | The dirty part is already cleared to the red colorkey and clipped, spilling out of it draws nothing.
+    """
+
+    def __init__(
+        self,
+        room_width: int,
+        room_height: int,
+        chunk_size: int,
+        max_chunks: int,
+        bake_callback: Callable[[pg.Surface, pg.Rect, pg.Rect, int], None],
+    ):
+        # Room size in px, chunks on the right and bottom edges are cut to it
+        self.room_width: int = room_width
+        self.room_height: int = room_height
+
+        # Chunk size in px and how many stay resident
+        self.chunk_size: int = chunk_size
+        self.max_chunks: int = max_chunks
+
+        # Owner draws the chunk content
+        self.bake_callback: Callable[[pg.Surface, pg.Rect, pg.Rect, int], None] = bake_callback
+
+        # (variant, chunk x, chunk y) : (chunk surf, chunk world rect), least recently drawn first
+        self.chunks: OrderedDict[tuple[int, int, int], tuple[pg.Surface, pg.Rect]] = OrderedDict()
+
+        # Stats
+        self.bake_count: int = 0
+        self.eviction_count: int = 0
+
+    def draw(
+        self,
+        camera_rect: pg.FRect,
+        blit_sequence: list[tuple[pg.Surface, tuple[float, float]]],
+        variant: int = 0,
+    ) -> list[tuple[pg.Surface, tuple[float, float]]]:
+        """
+        | Adds the chunks of this variant that touch the camera rect to the blit sequence and returns it.
+        | Chunks not resident are baked first.
+        """
+
+        # Chunk range under the camera, cut to the room
+        first_chunk_x: int = max(int(camera_rect.left // self.chunk_size), 0)
+        first_chunk_y: int = max(int(camera_rect.top // self.chunk_size), 0)
+        last_chunk_x: int = min(int((camera_rect.right - 1) // self.chunk_size), (self.room_width - 1) // self.chunk_size)
+        last_chunk_y: int = min(int((camera_rect.bottom - 1) // self.chunk_size), (self.room_height - 1) // self.chunk_size)
+
+        # Camera offset truncated once, like a float blit position of 1 room surf, so chunks never show a seam
+        offset_x: int = int(-camera_rect.x)
+        offset_y: int = int(-camera_rect.y)
+
+        for chunk_y in range(first_chunk_y, last_chunk_y + 1):
+            for chunk_x in range(first_chunk_x, last_chunk_x + 1):
+                key: tuple[int, int, int] = (variant, chunk_x, chunk_y)
+                # Resident? Now the most recently drawn
+                if key in self.chunks:
+                    self.chunks.move_to_end(key)
+                # Not resident? Bake it
+                else:
+                    self.chunks[key] = self._bake_chunk(variant, chunk_x, chunk_y)
+                chunk_surf, chunk_rect = self.chunks[key]
+                blit_sequence.append((chunk_surf, (chunk_rect.x + offset_x, chunk_rect.y + offset_y)))
+
+        # Over max? Evict the least recently drawn, chunks drawn this frame are the most recent so they stay
+        while len(self.chunks) > self.max_chunks:
+            self.chunks.popitem(last=False)
+            self.eviction_count += 1
+
+        return blit_sequence
+
+    def update_rect(self, world_rect: pg.Rect) -> None:
+        """
+        | Bake this world rect again in every resident chunk it touches, in place.
+        | Chunks not resident are baked fresh when seen, so nothing to do for them.
+        """
+
+        for (variant, _, _), (chunk_surf, chunk_rect) in self.chunks.items():
+            dirty_rect: pg.Rect = chunk_rect.clip(world_rect)
+            if dirty_rect.width == 0 or dirty_rect.height == 0:
+                continue
+            self._bake(chunk_surf, chunk_rect, dirty_rect, variant)
+
+    def clear(self) -> None:
+        """
+        | Drop every chunk, they are baked again when seen.
+        | Call when the whole room changes, like new sprite sheet pixels.
+        """
+
+        self.chunks.clear()
+
+    def get_resident_bytes(self) -> int:
+        """
+        | Pixel memory of the resident chunks.
+        """
+
+        return sum(chunk_surf.get_pitch() * chunk_surf.get_height() for chunk_surf, _ in self.chunks.values())
+
+    def _bake_chunk(self, variant: int, chunk_x: int, chunk_y: int) -> tuple[pg.Surface, pg.Rect]:
+        """
+        | New chunk surf, cut to the room, baked whole.
+        """
+
+        self.bake_count += 1
+
+        chunk_rect: pg.Rect = pg.Rect(
+            chunk_x * self.chunk_size,
+            chunk_y * self.chunk_size,
+            min(self.chunk_size, self.room_width - chunk_x * self.chunk_size),
+            min(self.chunk_size, self.room_height - chunk_y * self.chunk_size),
+        )
+        chunk_surf: pg.Surface = pg.Surface(chunk_rect.size)
+        chunk_surf.set_colorkey("red")
+        self._bake(chunk_surf, chunk_rect, chunk_rect, variant)
+        return chunk_surf, chunk_rect
+
+    def _bake(self, chunk_surf: pg.Surface, chunk_rect: pg.Rect, dirty_rect: pg.Rect, variant: int) -> None:
+        """
+        | Clear the dirty part of a chunk and let the owner draw it, clipped to it.
+        """
+
+        local_dirty_rect: pg.Rect = dirty_rect.move(-chunk_rect.x, -chunk_rect.y)
+        chunk_surf.fill("red", local_dirty_rect)
+        chunk_surf.set_clip(local_dirty_rect)
+        self.bake_callback(chunk_surf, chunk_rect, dirty_rect, variant)
+        chunk_surf.set_clip(None)
@@ -3,7 +3,7 @@ from typing import Callable
 from constants import pg
 from pygame.math import clamp
 from pygame.math import lerp
-from typeguard import typechecked
+from typechecking import typechecked
 
 
 @typechecked
@@ -79,6 +79,11 @@ class Curtain:
         # True when reached INVISIBLE_END / OPAQUE_END
         self.is_done: bool = True
 
+        # True when my pixels changed since my last draw, owners set this too when they draw on my surf
+        self.is_dirty: bool = True
+        # Regions I changed on my last draw, in the given surf coords
+        self.dirty_rects: list[pg.Rect] = []
+
     # Abilities
     def go_to_opaque(self) -> None:
         """
@@ -132,6 +137,7 @@ class Curtain:
         self.remainder = 0
         self.alpha = self.max_alpha
         self.surf.set_alpha(self.alpha)
+        self.is_dirty = True
         self.direction = 1
         for callback in self.event_listeners[self.OPAQUE_END]:
             callback()
@@ -150,6 +156,7 @@ class Curtain:
         self.remainder = 0
         self.alpha = 0
         self.surf.set_alpha(self.alpha)
+        self.is_dirty = True
         self.direction = -1
         for callback in self.event_listeners[self.INVISIBLE_END]:
             callback()
@@ -172,8 +179,16 @@ class Curtain:
         """
         Draw:
         - surf.
+
+        Report my region in dirty rects if my pixels changed.
         """
 
+        # Pixels changed since my last draw? Report my region, even if I just turned invisible
+        self.dirty_rects.clear()
+        if self.is_dirty:
+            self.dirty_rects.append(self.rect.move(0, y_offset))
+            self.is_dirty = False
+
         # No need to draw if my alpha is 0, I am invisible
         if self.alpha == 0:
             return
@@ -196,6 +211,9 @@ class Curtain:
             # Return
             return
 
+        # Remember alpha to know if pixels changed
+        old_alpha: int = self.alpha
+
         # Count
         self.fade_counter += dt * self.direction
 
@@ -220,6 +238,10 @@ class Curtain:
         # Set surf alpha
         self.surf.set_alpha(self.alpha)
 
+        # Alpha changed? Pixels changed
+        if self.alpha != old_alpha:
+            self.is_dirty = True
+
         # Counter <= 0? It is float so use > <
         if self.fade_counter <= 0:
             self.jump_to_invisible()
@@ -3,7 +3,7 @@ from typing import Any
 from constants import FONT
 from constants import NATIVE_SURF
 from constants import pg
-from typeguard import typechecked
+from typechecking import typechecked
 
 
 @typechecked
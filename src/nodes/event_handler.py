@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING
 
 from constants import pg
-from typeguard import typechecked
+from typechecking import typechecked
 
 
 if TYPE_CHECKING:
@@ -72,6 +72,10 @@ class EventHandler:
         self.is_jump_just_released: bool = False
         self.is_attack_just_released: bool = False
 
+        # REMOVE IN BUILD
+        # Mouse position in window, set once per frame by main, so replays can set it too
+        self.mouse_position_tuple: tuple[int, int] = (0, 0)
+
         # Init
         self.bind_game_local_setting_key_with_input_flag_setter()
 
@@ -129,10 +133,12 @@ class EventHandler:
         self.is_lmb_pressed = False
         self.is_lmb_just_released = True
 
+    # REMOVE IN BUILD
     def MOUSEUP_MMB(self) -> None:
         self.is_mmb_pressed = False
         self.is_mmb_just_released = True
 
+    # REMOVE IN BUILD
     def MOUSEUP_RMB(self) -> None:
         self.is_rmb_pressed = False
         self.is_rmb_just_released = True
@@ -143,10 +149,12 @@ class EventHandler:
         self.is_lmb_pressed = True
         self.is_lmb_just_pressed = True
 
+    # REMOVE IN BUILD
     def MOUSEDOWN_MMB(self) -> None:
         self.is_mmb_pressed = True
         self.is_mmb_just_pressed = True
 
+    # REMOVE IN BUILD
     def MOUSEDOWN_RMB(self) -> None:
         self.is_rmb_pressed = True
         self.is_rmb_just_pressed = True
@@ -237,11 +245,21 @@ class EventHandler:
         self.is_9_pressed = False
         self.is_9_just_released = True
 
+    # REMOVE IN BUILD
+    def set_mouse_position_tuple(self, value: tuple[int, int]) -> None:
+        """
+        Called by main.py every frame, with the real or the replayed mouse position.
+        """
+
+        self.mouse_position_tuple = value
+
     def quit(self) -> None:
         """
         Exit the game.
+        Saves still being written finish first.
         """
 
+        self.game.file_writer.flush()
         pg.quit()
         exit()
 
@@ -274,6 +292,11 @@ class EventHandler:
             if handler:
                 handler()
 
+        # WINDOWEXPOSED.
+        # Window lost its pixels, idle frames would not present them again.
+        elif event.type == pg.WINDOWEXPOSED:
+            self.game.set_is_full_redraw(True)
+
         # REMOVE IN BUILD
         # MOUSEBUTTONDOWN.
         # Pressed True.
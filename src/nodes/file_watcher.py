@@ -0,0 +1,127 @@
+from os import stat
+from typing import Any
+from typing import Callable
+from typing import TYPE_CHECKING
+
+from typechecking import typechecked
+
+if TYPE_CHECKING:
+    from nodes.asset_cache import AssetCache
+
+
+@typechecked
+class FileWatcher:
+    """
+    | Polls the modified time of watched files, for hot reload in the dev tree.
+    |
+    | Owners, usually a scene, watch the JSONs and PNGs they loaded with a callback that rebuilds what depends on them.
+    | Every poll interval each watched file is stat once, polling needs no inotify or other platform dependency.
+    | A change fires once the file has stopped changing for one poll, so a half saved file is never read.
+    |
+    | Changed PNGs are reloaded in the asset cache first, so callbacks see the new pixels.
+    | Then each callback runs once with all of its changed paths.
+    """
+
+    def __init__(self, asset_cache: "AssetCache", poll_interval: int):
+        # Changed PNGs are reloaded here
+        self.asset_cache: "AssetCache" = asset_cache
+
+        # Ms between polls
+        self.poll_interval: int = poll_interval
+        self.timer: int = 0
+
+        # Path : modified time ns of the last poll, 0 if missing
+        self.mtimes: dict[str, int] = {}
+        # Path : modified time ns seen changed last poll, fires when the next poll sees it again
+        self.pending_mtimes: dict[str, int] = {}
+        # Path : [(owner id, callback)]
+        self.watchers: dict[str, list[tuple[int, Callable[[list[str]], None]]]] = {}
+
+        # Stats
+        self.poll_count: int = 0
+        self.change_count: int = 0
+
+    def watch(self, path: str, owner: Any, callback: Callable[[list[str]], None]) -> None:
+        """
+        | Owner watches this path until it unwatches.
+        | Callback gets the changed paths it watches, from update.
+        | Watching a path again with the same owner and callback does nothing.
+        """
+
+        if path not in self.mtimes:
+            self.mtimes[path] = self._get_mtime_ns(path)
+        watchers: list[tuple[int, Callable[[list[str]], None]]] = self.watchers.setdefault(path, [])
+        if (id(owner), callback) not in watchers:
+            watchers.append((id(owner), callback))
+
+    def unwatch_owner(self, owner: Any) -> None:
+        """
+        | Owner stops watching every path it watched.
+        | Called by game on scene change with the old scene.
+        """
+
+        for path in list(self.watchers):
+            self.watchers[path] = [watcher for watcher in self.watchers[path] if watcher[0] != id(owner)]
+            # Nobody watches it? Stop polling it
+            if not self.watchers[path]:
+                del self.watchers[path]
+                del self.mtimes[path]
+                self.pending_mtimes.pop(path, None)
+
+    def update(self, dt: int) -> None:
+        """
+        | Poll once per poll interval.
+        | Called by main loop every frame.
+        """
+
+        self.timer += dt
+        if self.timer < self.poll_interval:
+            return
+        self.timer = 0
+
+        self.poll()
+
+    def poll(self) -> None:
+        """
+        | Stat every watched path, fire the ones that changed and then settled.
+        """
+
+        self.poll_count += 1
+
+        changed_paths: list[str] = []
+        for path, mtime_ns in self.mtimes.items():
+            new_mtime_ns: int = self._get_mtime_ns(path)
+            # Changed since the last poll? Wait for it to settle
+            if new_mtime_ns != mtime_ns:
+                self.mtimes[path] = new_mtime_ns
+                self.pending_mtimes[path] = new_mtime_ns
+            # Settled? Fire, unless it is gone, then it fires when it comes back
+            elif path in self.pending_mtimes:
+                del self.pending_mtimes[path]
+                if new_mtime_ns != 0:
+                    changed_paths.append(path)
+
+        if not changed_paths:
+            return
+        self.change_count += len(changed_paths)
+
+        # Callback : its changed paths, PNGs reloaded before any callback runs
+        callback_paths: dict[Callable[[list[str]], None], list[str]] = {}
+        for path in changed_paths:
+            if path.endswith(".png"):
+                self.asset_cache.reload_surf(path)
+            for _, callback in self.watchers[path]:
+                callback_paths.setdefault(callback, []).append(path)
+
+        for callback, paths in callback_paths.items():
+            callback(paths)
+
+    def _get_mtime_ns(self, path: str) -> int:
+        """
+        | Modified time of a file, 0 if it is missing, like while an editor replaces it.
+        """
+
+        try:
+            return stat(path).st_mtime_ns
+        except FileNotFoundError:
+            return 0
@@ -0,0 +1,153 @@
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from json import dump
+from os import fsync
+from os import remove
+from os import replace
+from os.path import exists
+from threading import Lock
+from typing import Any
+from typing import Callable
+
+from typechecking import typechecked
+
+
+@typechecked
+class FileWriter:
+    """
+    | Writes JSON files on its own thread, so saving never hitches a frame.
+    |
+    | A write goes to a temp file next to the target, is fsynced, then renamed over the target.
+    | A crash mid save leaves the old file, never half of the new one.
+    |
+    | Writes to a path that has not started yet are coalesced, only the last content is written.
+    | Their callbacks all run once it is on disk, on the main thread, in update.
+    | A failed write runs no callbacks, update raises its error on the main thread instead.
+    |
+    | Content is serialized on the writer thread, do not change it after passing it, pass a copy.
+    """
+
+    def __init__(self) -> None:
+        # 1 thread, writes to the same path never race
+        self.executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="file_writer")
+
+        # Guards the dicts below, shared with the writer thread
+        self.lock: Lock = Lock()
+
+        # Path : content not picked up by the writer yet, a later write replaces it
+        self.pending_contents: dict[str, Any] = {}
+        # Path : content being written now
+        self.writing_contents: dict[str, Any] = {}
+        # Path : callbacks waiting for the pending content to be on disk
+        self.pending_callbacks: dict[str, list[Callable[[str], None]]] = {}
+
+        # Done writes, (path, callbacks, error or None), taken by update on the main thread
+        self.done_writes: list[tuple[str, list[Callable[[str], None]], None | Exception]] = []
+
+        # Stats
+        self.write_count: int = 0
+        self.coalesced_count: int = 0
+
+    def write(self, path: str, content: Any, callback: None | Callable[[str], None] = None) -> None:
+        """
+        | Queue a JSON write of content to path.
+        | Callback gets the path once it is on disk, from update.
+        """
+
+        with self.lock:
+            is_queued: bool = path in self.pending_contents
+            self.pending_contents[path] = content
+            if callback is not None:
+                self.pending_callbacks.setdefault(path, []).append(callback)
+
+        # Not started yet? The queued write takes this content
+        if is_queued:
+            self.coalesced_count += 1
+            return
+
+        self.executor.submit(self._write, path)
+
+    def get_unwritten_content(self, path: str) -> tuple[bool, Any]:
+        """
+        | Content queued or being written to this path, so reads see their own writes.
+        | Returns (False, None) if nothing is.
+        """
+
+        with self.lock:
+            if path in self.pending_contents:
+                return True, self.pending_contents[path]
+            if path in self.writing_contents:
+                return True, self.writing_contents[path]
+        return False, None
+
+    def update(self) -> None:
+        """
+        | Run the callbacks of done writes.
+        | Then raise the first failed write, its file still has the old content.
+        | Called by main loop every frame.
+        """
+
+        if not self.done_writes:
+            return
+
+        with self.lock:
+            done_writes: list[tuple[str, list[Callable[[str], None]], None | Exception]] = self.done_writes
+            self.done_writes = []
+
+        failed_writes: list[tuple[str, Exception]] = []
+        for path, callbacks, error in done_writes:
+            # Failed? Its callbacks never run
+            if error is not None:
+                failed_writes.append((path, error))
+                continue
+            for callback in callbacks:
+                callback(path)
+
+        # Nobody reads the writer thread errors, raise here so a lost save is never silent
+        if failed_writes:
+            # The others wait for the next update
+            with self.lock:
+                self.done_writes[:0] = [(path, [], error) for path, error in failed_writes[1:]]
+            failed_path, failed_error = failed_writes[0]
+            raise OSError(f"Writing {failed_path} failed, it still has its old content") from failed_error
+
+    def flush(self) -> None:
+        """
+        | Block until every queued write is on disk, then run their callbacks.
+        | Raises like update if one failed.
+        | Called before quitting.
+        """
+
+        wait([self.executor.submit(lambda: None)])
+        self.update()
+
+    def _write(self, path: str) -> None:
+        """
+        | Writer thread. Take the latest content of this path, write it to a temp file, fsync, rename.
+        """
+
+        with self.lock:
+            content: Any = self.pending_contents.pop(path)
+            callbacks: list[Callable[[str], None]] = self.pending_callbacks.pop(path, [])
+            self.writing_contents[path] = content
+
+        temp_path: str = f"{path}.tmp"
+        error: None | Exception = None
+        try:
+            with open(temp_path, "w") as file:
+                dump(content, file, separators=(",", ":"))
+                file.flush()
+                fsync(file.fileno())
+            replace(temp_path, path)
+        except Exception as write_error:
+            # Failed? The old file is untouched, update raises this on the main thread
+            error = write_error
+        finally:
+            # Leave no temp file behind
+            if exists(temp_path):
+                remove(temp_path)
+
+        with self.lock:
+            self.writing_contents.pop(path, None)
+            self.write_count += 1
+            self.done_writes.append((path, callbacks, error))
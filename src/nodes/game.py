@@ -1,47 +1,52 @@
-from json import dump
+from concurrent.futures import ThreadPoolExecutor
 from json import load
+from os import stat
 from os.path import join
+from os.path import split
 from typing import Any
+from typing import Callable
 
 from actors.parallax_background import ParallaxBackground
-from actors.stage_1_clouds import Stage1Clouds
-from actors.stage_1_colonnade import Stage1Colonnade
-from actors.stage_1_glow import Stage1Glow
-from actors.stage_1_pine_trees import Stage1PineTrees
-from actors.stage_1_sky import Stage1Sky
+from asset_bundle import open_asset
+from constants import ASSET_CACHE_BYTE_BUDGET
 from constants import DEFAULT_SETTINGS_DICT
+from constants import FILE_WATCHER_POLL_INTERVAL
 from constants import JSONS_REPO_DIR_PATH
 from constants import JSONS_ROOMS_DIR_PATH
 from constants import JSONS_USER_DIR_PATH
 from constants import MAX_RESOLUTION_INDEX
+from constants import NATIVE_HEIGHT
+from constants import NATIVE_RECT
+from constants import NATIVE_SURF
 from constants import NATIVE_WIDTH
 from constants import OGGS_PATHS_DICT
 from constants import pg
 from constants import PNGS_PATHS_DICT
+from constants import PRELOAD_WORKER_COUNT
 from constants import SETTINGS_FILE_NAME
 from constants import WINDOW_HEIGHT
 from constants import WINDOW_WIDTH
+from nodes.asset_cache import AssetCache
 from nodes.debug_draw import DebugDraw
 from nodes.event_handler import EventHandler
+from nodes.file_watcher import FileWatcher
+from nodes.file_writer import FileWriter
 from nodes.music_manager import MusicManager
 from nodes.sound_manager import SoundManager
+from nodes.texture_atlas import TextureAtlas
 from pygame.math import clamp
-from scenes.animation_json_generator import AnimationJsonGenerator
-from scenes.created_by_splash_screen import CreatedBySplashScreen
-from scenes.made_with_splash_screen import MadeWithSplashScreen
-from scenes.main_menu import MainMenu
-from scenes.room_json_generator import RoomJsonGenerator
-from scenes.sprite_sheet_json_generator import SpriteSheetJsonGenerator
-from scenes.title_screen import TitleScreen
 from schemas import AnimationMetadata
 from schemas import instance_animation_metadata
 from schemas import instance_settings_metadata
+from schemas import is_trusted_json
 from schemas import SETTINGS_METADATA_SCHEMA
 from schemas import SettingsMetadata
+from schemas import SpriteSheetMetadata
 from schemas import validate_json
-from typeguard import typechecked
+from typechecking import typechecked
 from utils import create_paths_dict
 from utils import get_one_target_dict_value
+from utils import import_mem
 
 
 @typechecked
@@ -56,6 +61,17 @@ class Game:
         self.jsons_user_pahts_dict: dict[str, str] = create_paths_dict(JSONS_USER_DIR_PATH)
         self.jsons_repo_pahts_dict: dict[str, str] = create_paths_dict(JSONS_REPO_DIR_PATH)
         self.jsons_repo_rooms_pahts_dict: dict[str, str] = create_paths_dict(JSONS_ROOMS_DIR_PATH)
+        # Every dynamic path in 1 set, for constant time membership, kept in step with the dicts
+        self.jsons_paths_set: set[str] = {
+            *self.jsons_user_pahts_dict.values(),
+            *self.jsons_repo_pahts_dict.values(),
+            *self.jsons_repo_rooms_pahts_dict.values(),
+        }
+        # Path : (mtime ns, parsed JSON), GET only reads disk when the file changed, PATCH and POST invalidate
+        self.jsons_cache: dict[str, tuple[int, Any]] = {}
+
+        # Writes JSONs on its own thread, POST and PATCH go through it
+        self.file_writer: FileWriter = FileWriter()
 
         # Event handler
         self.event_handler: EventHandler = EventHandler(self)
@@ -67,6 +83,13 @@ class Game:
         self.window_width: int = WINDOW_WIDTH * self.local_settings_metadata_instance.resolution_scale
         self.window_height: int = WINDOW_HEIGHT * self.local_settings_metadata_instance.resolution_scale
         self.window_surf: (None | pg.Surface) = None
+        # Window to native integer scale, 0 if window is not an exact multiple (some fullscreen sizes)
+        self.window_integer_scale: int = 0
+
+        # Native surf regions changed this frame, full redraw ignores them and presents everything
+        self.dirty_rects: list[pg.Rect] = []
+        self.is_full_redraw: bool = True
+
         self.set_resolution_index(self.local_settings_metadata_instance.resolution_index)
 
         # Flags
@@ -77,23 +100,28 @@ class Game:
         # REMOVE IN BUILD
         self.debug_draw: DebugDraw = DebugDraw()
 
+        # Decodes assets and imports scenes off the main thread, splash screens preload what comes next
+        self.preload_executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=PRELOAD_WORKER_COUNT, thread_name_prefix="preload"
+        )
+
+        # Converted surfs, loaded once and shared
+        self.asset_cache: AssetCache = AssetCache(ASSET_CACHE_BYTE_BUDGET, self.preload_executor)
+
+        # REMOVE IN BUILD
+        # Polls the files editors loaded, for hot reload, bundled assets never change
+        self.file_watcher: FileWatcher = FileWatcher(self.asset_cache, FILE_WATCHER_POLL_INTERVAL)
+
         # Sound and music managers
-        self.sound_manager: SoundManager = SoundManager()
+        self.sound_manager: SoundManager = SoundManager(self.preload_executor)
         self.music_manager: MusicManager = MusicManager()
 
-        # Load all oggs
+        # Decode all oggs in the background, first frame does not wait for them
         # TODO: Load when needed only in each scenes
         for ogg_name, ogg_path in OGGS_PATHS_DICT.items():
-            self.sound_manager.load_sound(ogg_name, ogg_path)
+            self.sound_manager.preload_sound(ogg_name, ogg_path)
 
-        # Sprite sheet names bindings to things
-        self.sprite_sheet_static_actor_surfs_dict: dict[str, dict[str, str]] = {
-            "stage_1_sprite_sheet.png": {
-                # Static actor name : static actor surf name
-                "thin_fire": "thin_fire_sprite_sheet.png",
-                "thin_waterfall": "thin_waterfall_sprite_sheet.png",
-            }
-        }
+        # Sprite sheet names bindings to things, static actor JSONs name their own sprite sheet
         self.sprite_sheet_static_actor_jsons_dict: dict[str, dict[str, str]] = {
             "stage_1_sprite_sheet.png": {
                 # Static actor name : static actor JSON name
@@ -101,44 +129,89 @@ class Game:
                 "thin_waterfall": "thin_waterfall_animation.json",
             }
         }
-        self.sprite_sheet_parallax_background_mems_dict: dict[str, dict[str, type[ParallaxBackground]]] = {
+        # Mem paths, imported when a room with this sprite sheet asks for them
+        self.sprite_sheet_parallax_background_mems_dict: dict[str, dict[str, str]] = {
             "stage_1_sprite_sheet.png": {
-                # Parallax actor name : mem
-                "clouds": Stage1Clouds,
-                "colonnade": Stage1Colonnade,
-                "glow": Stage1Glow,
-                "pine_trees": Stage1PineTrees,
-                "sky": Stage1Sky,
+                # Parallax actor name : mem path
+                "clouds": "actors.stage_1_clouds.Stage1Clouds",
+                "colonnade": "actors.stage_1_colonnade.Stage1Colonnade",
+                "glow": "actors.stage_1_glow.Stage1Glow",
+                "pine_trees": "actors.stage_1_pine_trees.Stage1PineTrees",
+                "sky": "actors.stage_1_sky.Stage1Sky",
             }
         }
 
         # All scenes constant dicts TODO: Create schema
-        self.scenes: dict[str, Any] = {
-            # Scene name : mem
-            "CreatedBySplashScreen": CreatedBySplashScreen,
-            "MadeWithSplashScreen": MadeWithSplashScreen,
-            "TitleScreen": TitleScreen,
-            "MainMenu": MainMenu,
+        # Mem paths, a scene module is imported the first time it is set, so startup skips the editors
+        self.scenes: dict[str, str] = {
+            # Scene name : mem path
+            "CreatedBySplashScreen": "scenes.created_by_splash_screen.CreatedBySplashScreen",
+            "MadeWithSplashScreen": "scenes.made_with_splash_screen.MadeWithSplashScreen",
+            "TitleScreen": "scenes.title_screen.TitleScreen",
+            "MainMenu": "scenes.main_menu.MainMenu",
             # REMOVE IN BUILD
-            "AnimationJsonGenerator": AnimationJsonGenerator,
-            "SpriteSheetJsonGenerator": SpriteSheetJsonGenerator,
-            "RoomJsonGenerator": RoomJsonGenerator,
+            "AnimationJsonGenerator": "scenes.animation_json_generator.AnimationJsonGenerator",
+            "SpriteSheetJsonGenerator": "scenes.sprite_sheet_json_generator.SpriteSheetJsonGenerator",
+            "RoomJsonGenerator": "scenes.room_json_generator.RoomJsonGenerator",
+        }
+
+        # Preload manifests, what each scene loads in its init, see preload_scenes
+        self.scene_preload_manifests_dict: dict[str, list[str]] = {
+            # Scene name : png names
+            "TitleScreen": ["gestalt_illusion_logo.png"],
+            "MainMenu": ["main_menu_background.png"],
         }
 
         # Current scene instance
-        self.current_scene: Any = self.scenes[initial_scene](self)
+        self.current_scene: Any = self.get_scene_mem(initial_scene)(self)
 
     # Helper
     def _update_dynamic_paths_dict(self) -> None:
         """
-        | Called by POST or DELETE FILE to disk.
+        | Call when files were added or removed behind the game back.
         |
-        | Reread edited disk dir content, repopulate dynamic paths dict.
+        | Reread edited disk dir content, repopulate dynamic paths dict, the paths set and drop the JSON cache.
+        | POST adds its own path, it does not need this.
         """
 
         self.jsons_user_pahts_dict = create_paths_dict(JSONS_USER_DIR_PATH)
         self.jsons_repo_pahts_dict = create_paths_dict(JSONS_REPO_DIR_PATH)
         self.jsons_repo_rooms_pahts_dict = create_paths_dict(JSONS_ROOMS_DIR_PATH)
+        self.jsons_paths_set = {
+            *self.jsons_user_pahts_dict.values(),
+            *self.jsons_repo_pahts_dict.values(),
+            *self.jsons_repo_rooms_pahts_dict.values(),
+        }
+        self.jsons_cache.clear()
+
+    def _add_dynamic_path(self, new_dynamic_path: str) -> None:
+        """
+        | Called by POST FILE to disk.
+        |
+        | Add 1 new path to the dynamic paths dict of its dir and to the paths set, no dir is reread.
+        | Paths outside the dynamic dirs are not added, like a reread would not find them.
+        """
+
+        dir_path, file_name = split(new_dynamic_path)
+        for dynamic_dir_path, dynamic_paths_dict in (
+            (JSONS_USER_DIR_PATH, self.jsons_user_pahts_dict),
+            (JSONS_REPO_DIR_PATH, self.jsons_repo_pahts_dict),
+            (JSONS_ROOMS_DIR_PATH, self.jsons_repo_rooms_pahts_dict),
+        ):
+            if dir_path == dynamic_dir_path:
+                dynamic_paths_dict[file_name] = new_dynamic_path
+                self.jsons_paths_set.add(new_dynamic_path)
+
+    def _get_json_mtime_ns(self, existing_dynamic_path: str) -> int:
+        """
+        | Modified time of a JSON on disk.
+        | Bundled JSONs are not on disk and never change, they are always 0.
+        """
+
+        try:
+            return stat(existing_dynamic_path).st_mtime_ns
+        except FileNotFoundError:
+            return 0
 
     # Abilities
     def get_sprite_sheet_static_actor_jsons_dict(self, stage_sprite_sheet_name: str) -> dict[str, dict[str, AnimationMetadata]]:
@@ -151,70 +224,90 @@ class Game:
         | I turn {actor names : JSON names} into {actor names : {animation names : metadata}} as output
         """
 
-        # {actor names : JSON names}
-        actor_name_to_json_name_dict: dict[str, str] = get_one_target_dict_value(
-            key=stage_sprite_sheet_name,
-            key_type=str,
-            target_dict=self.sprite_sheet_static_actor_jsons_dict,
-            target_dict_name="self.sprite_sheet_static_actor_jsons_dict",
-        )
-
         # Prepare {actor names : {animation names: metadata}}
         out: dict[str, dict[str, AnimationMetadata]] = {}
 
-        # Iter {actor names : JSON names}
-        for actor_name, json_name in actor_name_to_json_name_dict.items():
-            # Turn JSON names into JSON paths
-            existing_json_dynamic_path: str = get_one_target_dict_value(
-                key=json_name,
-                key_type=str,
-                target_dict=self.jsons_repo_pahts_dict,
-                target_dict_name="self.jsons_repo_pahts_dict",
-            )
+        # Iter {actor names : JSON paths}
+        for actor_name, existing_json_dynamic_path in self.get_sprite_sheet_static_actor_json_paths_dict(
+            stage_sprite_sheet_name
+        ).items():
             # Turn JSON path into JSON dict (taken from disk)
             json_dict: dict = self.GET_file_from_disk_dynamic_path(existing_json_dynamic_path)
-            # Convert JSON dict to dataclass (metadata), populate out
-            out[actor_name] = instance_animation_metadata(json_dict)
+            # Convert JSON dict to dataclass (metadata), populate out, bundled ones were validated by the build
+            out[actor_name] = instance_animation_metadata(json_dict, is_trusted_json(existing_json_dynamic_path))
         # Return {actor names : {animation names: metadata}}
         return out
 
-    def get_sprite_sheet_static_actor_surfs_dict(self, stage_sprite_sheet_name: str) -> dict[str, pg.Surface]:
+    def get_sprite_sheet_static_actor_json_paths_dict(self, stage_sprite_sheet_name: str) -> dict[str, str]:
         """
         | Stage sprite sheet name is key
-        | Key for a dict filled with {actor names : surf names}
+        | Key for a dict filled with {actor names : JSON names}
         |
-        | Raises exception if passed stage sprite sheet name is invalid
+        | Raises exception if passed stage sprite sheet name or a JSON name is invalid
         |
-        | I turn {actor names : surf names} into {actor names : surf} as output
+        | I turn {actor names : JSON names} into {actor names : JSON paths} as output
         """
 
-        # {actor names : surf names}
-        data: dict[str, str] = get_one_target_dict_value(
+        # {actor names : JSON names}
+        actor_name_to_json_name_dict: dict[str, str] = get_one_target_dict_value(
             key=stage_sprite_sheet_name,
             key_type=str,
-            target_dict=self.sprite_sheet_static_actor_surfs_dict,
-            target_dict_name="self.sprite_sheet_static_actor_surfs_dict",
+            target_dict=self.sprite_sheet_static_actor_jsons_dict,
+            target_dict_name="self.sprite_sheet_static_actor_jsons_dict",
         )
 
-        # Prepare {actor names : Surface}
-        out: dict[str, pg.Surface] = {}
-
-        # Iter {actor names : surf names}
-        for actor_name, surf_name in data.items():
-            # Turn surf names into surf path
-            surf_path: str = get_one_target_dict_value(
-                key=surf_name,
+        # Turn JSON names into JSON paths
+        return {
+            actor_name: get_one_target_dict_value(
+                key=json_name,
                 key_type=str,
-                target_dict=PNGS_PATHS_DICT,
-                target_dict_name="PNGS_PATHS_DICT",
+                target_dict=self.jsons_repo_pahts_dict,
+                target_dict_name="self.jsons_repo_pahts_dict",
             )
-            # Turn surf path into surf
-            surf: pg.Surface = pg.image.load(surf_path).convert_alpha()
-            # Rebind {actor name : surf}
-            out[actor_name] = surf
+            for actor_name, json_name in actor_name_to_json_name_dict.items()
+        }
 
-        # Return {actor names : surf}
-        return out
+    def get_sprite_sheet_texture_atlas(
+        self,
+        sprite_sheet_metadata_instance: SpriteSheetMetadata,
+        static_actor_jsons_dict: dict[str, dict[str, AnimationMetadata]],
+    ) -> TextureAtlas:
+        """
+        | Pass a stage sprite sheet metadata and its {actor names : {animation names : metadata}}
+        |
+        | I pack the stage sprite regions and the static actor frames into a texture atlas
+        | Packed pages are cached on disk, this only packs again when a png or a region changes
+        """
+
+        # {png names : [stage sprite regions]}
+        regions_dict: dict[str, list[tuple[int, int, int, int]]] = {
+            sprite_sheet_metadata_instance.sprite_sheet_png_name: [
+                (sprite_metadata.x, sprite_metadata.y, sprite_metadata.width, sprite_metadata.height)
+                for sprite_metadata in sprite_sheet_metadata_instance.sprites_list
+            ]
+        }
+
+        # {png names : [static actor frames]}
+        frames_dict: dict[str, list[tuple[int, int, int, int]]] = {}
+        for animation_data in static_actor_jsons_dict.values():
+            for animation_metadata in animation_data.values():
+                frames_dict.setdefault(animation_metadata.sprite_sheet_png_name, []).extend(
+                    (
+                        animation_sprite.x,
+                        animation_sprite.y,
+                        animation_metadata.animation_sprite_width,
+                        animation_metadata.animation_sprite_height,
+                    )
+                    for animation_sprite in animation_metadata.animation_sprites_list
+                )
+
+        # Name cache files after the stage sprite sheet
+        return TextureAtlas(
+            sprite_sheet_metadata_instance.sprite_sheet_png_name.removesuffix(".png"),
+            regions_dict,
+            frames_dict,
+            self.asset_cache,
+        )
 
     def get_sprite_sheet_parallax_mems_dict(self, stage_sprite_sheet_name: str) -> dict[str, type[ParallaxBackground]]:
         """
@@ -224,13 +317,35 @@ class Game:
         | Raises exception if passed stage sprite sheet name is invalid
         """
 
-        return get_one_target_dict_value(
+        parallax_background_mem_paths_dict: dict[str, str] = get_one_target_dict_value(
             key=stage_sprite_sheet_name,
             key_type=str,
             target_dict=self.sprite_sheet_parallax_background_mems_dict,
             target_dict_name="self.sprite_sheet_parallax_background_mems_dict",
         )
 
+        # Import the mems on first use
+        return {
+            parallax_background_name: import_mem(parallax_background_mem_path)
+            for parallax_background_name, parallax_background_mem_path in parallax_background_mem_paths_dict.items()
+        }
+
+    def get_scene_mem(self, scene_name: str) -> Any:
+        """
+        | Scene name is key
+        | Imports the scene module the first time it is asked for
+        |
+        | Raises exception if passed scene name is invalid
+        """
+
+        scene_mem_path: str = get_one_target_dict_value(
+            key=scene_name,
+            key_type=str,
+            target_dict=self.scenes,
+            target_dict_name="self.scenes",
+        )
+        return import_mem(scene_mem_path)
+
     def GET_or_POST_settings_json_from_or_to_disk(self) -> None:
         """
         | IF in disk
@@ -265,10 +380,10 @@ class Game:
                 raise ValueError("Invalid local settings dict against schema")
             # Get settings_json_path
             settings_json_path = join(JSONS_USER_DIR_PATH, SETTINGS_FILE_NAME)
-            # POST self.local_settings_dict to disk
+            # POST a copy of self.local_settings_dict to disk, it is written in the background
             self.POST_file_to_disk_dynamic_path(
                 settings_json_path,
-                self.get_local_settings_dict(),
+                dict(self.get_local_settings_dict()),
             )
 
     def GET_file_from_disk_dynamic_path(self, existing_dynamic_path_dict_value: str) -> dict:
@@ -277,63 +392,86 @@ class Game:
         | Raises exception on invalid key.
         |
         | Returns JSON dict from disk
+        | Parsed once, later GETs return the cached dict until the file mtime changes, PATCH or POST
+        | The cached dict is shared, do not mutate it, copy it
+        | Written in the background but not on disk yet? Returns what is being written
         """
 
-        # Collect all dynamic paths dict {json names : json paths}
-        all_paths = {
-            **self.jsons_user_pahts_dict,
-            **self.jsons_repo_pahts_dict,
-            **self.jsons_repo_rooms_pahts_dict,
-        }
-        # Path not found in dynamic paths dict?
-        if existing_dynamic_path_dict_value not in all_paths.values():
+        # Path not found in dynamic paths set?
+        if existing_dynamic_path_dict_value not in self.jsons_paths_set:
             # Raise exception
             raise KeyError("Path does not exist")
 
-        # Use path to GET JSON dict from disk
-        with open(existing_dynamic_path_dict_value, "r") as file:
-            # Return JSON dict
+        # Being written? Read your own write
+        is_unwritten, unwritten_content = self.file_writer.get_unwritten_content(existing_dynamic_path_dict_value)
+        if is_unwritten:
+            return unwritten_content
+
+        # Cached and unchanged on disk? Return it
+        mtime_ns: int = self._get_json_mtime_ns(existing_dynamic_path_dict_value)
+        cached: None | tuple[int, Any] = self.jsons_cache.get(existing_dynamic_path_dict_value)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        # Use path to GET JSON dict from disk, or from the bundle
+        with open_asset(existing_dynamic_path_dict_value) as file:
             data = load(file)
-            return data
 
-    def PATCH_file_to_disk_dynamic_path(self, existing_dynamic_path_dict_value: str, file_content: Any) -> None:
+        # Cache and return JSON dict
+        self.jsons_cache[existing_dynamic_path_dict_value] = (mtime_ns, data)
+        return data
+
+    def PATCH_file_to_disk_dynamic_path(
+        self,
+        existing_dynamic_path_dict_value: str,
+        file_content: Any,
+        callback: None | Callable[[str], None] = None,
+    ) -> None:
         """
         | Makes sure path is in dynamic paths {json names : json paths}.
         | Raises exception on invalid key.
         |
-        | Returns JSON dict from disk
+        | Written in the background by the file writer, atomically
+        | Callback gets the path once it is on disk
+        | Do not change file content after, pass a copy
         """
 
-        # Collect all dynamic paths dict {json names : json paths}
-        all_paths = {
-            **self.jsons_user_pahts_dict,
-            **self.jsons_repo_pahts_dict,
-            **self.jsons_repo_rooms_pahts_dict,
-        }
-        # Path not found in dynamic paths dict?
-        if existing_dynamic_path_dict_value not in all_paths.values():
+        # Path not found in dynamic paths set?
+        if existing_dynamic_path_dict_value not in self.jsons_paths_set:
             # Raise exception
             raise KeyError("Path does not exist")
 
-        # Use path to open JSON dict from disk
-        with open(existing_dynamic_path_dict_value, "w") as file:
-            # Overwrite with file_content
-            dump(file_content, file, separators=(",", ":"))
+        # Overwrite with file_content, in the background
+        self.file_writer.write(existing_dynamic_path_dict_value, file_content, callback)
 
-    def POST_file_to_disk_dynamic_path(self, new_dynamic_path: str, file_content: Any) -> None:
+        # Cached one is stale, next GET reads disk
+        self.jsons_cache.pop(existing_dynamic_path_dict_value, None)
+
+    def POST_file_to_disk_dynamic_path(
+        self,
+        new_dynamic_path: str,
+        file_content: Any,
+        callback: None | Callable[[str], None] = None,
+    ) -> None:
         """
         | Remember to validate against schema first before saving.
         | POST NEW FILE TO DISK.
         |
+        | Written in the background by the file writer, atomically
+        | Callback gets the path once it is on disk
+        | Do not change file content after, pass a copy
+        |
         | Update dynamic path dict.
         """
 
-        # POST NEW FILE TO DISK
-        with open(new_dynamic_path, "w") as file:
-            dump(file_content, file, separators=(",", ":"))
+        # POST NEW FILE TO DISK, in the background
+        self.file_writer.write(new_dynamic_path, file_content, callback)
+
+        # Overwritten file? Cached one is stale
+        self.jsons_cache.pop(new_dynamic_path, None)
 
-        # After POST / DELETE FILE TO DISK, update dynamic path dict
-        self._update_dynamic_paths_dict()
+        # After POST FILE TO DISK, add its path to dynamic path dict
+        self._add_dynamic_path(new_dynamic_path)
 
     # This is the API for interacting with self.local_settings_dict
     def overwriting_local_settings_dict(self, new_local_settings_dict: dict) -> None:
@@ -430,6 +568,67 @@ class Game:
 
         self.is_options_menu_active = value
 
+        # Menu covers or uncovers the scene
+        self.set_is_full_redraw(True)
+
+    def add_dirty_rects(self, value: list[pg.Rect]) -> None:
+        """
+        | Report native surf regions changed this frame.
+        | Only these are scaled and pushed to the window in dirty rect presentation.
+        """
+
+        self.dirty_rects.extend(value)
+
+    def set_is_full_redraw(self, value: bool) -> None:
+        """
+        | Present the whole native surf this frame.
+        | For scenes that do not report dirty rects, or after a big change.
+        """
+
+        self.is_full_redraw = value
+
+    def scale_dirty_rects_to_window(self) -> list[pg.Rect]:
+        """
+        | Scale only the dirty native regions to the window surf.
+        | Needs an integer window scale.
+        |
+        | Returns the window regions to push with display update.
+        """
+
+        window_dirty_rects: list[pg.Rect] = []
+
+        # No window yet? Nothing to scale to
+        if self.window_surf is None:
+            return window_dirty_rects
+
+        scale: int = self.window_integer_scale
+        for dirty_rect in self.dirty_rects:
+            native_rect: pg.Rect = dirty_rect.clip(NATIVE_RECT)
+            # Off screen? Skip
+            if native_rect.width == 0 or native_rect.height == 0:
+                continue
+            window_rect: pg.Rect = pg.Rect(
+                native_rect.x * scale,
+                native_rect.y * scale,
+                native_rect.width * scale,
+                native_rect.height * scale,
+            )
+            pg.transform.scale(
+                NATIVE_SURF.subsurface(native_rect),
+                window_rect.size,
+                self.window_surf.subsurface(window_rect),
+            )
+            window_dirty_rects.append(window_rect)
+        return window_dirty_rects
+
+    def reset_dirty_rects(self) -> None:
+        """
+        | Called by main after presenting.
+        """
+
+        self.dirty_rects.clear()
+        self.is_full_redraw = False
+
     def set_resolution_index(self, value: int) -> None:
         """
         | Sets the resolution scale of the window.
@@ -458,6 +657,8 @@ class Game:
             # Update window size
             self.window_width = self.window_surf.get_width()
             self.window_height = self.window_surf.get_height()
+            # New window surf, present everything
+            self._update_window_integer_scale()
             # Update game local settings
             self.set_one_local_settings_dict_value(
                 key="resolution_index",
@@ -484,6 +685,8 @@ class Game:
         # Update window size
         self.window_width = self.window_surf.get_width()
         self.window_height = self.window_surf.get_height()
+        # New window surf, present everything
+        self._update_window_integer_scale()
         # Update game local settings
         self.set_one_local_settings_dict_value(
             key="resolution_index",
@@ -498,9 +701,51 @@ class Game:
             val_type=int,
         )
 
+    def _update_window_integer_scale(self) -> None:
+        """
+        | Called by set resolution index.
+        | Dirty rects can only be scaled on their own if window is an exact multiple of native.
+        """
+
+        self.window_integer_scale = self.window_width // NATIVE_WIDTH
+        if self.window_width != self.window_integer_scale * NATIVE_WIDTH:
+            self.window_integer_scale = 0
+        if self.window_height != self.window_integer_scale * NATIVE_HEIGHT:
+            self.window_integer_scale = 0
+        self.set_is_full_redraw(True)
+
+    def preload_scenes(self, scene_names: list[str]) -> None:
+        """
+        | Import these scenes and decode their manifest pngs on worker threads.
+        | Call it from a scene that plays for a while, like a splash screen.
+        | Set scene and the asset cache then read what is ready, or wait for what is not.
+        """
+
+        for scene_name in scene_names:
+            # Scene module, the import lock makes a set scene of it wait for this import
+            self.preload_executor.submit(self.get_scene_mem, scene_name)
+
+            # Manifest pngs
+            for png_name in self.scene_preload_manifests_dict.get(scene_name, []):
+                png_path: str = get_one_target_dict_value(
+                    key=png_name,
+                    key_type=str,
+                    target_dict=PNGS_PATHS_DICT,
+                    target_dict_name="PNGS_PATHS_DICT",
+                )
+                self.asset_cache.preload_surf(png_path)
+
     def set_scene(self, value: str) -> None:
         """
         | Sets the current scene with a new scene instance.
         """
 
-        self.current_scene = self.scenes[value](self)
+        # Old scene surfs stay cached for a later hit, until the budget needs the room
+        self.asset_cache.release_owner(self.current_scene)
+        # REMOVE IN BUILD
+        self.file_watcher.unwatch_owner(self.current_scene)
+
+        self.current_scene = self.get_scene_mem(value)(self)
+
+        # New scene, present everything
+        self.set_is_full_redraw(True)
@@ -0,0 +1,95 @@
+from atexit import register
+from atexit import unregister
+from struct import Struct
+from typing import BinaryIO
+
+from constants import pg
+from typechecking import typechecked
+
+
+@typechecked
+class InputRecorder:
+    """
+    Writes each frame dt, mouse position and filtered events to a binary log.
+    Replay the log with InputReplayer to re-run the exact same session.
+
+    Little endian layout:
+    - Header: magic, version, resolution index, initial scene name length, initial scene name.
+    - Frame: dt, mouse x, mouse y, event count, then each event.
+    - Event: type code, then its payload.
+        - KEYDOWN / KEYUP: key, mod, unicode length, unicode.
+        - MOUSEBUTTONDOWN / MOUSEBUTTONUP: button, x, y.
+        - QUIT / WINDOWEXPOSED: nothing.
+    """
+
+    MAGIC: bytes = b"PGIL"
+    VERSION: int = 1
+
+    # Packers, shared with the replayer
+    HEADER_STRUCT: Struct = Struct("<4sBBB")
+    FRAME_STRUCT: Struct = Struct("<HhhH")
+    EVENT_TYPE_STRUCT: Struct = Struct("<B")
+    KEY_EVENT_STRUCT: Struct = Struct("<iHB")
+    MOUSE_EVENT_STRUCT: Struct = Struct("<Bhh")
+
+    # Pygame event type : type code in the log
+    EVENT_TYPE_CODES: dict[int, int] = {
+        pg.KEYDOWN: 0,
+        pg.KEYUP: 1,
+        pg.MOUSEBUTTONDOWN: 2,
+        pg.MOUSEBUTTONUP: 3,
+        pg.QUIT: 4,
+        pg.WINDOWEXPOSED: 5,
+    }
+
+    def __init__(self, file_path: str, initial_scene: str, resolution_index: int):
+        # Buffered, written to disk when the buffer fills or on close
+        self.file: BinaryIO = open(file_path, "wb")
+
+        # Header
+        initial_scene_bytes: bytes = initial_scene.encode("utf-8")
+        self.file.write(self.HEADER_STRUCT.pack(self.MAGIC, self.VERSION, resolution_index, len(initial_scene_bytes)))
+        self.file.write(initial_scene_bytes)
+
+        # Frames written so far
+        self.frame_count: int = 0
+
+        # Event handler calls exit on QUIT, make sure the log is flushed
+        register(self.close)
+
+    def record_frame(self, dt: int, mouse_position_tuple: tuple[int, int], events: list[pg.Event]) -> None:
+        """
+        Call once per frame, with the events that are passed to the event handler.
+        """
+
+        # Only events the log knows
+        events = [event for event in events if event.type in self.EVENT_TYPE_CODES]
+
+        self.file.write(self.FRAME_STRUCT.pack(dt, mouse_position_tuple[0], mouse_position_tuple[1], len(events)))
+
+        for event in events:
+            type_code: int = self.EVENT_TYPE_CODES[event.type]
+            self.file.write(self.EVENT_TYPE_STRUCT.pack(type_code))
+
+            # Key event? Key, mod and typed text
+            if event.type in (pg.KEYDOWN, pg.KEYUP):
+                unicode_bytes: bytes = getattr(event, "unicode", "").encode("utf-8")
+                self.file.write(self.KEY_EVENT_STRUCT.pack(event.key, getattr(event, "mod", 0), len(unicode_bytes)))
+                self.file.write(unicode_bytes)
+
+            # Mouse button event? Button and position
+            elif event.type in (pg.MOUSEBUTTONDOWN, pg.MOUSEBUTTONUP):
+                self.file.write(self.MOUSE_EVENT_STRUCT.pack(event.button, event.pos[0], event.pos[1]))
+
+        self.frame_count += 1
+
+    def close(self) -> None:
+        """
+        Flush and close the log, safe to call more than once.
+        """
+
+        if self.file.closed:
+            return
+
+        self.file.close()
+        unregister(self.close)
@@ -0,0 +1,97 @@
+from struct import Struct
+
+from constants import pg
+from nodes.input_recorder import InputRecorder
+from typechecking import typechecked
+
+
+@typechecked
+class InputReplayer:
+    """
+    Reads an InputRecorder log back one frame at a time.
+    Feed each frame dt, mouse position and events to the game instead of the wall clock and pygame.
+    """
+
+    def __init__(self, file_path: str):
+        # Whole log in memory, a 5 minute session is a few hundred KB
+        with open(file_path, "rb") as file:
+            self.data: bytes = file.read()
+
+        # Read cursor
+        self.offset: int = 0
+
+        # Header
+        magic, version, resolution_index, initial_scene_len = self._unpack(InputRecorder.HEADER_STRUCT)
+        if magic != InputRecorder.MAGIC:
+            raise ValueError(f"{file_path} is not an input log")
+        if version != InputRecorder.VERSION:
+            raise ValueError(f"{file_path} input log version {version} is not supported")
+        self.resolution_index: int = resolution_index
+        self.initial_scene: str = self._read_bytes(initial_scene_len).decode("utf-8")
+
+        # Log type code : pygame event type
+        self.event_types: dict[int, int] = {
+            type_code: event_type for event_type, type_code in InputRecorder.EVENT_TYPE_CODES.items()
+        }
+
+        # Frames read so far
+        self.frame_count: int = 0
+
+    def _unpack(self, struct: Struct) -> tuple:
+        """
+        Unpack at the read cursor and move it.
+        """
+
+        values: tuple = struct.unpack_from(self.data, self.offset)
+        self.offset += struct.size
+        return values
+
+    def _read_bytes(self, size: int) -> bytes:
+        """
+        Read raw bytes at the read cursor and move it.
+        """
+
+        start: int = self.offset
+        end: int = start + size
+        self.offset = end
+        return self.data[start:end]
+
+    def get_is_done(self) -> bool:
+        """
+        True when every frame was read.
+        """
+
+        return self.offset >= len(self.data)
+
+    def next_frame(self) -> None | tuple[int, tuple[int, int], list[pg.Event]]:
+        """
+        Returns the next frame dt, mouse position and events.
+        Returns None when every frame was read.
+        """
+
+        if self.get_is_done():
+            return None
+
+        dt, mouse_x, mouse_y, event_count = self._unpack(InputRecorder.FRAME_STRUCT)
+
+        events: list[pg.Event] = []
+        for _ in range(event_count):
+            (type_code,) = self._unpack(InputRecorder.EVENT_TYPE_STRUCT)
+            event_type: int = self.event_types[type_code]
+
+            # Key event? Key, mod and typed text
+            if event_type in (pg.KEYDOWN, pg.KEYUP):
+                key, mod, unicode_len = self._unpack(InputRecorder.KEY_EVENT_STRUCT)
+                unicode: str = self._read_bytes(unicode_len).decode("utf-8")
+                events.append(pg.event.Event(event_type, key=key, mod=mod, unicode=unicode, scancode=0))
+
+            # Mouse button event? Button and position
+            elif event_type in (pg.MOUSEBUTTONDOWN, pg.MOUSEBUTTONUP):
+                button, x, y = self._unpack(InputRecorder.MOUSE_EVENT_STRUCT)
+                events.append(pg.event.Event(event_type, button=button, pos=(x, y)))
+
+            else:
+                events.append(pg.event.Event(event_type))
+
+        self.frame_count += 1
+        return (dt, (mouse_x, mouse_y), events)
@@ -1,11 +1,13 @@
+from array import array
+from math import inf
 from typing import TYPE_CHECKING
 
 from constants import pg
 from constants import TILE_SIZE
 from schemas import NoneOrBlobSpriteMetadata
-from typeguard import typechecked
-from utils import dynamic_rect_vs_rect
-from utils import get_tile_from_collision_map_list
+from tile_layer import TileLayer
+from typechecking import typechecked
+from utils import swept_rect_vs_rect
 
 if TYPE_CHECKING:
     # REMOVE IN BUILD
@@ -20,7 +22,7 @@ class Kinematic:
         # Actor metadata
         collider_rect: pg.FRect,
         # Room metadata
-        solid_collision_map_list: list[int | NoneOrBlobSpriteMetadata],
+        solid_collision_map_list: TileLayer,
         room_width_tu: int,
         room_height_tu: int,
         # REMOVE IN BUILD
@@ -45,21 +47,27 @@ class Kinematic:
         self.game_debug_draw = game_debug_draw
 
         # Init room metadata
-        # TODO: Make the solid collision map list be safe
-        self.solid_collision_map_list: list[int | NoneOrBlobSpriteMetadata] = solid_collision_map_list
+        # Solid tile layer, its border makes reads 1 tile around the room safe
+        self.solid_collision_map_list: TileLayer = solid_collision_map_list
         self.room_width_tu: int = room_width_tu
         self.room_height_tu: int = room_height_tu
 
         # Init collider rect
         self.collider_rect: pg.FRect = collider_rect
 
-        # One tile frect for collision testing SOLID TILES ARE ALWAYS 1 TILE SIZE
+        # One tile frect for debug draw SOLID TILES ARE ALWAYS 1 TILE SIZE
         self.one_tile_rect: pg.FRect = pg.FRect(0, 0, TILE_SIZE, TILE_SIZE)
 
+        # Scratch state reused every resolve, so a resolve makes no list, Vector2 or FRect
+        # Swept rect vs rect extra info, [t hit near, contact normal x, contact normal y, contact point x, contact point y]
+        self.sweep_hit: list[float] = [0.0, 0.0, 0.0, 0.0, 0.0]
+        # Solid tiles around this step, nearest first
+        self.candidate_hits: CandidateHits = CandidateHits()
+
     #################
     # SETTER GETTER #
     #################
-    def set_solid_collision_map_list(self, value: list[int | NoneOrBlobSpriteMetadata]) -> None:
+    def set_solid_collision_map_list(self, value: TileLayer) -> None:
         """
         Call when room collision map list updates.
         """
@@ -102,173 +110,124 @@ class Kinematic:
     def resolve_vel_against_solid_tiles(self, dt: int, velocity: pg.Vector2) -> pg.Vector2:
         """
         Return resolved velocity against solid tiles.
+        Resolved in place, see resolve vel against solid bitmap.
         """
 
-        input_velocity: pg.Vector2 = velocity
-        resolved_velocity: pg.Vector2 = velocity
-
-        # Compute my future rect position with vel
-        distance_to_be_covered_vector: pg.Vector2 = input_velocity * dt
-        future_rect_x = self.collider_rect.x + distance_to_be_covered_vector.x
-        future_rect_y = self.collider_rect.y + distance_to_be_covered_vector.y
-
-        # Compute present future combined rect pos and size
-        present_future_combined_rect = self.collider_rect.union(
-            [
-                future_rect_x,
-                future_rect_y,
-                self.collider_rect.width,
-                self.collider_rect.height,
-            ]
+        # REMOVE IN BUILD
+        # Debug draw needs the input velocity
+        input_velocity: pg.Vector2 = pg.Vector2(velocity) if self.game_debug_draw.is_active else velocity
+
+        # Resolve on plain floats, write the resolved velocity back, in place like before, the caller may hold this vector
+        velocity.x, velocity.y = resolve_vel_against_solid_bitmap(
+            velocity.x,
+            velocity.y,
+            dt,
+            self.collider_rect.x,
+            self.collider_rect.y,
+            self.collider_rect.width,
+            self.collider_rect.height,
+            self.solid_collision_map_list,
+            self.sweep_hit,
+            self.candidate_hits,
         )
 
-        # Get all 4 points of present_future_combined_rect
-        left_point = present_future_combined_rect.left
-        top_point = present_future_combined_rect.top
-        right_point = left_point + present_future_combined_rect.width
-        bottom_point = top_point + present_future_combined_rect.height
-
-        # Truncate the points
-        l_tu = int(left_point // TILE_SIZE)
-        t_tu = int(top_point // TILE_SIZE)
-        r_tu = int(right_point // TILE_SIZE)
-        b_tu = int(bottom_point // TILE_SIZE)
-
-        # Collect solid tiles in present_future_combined_rect
-        combined_rect_width_ru = r_tu - l_tu + 1
-        combined_rect_height_ru = b_tu - t_tu + 1
-        combined_rect_x_ru = l_tu
-        combined_rect_y_ru = t_tu
-
-        # Get direction
-        direction_x, direction_y = self.determine_movement_direction(input_velocity)
-
-        # Determine x and y iteration ranges based on the direction
-        if direction_x == 1:  # Moving right or no horizontal movement
-            x_range = range(combined_rect_x_ru, combined_rect_x_ru + combined_rect_width_ru)
-        elif direction_x == -1:  # Moving left
-            x_range = range(combined_rect_x_ru + combined_rect_width_ru - 1, combined_rect_x_ru - 1, -1)
-        else:
-            x_range = range(combined_rect_x_ru, combined_rect_x_ru + combined_rect_width_ru)
-
-        if direction_y == 1:  # Moving down or no vertical movement
-            y_range = range(combined_rect_y_ru, combined_rect_y_ru + combined_rect_height_ru)
-        elif direction_y == -1:  # Moving up
-            y_range = range(combined_rect_y_ru + combined_rect_height_ru - 1, combined_rect_y_ru - 1, -1)
-        else:
-            y_range = range(combined_rect_y_ru, combined_rect_y_ru + combined_rect_height_ru)
-
-        # Iterate region candidate
-        for world_tu_x in x_range:
-            for world_tu_y in y_range:
-                # Get each one in solid_collision_map_list
-                cell = get_tile_from_collision_map_list(
-                    world_tu_x,
-                    world_tu_y,
-                    self.room_width_tu,
-                    self.room_height_tu,
-                    self.solid_collision_map_list,
+        # REMOVE IN BUILD
+        # Debug draw every solid tile around this step
+        if self.game_debug_draw.is_active:
+            for order_index in range(self.candidate_hits.count):
+                candidate_index: int = self.candidate_hits.order[order_index]
+                world_tu_x: int = self.candidate_hits.cells[candidate_index * 2]
+                world_tu_y: int = self.candidate_hits.cells[candidate_index * 2 + 1]
+                # Query with the input velocity again for its contact point
+                swept_rect_vs_rect(
+                    input_velocity.x,
+                    input_velocity.y,
+                    dt,
+                    self.collider_rect.x,
+                    self.collider_rect.y,
+                    self.collider_rect.width,
+                    self.collider_rect.height,
+                    world_tu_x * TILE_SIZE,
+                    world_tu_y * TILE_SIZE,
+                    TILE_SIZE,
+                    TILE_SIZE,
+                    self.sweep_hit,
                 )
-                # Ignore air, if it is not 0, its NoneOrBlobSpriteMetadata
-                if cell == 0 or cell == -1:
-                    continue
-
-                # Make sure value is a NoneOrBlobSpriteMetadata
+                _, normal_x, normal_y, contact_x, contact_y = self.sweep_hit
+                # Tile position is its cell
+                self.one_tile_rect.x = world_tu_x * TILE_SIZE
+                self.one_tile_rect.y = world_tu_y * TILE_SIZE
+                # Prepare offset to correct expanded rect collision
+                offset_x: float = 0.0
+                offset_y: float = 0.0
+                collider_rect_half_width: float = self.collider_rect.width / 2
+                collider_rect_half_height: float = self.collider_rect.height / 2
+                if (normal_x, normal_y) == (1, 0):
+                    offset_x = -collider_rect_half_width
+                elif (normal_x, normal_y) == (-1, 0):
+                    offset_x = collider_rect_half_width
+                elif (normal_x, normal_y) == (0, 1):
+                    offset_y = -collider_rect_half_height
+                elif (normal_x, normal_y) == (0, -1):
+                    offset_y = collider_rect_half_height
+                # Draw the test rect green
+                self.game_debug_draw.add(
+                    {
+                        "type": "rect",
+                        "layer": 4,
+                        "rect": [
+                            self.one_tile_rect.x - self.camera.rect.x,
+                            self.one_tile_rect.y - self.camera.rect.y,
+                            self.one_tile_rect.width,
+                            self.one_tile_rect.height,
+                        ],
+                        "color": "green",
+                        "width": 0,
+                    }
+                )
+                # Draw contact point
+                self.game_debug_draw.add(
+                    {
+                        "type": "circle",
+                        "layer": 4,
+                        "color": "blue",
+                        "center": (
+                            contact_x - self.camera.rect.x + offset_x,
+                            contact_y - self.camera.rect.y + offset_y,
+                        ),
+                        "radius": 3,
+                    }
+                )
+                # Draw normal
+                self.game_debug_draw.add(
+                    {
+                        "type": "line",
+                        "layer": 4,
+                        "start": (
+                            contact_x - self.camera.rect.x + offset_x,
+                            contact_y - self.camera.rect.y + offset_y,
+                        ),
+                        "end": (
+                            contact_x + normal_x * 16 - self.camera.rect.x + offset_x,
+                            contact_y + normal_y * 16 - self.camera.rect.y + offset_y,
+                        ),
+                        "color": "yellow",
+                        "width": 1,
+                    }
+                )
+                # Draw tile type, only debug draw needs the tile itself
+                cell = self.solid_collision_map_list.get_tile(world_tu_x, world_tu_y)
                 if not isinstance(cell, NoneOrBlobSpriteMetadata):
-                    raise ValueError("foreground_collision_map_list can only hold int or NoneOrBlobSpriteMetadata")
-
-                self.one_tile_rect.x = cell.x
-                self.one_tile_rect.y = cell.y
-                # Collision query with test rect
-                contact_point = [pg.Vector2(0, 0)]
-                contact_normal = [pg.Vector2(0, 0)]
-                t_hit_near = [0.0]
-                # This one is passed the correct sorted, so returns correct data like t hit near
-                hit = dynamic_rect_vs_rect(
-                    input_velocity,
-                    self.collider_rect,
-                    self.one_tile_rect,
-                    contact_point,
-                    contact_normal,
-                    t_hit_near,
-                    dt,
+                    raise ValueError("solid_collision_map_list can only hold int or NoneOrBlobSpriteMetadata")
+                self.game_debug_draw.add(
+                    {
+                        "type": "text",
+                        "layer": 4,
+                        "x": self.one_tile_rect.x - self.camera.rect.x,
+                        "y": self.one_tile_rect.y - self.camera.rect.y,
+                        "text": (f"type: {cell.type}"),
+                    }
                 )
-                if hit:
-                    # RESOLVE VEL
-                    resolved_velocity.x += contact_normal[0].x * abs(input_velocity.x) * (1 - t_hit_near[0])
-                    resolved_velocity.y += contact_normal[0].y * abs(input_velocity.y) * (1 - t_hit_near[0])
-
-                # REMOVE IN BUILD
-                # Debug draw
-                if self.game_debug_draw.is_active:
-                    # Prepare offset to correct expanded rect collision
-                    offset_x: float = 0.0
-                    offset_y: float = 0.0
-                    collider_rect_half_width: float = self.collider_rect.width / 2
-                    collider_rect_half_height: float = self.collider_rect.height / 2
-                    if contact_normal[0] == (1, 0):
-                        offset_x = -collider_rect_half_width
-                    elif contact_normal[0] == (-1, 0):
-                        offset_x = collider_rect_half_width
-                    elif contact_normal[0] == (0, 1):
-                        offset_y = -collider_rect_half_height
-                    elif contact_normal[0] == (0, -1):
-                        offset_y = collider_rect_half_height
-                    # Draw the test rect green
-                    self.game_debug_draw.add(
-                        {
-                            "type": "rect",
-                            "layer": 4,
-                            "rect": [
-                                self.one_tile_rect.x - self.camera.rect.x,
-                                self.one_tile_rect.y - self.camera.rect.y,
-                                self.one_tile_rect.width,
-                                self.one_tile_rect.height,
-                            ],
-                            "color": "green",
-                            "width": 0,
-                        }
-                    )
-                    # Draw contact point
-                    self.game_debug_draw.add(
-                        {
-                            "type": "circle",
-                            "layer": 4,
-                            "color": "blue",
-                            "center": (
-                                contact_point[0].x - self.camera.rect.x + offset_x,
-                                contact_point[0].y - self.camera.rect.y + offset_y,
-                            ),
-                            "radius": 3,
-                        }
-                    )
-                    # Draw normal
-                    self.game_debug_draw.add(
-                        {
-                            "type": "line",
-                            "layer": 4,
-                            "start": (
-                                contact_point[0].x - self.camera.rect.x + offset_x,
-                                contact_point[0].y - self.camera.rect.y + offset_y,
-                            ),
-                            "end": (
-                                contact_point[0].x + contact_normal[0].x * 16 - self.camera.rect.x + offset_x,
-                                contact_point[0].y + contact_normal[0].y * 16 - self.camera.rect.y + offset_y,
-                            ),
-                            "color": "yellow",
-                            "width": 1,
-                        }
-                    )
-                    # Draw tile type
-                    self.game_debug_draw.add(
-                        {
-                            "type": "text",
-                            "layer": 4,
-                            "x": self.one_tile_rect.x - self.camera.rect.x,
-                            "y": self.one_tile_rect.y - self.camera.rect.y,
-                            "text": (f"type: {cell.type}"),
-                        }
-                    )
 
         # REMOVE IN BUILD
         # Debug draw
@@ -285,8 +244,8 @@ class Kinematic:
                         collider_rect_center_world_y,
                     ),
                     "end": (
-                        collider_rect_center_world_x + resolved_velocity.x * 200,
-                        collider_rect_center_world_y + resolved_velocity.y * 200,
+                        collider_rect_center_world_x + velocity.x * 200,
+                        collider_rect_center_world_y + velocity.y * 200,
                     ),
                     "color": "blue",
                     "width": 1,
@@ -294,4 +253,216 @@ class Kinematic:
             )
 
         # Return the resolved vel
-        return resolved_velocity
+        return velocity
+
+
+def resolve_vel_against_solid_bitmap(
+    velocity_x: float,
+    velocity_y: float,
+    dt: int,
+    collider_x: float,
+    collider_y: float,
+    collider_width: float,
+    collider_height: float,
+    solid_collision_map_list: TileLayer,
+    sweep_hit: list[float],
+    candidate_hits: "CandidateHits",
+) -> tuple[float, float]:
+    """
+    Return resolved velocity x and y of 1 collider against the solid bitmap of a tile layer, swept AABB on plain floats.
+
+    Collects every solid tile in the region the collider covers this step, with the time the input velocity hits it.
+    Nearest hit first, each is resolved against the velocity the hits before it left, misses go last.
+    Sweep hit and candidate hits are scratch the caller keeps, candidate hits holds this step tiles after.
+    Filled in place and ordered by insertion, no tuple per tile and no sort keys.
+    Not a method, so the batch kinematic fallback runs it per body too.
+    """
+
+    # Compute my future rect position with vel
+    future_rect_x: float = collider_x + velocity_x * dt
+    future_rect_y: float = collider_y + velocity_y * dt
+
+    # Get all 4 points of present future combined rect
+    left_point: float = min(collider_x, future_rect_x)
+    top_point: float = min(collider_y, future_rect_y)
+    right_point: float = max(collider_x, future_rect_x) + collider_width
+    bottom_point: float = max(collider_y, future_rect_y) + collider_height
+
+    # Truncate the points
+    l_tu = int(left_point // TILE_SIZE)
+    t_tu = int(top_point // TILE_SIZE)
+    r_tu = int(right_point // TILE_SIZE)
+    b_tu = int(bottom_point // TILE_SIZE)
+
+    # Solid bitmap and its row width, read without making any object
+    solid_bitmap: bytearray = solid_collision_map_list.solid_bitmap
+    padded_width_tu: int = solid_collision_map_list.padded_width_tu
+    width_tu: int = solid_collision_map_list.width_tu
+    height_tu: int = solid_collision_map_list.height_tu
+
+    # Reads 1 tile around the room land on the border, further out is air too, so clamp once instead of per cell
+    l_tu = min(max(l_tu, -1), width_tu)
+    t_tu = min(max(t_tu, -1), height_tu)
+    r_tu = min(max(r_tu, -1), width_tu)
+    b_tu = min(max(b_tu, -1), height_tu)
+
+    # Iterate toward the movement, so equal times keep the nearest tile first
+    # First and last tile of each axis, both inclusive, and the step between them
+    if velocity_x < -0.01:  # Moving left
+        first_tu_x, last_tu_x, step_tu_x = r_tu, l_tu, -1
+    else:  # Moving right or no horizontal movement
+        first_tu_x, last_tu_x, step_tu_x = l_tu, r_tu, 1
+    if velocity_y < -0.01:  # Moving up
+        first_tu_y, last_tu_y, step_tu_y = b_tu, t_tu, -1
+    else:  # Moving down or no vertical movement
+        first_tu_y, last_tu_y, step_tu_y = t_tu, b_tu, 1
+
+    # Scratch arrays, filled in place
+    times: array = candidate_hits.times
+    cells: array = candidate_hits.cells
+    normals: array = candidate_hits.normals
+    order: list[int] = candidate_hits.order
+
+    # Iterate region candidate, collect every solid tile with the time the input velocity hits it this step
+    # Stepped with plain ints, a range and its iterators would be objects made every resolve
+    count: int = 0
+    capacity: int = candidate_hits.capacity
+    world_tu_x: int = first_tu_x - step_tu_x
+    while world_tu_x != last_tu_x:
+        world_tu_x += step_tu_x
+        world_tu_y: int = first_tu_y - step_tu_y
+        while world_tu_y != last_tu_y:
+            world_tu_y += step_tu_y
+
+            # Ignore air and the border
+            if not solid_bitmap[(world_tu_y + 1) * padded_width_tu + world_tu_x + 1]:
+                continue
+
+            # Full? Grow, only a step with more tiles than any before allocates
+            if count == capacity:
+                candidate_hits.grow()
+                capacity = candidate_hits.capacity
+
+            # Collision query with this tile, tile position is its cell
+            if swept_rect_vs_rect(
+                velocity_x,
+                velocity_y,
+                dt,
+                collider_x,
+                collider_y,
+                collider_width,
+                collider_height,
+                world_tu_x * TILE_SIZE,
+                world_tu_y * TILE_SIZE,
+                TILE_SIZE,
+                TILE_SIZE,
+                sweep_hit,
+            ):
+                t_hit_near: float = sweep_hit[0]
+                normal_x: float = sweep_hit[1]
+                normal_y: float = sweep_hit[2]
+            # Missed? Goes last, a resolved velocity may still hit it
+            else:
+                t_hit_near = inf
+                normal_x = 0.0
+                normal_y = 0.0
+            pair_index: int = count * 2
+            times[count] = t_hit_near
+            cells[pair_index] = world_tu_x
+            cells[pair_index + 1] = world_tu_y
+            normals[pair_index] = normal_x
+            normals[pair_index + 1] = normal_y
+
+            # Nearest hit first, insert after every nearer or equal time, so equal times and misses keep the scan order
+            insert_index: int = count
+            while insert_index > 0 and times[order[insert_index - 1]] > t_hit_near:
+                order[insert_index] = order[insert_index - 1]
+                insert_index -= 1
+            order[insert_index] = count
+            count += 1
+    candidate_hits.count = count
+
+    # Resolve in that order, each against the velocity the hits before it left
+    # Until the first resolve the velocity is the input one, so the collected hits are still right and misses stay misses
+    resolved_velocity_x: float = velocity_x
+    resolved_velocity_y: float = velocity_y
+    is_velocity_resolved: bool = False
+    order_index: int = 0
+    while order_index < count:
+        candidate_index: int = order[order_index]
+        order_index += 1
+        pair_index = candidate_index * 2
+        world_tu_x = cells[pair_index]
+        world_tu_y = cells[pair_index + 1]
+        if is_velocity_resolved:
+            # Query again with the resolved velocity
+            if not swept_rect_vs_rect(
+                resolved_velocity_x,
+                resolved_velocity_y,
+                dt,
+                collider_x,
+                collider_y,
+                collider_width,
+                collider_height,
+                world_tu_x * TILE_SIZE,
+                world_tu_y * TILE_SIZE,
+                TILE_SIZE,
+                TILE_SIZE,
+                sweep_hit,
+            ):
+                continue
+            t_hit_near = sweep_hit[0]
+            normal_x = sweep_hit[1]
+            normal_y = sweep_hit[2]
+        # Input velocity misses this one, and every one after it
+        elif times[candidate_index] == inf:
+            break
+        else:
+            t_hit_near = times[candidate_index]
+            normal_x = normals[pair_index]
+            normal_y = normals[pair_index + 1]
+
+        # RESOLVE VEL
+        resolved_velocity_x += normal_x * abs(resolved_velocity_x) * (1 - t_hit_near)
+        resolved_velocity_y += normal_y * abs(resolved_velocity_y) * (1 - t_hit_near)
+        is_velocity_resolved = True
+
+    return resolved_velocity_x, resolved_velocity_y
+
+
+@typechecked
+class CandidateHits:
+    def __init__(self, capacity: int = 16):
+        """
+        Scratch of resolve vel against solid bitmap, the solid tiles around 1 step as parallel arrays.
+        Slot i is 1 tile, order lists the filled slots nearest hit first.
+        Made once by its owner and grown only when a step has more tiles than the capacity.
+        """
+
+        # Slots there are, and slots the last resolve filled
+        self.capacity: int = capacity
+        self.count: int = 0
+
+        # Per slot, t hit near with the input velocity, inf if missed
+        self.times: array = array("d", [0.0]) * capacity
+        # Per slot, world tu x and world tu y
+        self.cells: array = array("i", [0]) * (capacity * 2)
+        # Per slot, contact normal x and normal y
+        self.normals: array = array("d", [0.0]) * (capacity * 2)
+        # Filled slots, nearest hit first
+        self.order: list[int] = list(range(capacity))
+
+    #############
+    # ABILITIES #
+    #############
+    def grow(self) -> None:
+        """
+        Double the slots.
+        Extended in place, so a resolve holding these arrays keeps using them.
+        """
+
+        self.times.extend(array("d", [0.0]) * self.capacity)
+        self.cells.extend(array("i", [0]) * (self.capacity * 2))
+        self.normals.extend(array("d", [0.0]) * (self.capacity * 2))
+        self.order.extend(range(self.capacity, self.capacity * 2))
+        self.capacity *= 2
@@ -1,7 +1,9 @@
-import os
+from typing import BinaryIO
 
+from asset_bundle import asset_exists
+from asset_bundle import open_asset
 from constants import pg
-from typeguard import typechecked
+from typechecking import typechecked
 
 
 @typechecked
@@ -13,13 +15,15 @@ class MusicManager:
     def __init__(self) -> None:
         pg.mixer.init()
         self.current_music_path: str = ""
+        # Music streams from its file while it plays, closed when the next track replaces it
+        self.current_music_file: None | BinaryIO = None
 
     def set_current_music_path(self, path: str) -> None:
         """
         Set current_music_path.
         """
 
-        if os.path.exists(path):
+        if asset_exists(path):
             self.current_music_path = path
         else:
             print(f"Error: Music file {path} does not exist.")
@@ -30,7 +34,12 @@ class MusicManager:
         """
 
         if self.current_music_path:
-            pg.mixer.music.load(self.current_music_path)
+            music_file: BinaryIO = open_asset(self.current_music_path)
+            pg.mixer.music.load(music_file, self.current_music_path)
+            # Load stopped the old track, its file can go
+            if self.current_music_file is not None:
+                self.current_music_file.close()
+            self.current_music_file = music_file
             pg.mixer.music.play(loops, start, fade_ms)
         else:
             print("No music loaded to play.")
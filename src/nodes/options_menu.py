@@ -14,7 +14,7 @@ from nodes.button_container import ButtonContainer
 from nodes.curtain import Curtain
 from nodes.state_machine import StateMachine
 from nodes.timer import Timer
-from typeguard import typechecked
+from typechecking import typechecked
 from utils import get_one_target_dict_value
 
 
@@ -35,8 +35,9 @@ class OptionsMenu:
     def __init__(self, game: "Game"):
         # Initialize game
         self.game = game
-        self.game_debug_draw = self.game.debug_draw
         self.game_event_handler = self.game.event_handler
+        # REMOVE IN BUILD
+        self.game_debug_draw = self.game.debug_draw
 
         # Colors
         self.curtain_clear_color: str = "#000000"
@@ -459,6 +460,9 @@ class OptionsMenu:
             transition_actions={},
         )
 
+        # Last drawn state, a new draw state may leave the old state things on screen
+        self.last_draw_state: Enum = self.state_machine_draw.state
+
     # State draw logics
     def _FADING_CURTAIN_DRAW(self, _dt: int) -> None:
         # Clear curtain
@@ -481,10 +485,18 @@ class OptionsMenu:
         )
         self.curtain.surf.blit(self.decoration_line_surf_vertical, (self.decoration_vertical_x, self.decoration_vertical_top))
 
-        # Draw curtain on native
+        # Draw curtain on native, curtain is on native topleft so button regions map 1 to 1
         self.curtain.draw(NATIVE_SURF, 0)
+        self.game.add_dirty_rects(self.curtain.dirty_rects)
+        self.game.add_dirty_rects(self.button_container.dirty_rects)
 
     def _CLOSED_SCENE_CURTAIN_DRAW(self, _dt: int) -> None:
+        # Nothing changed under or on me? Native surf still has me
+        is_under_me_changed: bool = self.game.is_full_redraw or len(self.game.dirty_rects) > 0
+        is_me_changed: bool = self.curtain.is_dirty or self.button_container.get_is_dirty()
+        if not is_under_me_changed and not is_me_changed:
+            return
+
         # Clear curtain
         self.curtain.surf.fill(self.curtain_clear_color)
 
@@ -505,8 +517,10 @@ class OptionsMenu:
         )
         self.curtain.surf.blit(self.decoration_line_surf_vertical, (self.decoration_vertical_x, self.decoration_vertical_top))
 
-        # Draw curtain on native
+        # Draw curtain on native, curtain is on native topleft so button regions map 1 to 1
         self.curtain.draw(NATIVE_SURF, 0)
+        self.game.add_dirty_rects(self.curtain.dirty_rects)
+        self.game.add_dirty_rects(self.button_container.dirty_rects)
 
     def _OPENED_CURTAIN_DRAW(self, _dt: int) -> None:
         pass
@@ -669,9 +683,10 @@ class OptionsMenu:
                 target_dict=self.game.jsons_user_pahts_dict,
                 target_dict_name="self.game.jsons_user_pahts_dict",
             )
+            # Written in the background, pass a copy
             self.game.PATCH_file_to_disk_dynamic_path(
                 settings_json_path,
-                self.game.get_local_settings_dict(),
+                dict(self.game.get_local_settings_dict()),
             )
 
         # Reset button selected?
@@ -701,10 +716,28 @@ class OptionsMenu:
             self.state_machine_update.change_state(OptionsMenu.State.REBIND)
             self.state_machine_draw.change_state(OptionsMenu.State.REBIND)
 
+    def get_is_fading(self) -> bool:
+        """
+        Curtain is translucent and changing alpha, scene under it must repaint every frame.
+        """
+
+        return self.state_machine_draw.state in (
+            OptionsMenu.State.CLOSING_SCENE_CURTAIN,
+            OptionsMenu.State.OPENING_SCENE_CURTAIN,
+        )
+
     # Draw
-    def draw(self) -> None:
+    def draw(self) -> bool:
+        # Draw state changed? Present everything once
+        if self.state_machine_draw.state != self.last_draw_state:
+            self.last_draw_state = self.state_machine_draw.state
+            self.game.set_is_full_redraw(True)
+
         self.state_machine_draw.handle(0)
 
+        # Drew new pixels? Nothing reported means an idle frame
+        return self.game.is_full_redraw or len(self.game.dirty_rects) != 0
+
     # Update
     def update(self, dt: int) -> None:
         # REMOVE IN BUILD
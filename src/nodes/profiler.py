@@ -0,0 +1,221 @@
+from threading import Event
+from threading import Thread
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+import psutil
+from constants import CLOCK
+from constants import FONT_HEIGHT
+from constants import NATIVE_HEIGHT
+from constants import pg
+
+if TYPE_CHECKING:
+    from nodes.debug_draw import DebugDraw
+
+
+# Not typechecked, marks are called many times per frame and must cost nothing when off
+class Profiler:
+    """
+    Times each main loop phase into ring buffers.
+    Draws a stacked frame time graph with the debug draw.
+    Samples CPU and RAM on a slow background thread.
+    """
+
+    # Phase names, index of my ring buffers
+    EVENTS: int = 0
+    UPDATE: int = 1
+    DRAW: int = 2
+    OPTIONS_MENU: int = 3
+    DEBUG_DRAW: int = 4
+    SCALE: int = 5
+    DISPLAY_UPDATE: int = 6
+
+    PHASE_NAMES: tuple[str, ...] = (
+        "events",
+        "update",
+        "draw",
+        "options",
+        "debug",
+        "scale",
+        "display",
+    )
+    PHASE_COLORS: tuple[str, ...] = (
+        "#808080",
+        "#3f9fff",
+        "#3fff5f",
+        "#bf7fff",
+        "#ffff3f",
+        "#ff9f3f",
+        "#ff3f3f",
+    )
+
+    def __init__(
+        self,
+        game_debug_draw: "DebugDraw",
+        # Frames kept in ring buffers, also the graph width in px
+        buffer_size: int = 120,
+        # Graph height in px
+        graph_height: int = 40,
+        # Ms the graph height represents
+        graph_ms: float = 1000 / 30,
+        # Seconds between CPU and RAM samples
+        sample_interval: float = 1.0,
+    ):
+        # Initialize game dependencies
+        self.game_debug_draw: "DebugDraw" = game_debug_draw
+
+        # Off by default, costs an attribute check per mark
+        self.is_active: bool = False
+
+        # Ring buffers, 1 per phase, ms per frame slot
+        self.buffer_size: int = buffer_size
+        self.buffers: list[list[float]] = [[0.0] * buffer_size for _ in self.PHASE_NAMES]
+        self.index: int = 0
+        self.last_mark: float = 0.0
+
+        # Graph
+        self.graph_height: int = graph_height
+        self.graph_ms: float = graph_ms
+        self.graph_surf: pg.Surface = pg.Surface((buffer_size, graph_height))
+        self.graph_surf.set_alpha(200)
+
+        # Background CPU and RAM sampling
+        self.sample_interval: float = sample_interval
+        self.process: psutil.Process = psutil.Process()
+        self.cpu_percent: float = 0.0
+        self.memory_percent: float = 0.0
+        self.sampler_stop_event: Event = Event()
+        self.sampler_thread: None | Thread = None
+
+    def set_is_active(self, value: bool) -> None:
+        """
+        Start or stop profiling.
+        The sampler thread only runs while active.
+        """
+
+        # Same value? Return
+        if self.is_active == value:
+            return
+
+        self.is_active = value
+
+        # Turned on? Clear old frames, start sampler
+        if self.is_active:
+            for buffer in self.buffers:
+                for i in range(self.buffer_size):
+                    buffer[i] = 0.0
+            self.sampler_stop_event.clear()
+            self.sampler_thread = Thread(target=self._sample, daemon=True)
+            self.sampler_thread.start()
+        # Turned off? Stop sampler
+        else:
+            self.sampler_stop_event.set()
+            self.sampler_thread = None
+
+    def _sample(self) -> None:
+        """
+        Sampler thread body.
+        psutil calls are slow, keep them off the main loop.
+        """
+
+        while not self.sampler_stop_event.wait(self.sample_interval):
+            self.cpu_percent = self.process.cpu_percent()
+            self.memory_percent = self.process.memory_percent()
+
+    def begin_frame(self) -> None:
+        """
+        Move to the next frame slot and start the clock.
+        Call before the event pump.
+        """
+
+        if not self.is_active:
+            return
+
+        self.index = (self.index + 1) % self.buffer_size
+        for buffer in self.buffers:
+            buffer[self.index] = 0.0
+        self.last_mark = perf_counter()
+
+    def mark(self, phase: int) -> None:
+        """
+        Add time since the last mark to this phase.
+        Adds up, so a phase can be marked many times a frame (fixed timestep updates).
+        """
+
+        if not self.is_active:
+            return
+
+        now: float = perf_counter()
+        self.buffers[phase][self.index] += (now - self.last_mark) * 1000
+        self.last_mark = now
+
+    def draw(self) -> None:
+        """
+        Add the graph and phase averages to the debug draw.
+        Call before the debug draw draws.
+        """
+
+        if not self.is_active:
+            return
+
+        # Px per ms
+        scale: float = self.graph_height / self.graph_ms
+
+        # Clear graph
+        self.graph_surf.fill("black")
+
+        # Stack each frame phases as a vertical bar, oldest on the left
+        for x in range(self.buffer_size):
+            slot: int = (self.index + 1 + x) % self.buffer_size
+            bottom: float = self.graph_height
+            for phase, buffer in enumerate(self.buffers):
+                height: float = buffer[slot] * scale
+                if height <= 0.0:
+                    continue
+                top: float = bottom - height
+                pg.draw.line(self.graph_surf, self.PHASE_COLORS[phase], (x, bottom), (x, top))
+                bottom = top
+
+        # Frame budget line
+        budget_y: float = self.graph_height - (1000 / 60) * scale
+        pg.draw.line(self.graph_surf, "white", (0, budget_y), (self.buffer_size, budget_y))
+
+        # Graph on bottom left
+        graph_x: int = 0
+        graph_y: int = NATIVE_HEIGHT - self.graph_height
+        self.game_debug_draw.add(
+            {
+                "type": "surf",
+                "layer": 6,
+                "x": graph_x,
+                "y": graph_y,
+                "surf": self.graph_surf,
+            }
+        )
+
+        # Phase averages next to graph
+        text_x: int = graph_x + self.buffer_size + 2
+        text_y: int = NATIVE_HEIGHT - len(self.buffers) * (FONT_HEIGHT + 1)
+        for phase, buffer in enumerate(self.buffers):
+            average_ms: float = sum(buffer) / self.buffer_size
+            self.game_debug_draw.add(
+                {
+                    "type": "text",
+                    "layer": 6,
+                    "x": text_x,
+                    "y": text_y,
+                    "text": f"{self.PHASE_NAMES[phase]} {average_ms:.2f}",
+                }
+            )
+            text_y += FONT_HEIGHT + 1
+
+        # FPS, CPU and RAM above graph
+        self.game_debug_draw.add(
+            {
+                "type": "text",
+                "layer": 6,
+                "x": graph_x,
+                "y": graph_y - FONT_HEIGHT - 1,
+                "text": f"fps {CLOCK.get_fps():.0f} cpu {self.cpu_percent:.0f}% ram {self.memory_percent:.2f}%",
+            }
+        )
@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING
 from constants import FONT
 from constants import MAX_QUADTREE_DEPTH
 from constants import pg
-from typeguard import typechecked
+from typechecking import typechecked
 
 # REMOVE IN BUILD
 
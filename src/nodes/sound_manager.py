@@ -1,7 +1,10 @@
-from os.path import exists
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 
+from asset_bundle import asset_exists
+from asset_bundle import open_asset
 from constants import pg
-from typeguard import typechecked
+from typechecking import typechecked
 
 
 @typechecked
@@ -10,9 +13,12 @@ class SoundManager:
     | Plays sound effects.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, preload_executor: ThreadPoolExecutor) -> None:
         pg.mixer.init()
         self.sounds: dict[str, pg.mixer.Sound] = {}
+        # Decoding in the background, moved to sounds the first time they are asked for
+        self.preload_executor: ThreadPoolExecutor = preload_executor
+        self.pending_sounds: dict[str, Future[pg.mixer.Sound]] = {}
         self.channels: list[pg.mixer.Channel] = [pg.mixer.Channel(i) for i in range(pg.mixer.get_num_channels())]
 
     def load_sound(self, name: str, path: str) -> None:
@@ -20,16 +26,44 @@ class SoundManager:
         | Load a sound and add it to the sound dictionary.
         """
 
-        if exists(path):
-            self.sounds[name] = pg.mixer.Sound(path)
+        if asset_exists(path):
+            self.sounds[name] = self._decode_sound(path)
         else:
             print(f"Error: Sound file {path} does not exist.")
 
+    def preload_sound(self, name: str, path: str) -> None:
+        """
+        | Decode a sound on a worker thread and add it to the sound dictionary.
+        | Playing it before the decode is done waits for it.
+        """
+
+        if asset_exists(path):
+            self.pending_sounds[name] = self.preload_executor.submit(self._decode_sound, path)
+        else:
+            print(f"Error: Sound file {path} does not exist.")
+
+    def _decode_sound(self, path: str) -> pg.mixer.Sound:
+        """
+        | Decode a sound, its file is closed once decoded.
+        """
+
+        with open_asset(path) as sound_file:
+            return pg.mixer.Sound(sound_file)
+
+    def _collect_pending_sound(self, name: str) -> None:
+        """
+        | Move a preloaded sound to the sound dictionary, waits if it is still decoding.
+        """
+
+        if name in self.pending_sounds:
+            self.sounds[name] = self.pending_sounds.pop(name).result()
+
     def play_sound(self, name: str, loops: int, maxtime: int, fade_ms: int) -> None:
         """
         | Play a sound by its name.
         """
 
+        self._collect_pending_sound(name)
         if name in self.sounds:
             sound = self.sounds[name]
             channel = self._get_free_channel()
@@ -46,6 +80,7 @@ class SoundManager:
         | Volume should be a float between 0.0 and 1.0.
         """
 
+        self._collect_pending_sound(name)
         if name in self.sounds:
             self.sounds[name].set_volume(volume)
         else:
@@ -1,7 +1,7 @@
 from enum import Enum
 from typing import Callable
 
-from typeguard import typechecked
+from typechecking import typechecked
 
 
 @typechecked
@@ -0,0 +1,318 @@
+from hashlib import sha1
+from json import dump
+from json import load
+from os import listdir
+from os import makedirs
+from os import remove
+from os.path import exists
+from os.path import join
+from typing import TYPE_CHECKING
+
+from asset_bundle import open_asset
+from constants import pg
+from constants import PNGS_PATHS_DICT
+from constants import TEXTURE_ATLAS_CACHE_DIR_PATH
+from constants import TEXTURE_ATLAS_PAGE_SIZE
+from schemas import AnimationMetadata
+from schemas import AnimationSpriteMetadata
+from typechecking import typechecked
+from utils import get_one_target_dict_value
+
+if TYPE_CHECKING:
+    from nodes.asset_cache import AssetCache
+
+
+# Bump when packing or the index layout changes, old cached atlases then miss
+TEXTURE_ATLAS_VERSION: int = 1
+
+
+@typechecked
+class TextureAtlas:
+    """
+    | Packs regions of many sprite sheets into one or a few page surfs.
+    |
+    | Regions dict is {png name : [(x, y, width, height)]}, stage sprites.
+    | Frames dict is {png name : [(x, y, width, height)]}, animation frames.
+    | Frames of the same png and size are packed side by side in one strip, so an animation never spans two pages.
+    |
+    | Pages are cached on disk by a hash of the source pngs and their regions.
+    | A hit loads the pages, a miss packs them from the source pngs and saves them.
+    |
+    | Lookups take a source png name and source rect, and return the page and the rect on it.
+    | A rect inside a packed region works too, like a blob tile inside its sprite.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        regions_dict: dict[str, list[tuple[int, int, int, int]]],
+        frames_dict: dict[str, list[tuple[int, int, int, int]]],
+        asset_cache: "AssetCache",
+    ):
+        # Cache file name prefix, old atlases with this prefix are removed when a new one is saved
+        self.name: str = name
+
+        # Packed blocks, (png name, [source rects]), a region is a block of 1, a strip is a block of many frames
+        self.blocks: list[tuple[str, list[tuple[int, int, int, int]]]] = []
+        for png_name, regions in regions_dict.items():
+            for region in dict.fromkeys(regions):
+                self.blocks.append((png_name, [region]))
+        for png_name, frames in frames_dict.items():
+            # Group frames by size, drop duplicates, keep order
+            strips: dict[tuple[int, int], list[tuple[int, int, int, int]]] = {}
+            for frame in dict.fromkeys(frames):
+                strips.setdefault((frame[2], frame[3]), []).append(frame)
+            for strip in strips.values():
+                self.blocks.append((png_name, strip))
+
+        # Page surfs
+        self.pages: list[pg.Surface] = []
+
+        # [(png name, source rect, page index, atlas x, atlas y)], one per region and frame
+        self.index: list[tuple[str, tuple[int, int, int, int], int, int, int]] = []
+
+        # (png name, source rect) : (page index, atlas rect), and subsurfs, lookups are memoized
+        self.rects: dict[tuple[str, tuple[int, int, int, int]], tuple[int, tuple[int, int, int, int]]] = {}
+        self.subsurfs: dict[tuple[str, tuple[int, int, int, int]], pg.Surface] = {}
+
+        # Cache hit? Load, else pack and save
+        self.content_hash: str = self._get_content_hash()
+        self.is_cache_hit: bool = self._load()
+        if not self.is_cache_hit:
+            self._pack(asset_cache)
+            self._save()
+
+    def get_region(self, png_name: str, rect: tuple[int, int, int, int]) -> tuple[pg.Surface, tuple[int, int, int, int]]:
+        """
+        | Pass a source png name and a rect on it.
+        | Returns the page and the rect on it.
+        |
+        | Raises exception if no packed region or frame holds the rect.
+        """
+
+        key: tuple[str, tuple[int, int, int, int]] = (png_name, rect)
+
+        # Memoized?
+        if key in self.rects:
+            page_index, atlas_rect = self.rects[key]
+            return self.pages[page_index], atlas_rect
+
+        # Find the packed region that holds this rect, then offset into it
+        x, y, width, height = rect
+        for index_png_name, (source_x, source_y, source_width, source_height), page_index, atlas_x, atlas_y in self.index:
+            if index_png_name != png_name:
+                continue
+            if pg.Rect(source_x, source_y, source_width, source_height).contains((x, y, width, height)):
+                atlas_rect = (atlas_x + x - source_x, atlas_y + y - source_y, width, height)
+                self.rects[key] = (page_index, atlas_rect)
+                return self.pages[page_index], atlas_rect
+
+        raise KeyError(f"{rect} of {png_name} is not in the texture atlas")
+
+    def get_subsurf(self, png_name: str, rect: tuple[int, int, int, int]) -> pg.Surface:
+        """
+        | Pass a source png name and a rect on it.
+        | Returns a subsurf of the page, no pixels are copied.
+        | Subsurfs have no region, so many tiles can go through one fblits.
+        """
+
+        key: tuple[str, tuple[int, int, int, int]] = (png_name, rect)
+        if key not in self.subsurfs:
+            page, atlas_rect = self.get_region(png_name, rect)
+            self.subsurfs[key] = page.subsurface(atlas_rect)
+        return self.subsurfs[key]
+
+    def remap_animation_data(
+        self, animation_data: dict[str, AnimationMetadata]
+    ) -> tuple[pg.Surface, dict[str, AnimationMetadata]]:
+        """
+        | Pass {animation name : animation metadata} of a packed animation.
+        | Returns the page it is on and a copy with frame x y moved to the page.
+        |
+        | Raises exception if its frames are not on one page.
+        """
+
+        out: dict[str, AnimationMetadata] = {}
+        page_indexes: set[int] = set()
+        for animation_name, animation_metadata in animation_data.items():
+            animation_sprites_list: list[AnimationSpriteMetadata] = []
+            for animation_sprite in animation_metadata.animation_sprites_list:
+                page, (atlas_x, atlas_y, _, _) = self.get_region(
+                    animation_metadata.sprite_sheet_png_name,
+                    (
+                        animation_sprite.x,
+                        animation_sprite.y,
+                        animation_metadata.animation_sprite_width,
+                        animation_metadata.animation_sprite_height,
+                    ),
+                )
+                page_indexes.add(self.pages.index(page))
+                animation_sprites_list.append(AnimationSpriteMetadata(x=atlas_x, y=atlas_y))
+            out[animation_name] = AnimationMetadata(
+                animation_is_loop=animation_metadata.animation_is_loop,
+                next_animation_name=animation_metadata.next_animation_name,
+                animation_duration=animation_metadata.animation_duration,
+                animation_sprite_height=animation_metadata.animation_sprite_height,
+                animation_sprite_width=animation_metadata.animation_sprite_width,
+                sprite_sheet_png_name=animation_metadata.sprite_sheet_png_name,
+                animation_sprites_list=animation_sprites_list,
+            )
+
+        if len(page_indexes) != 1:
+            raise ValueError("animation frames must be on one texture atlas page")
+
+        return self.pages[page_indexes.pop()], out
+
+    def _get_content_hash(self) -> str:
+        """
+        | Hash of the packer version, page size, source png bytes and blocks.
+        | Any change to a png or a region makes a new hash.
+        """
+
+        content_hash = sha1(f"{TEXTURE_ATLAS_VERSION} {TEXTURE_ATLAS_PAGE_SIZE}".encode())
+        for png_name in sorted({png_name for png_name, _ in self.blocks}):
+            png_path: str = get_one_target_dict_value(
+                key=png_name,
+                key_type=str,
+                target_dict=PNGS_PATHS_DICT,
+                target_dict_name="PNGS_PATHS_DICT",
+            )
+            content_hash.update(png_name.encode())
+            with open_asset(png_path) as png_file:
+                content_hash.update(png_file.read())
+        content_hash.update(repr(self.blocks).encode())
+        return content_hash.hexdigest()
+
+    def _get_cache_file_path(self, suffix: str) -> str:
+        """
+        | Path of a cache file of this atlas.
+        """
+
+        return join(TEXTURE_ATLAS_CACHE_DIR_PATH, f"{self.name}_{self.content_hash}{suffix}")
+
+    def _load(self) -> bool:
+        """
+        | Load pages and index from the disk cache.
+        | Returns False on miss.
+        """
+
+        index_path: str = self._get_cache_file_path(".json")
+        if not exists(index_path):
+            return False
+
+        with open(index_path, "r") as index_file:
+            index_dict: dict = load(index_file)
+
+        # Older layout? Repack
+        if index_dict.get("version") != TEXTURE_ATLAS_VERSION:
+            return False
+
+        for page_index in range(index_dict["page_count"]):
+            page_path: str = self._get_cache_file_path(f"_{page_index}.png")
+            if not exists(page_path):
+                self.pages = []
+                return False
+            self.pages.append(pg.image.load(page_path).convert_alpha())
+
+        self.index = [
+            (png_name, (source_x, source_y, width, height), page_index, atlas_x, atlas_y)
+            for png_name, source_x, source_y, width, height, page_index, atlas_x, atlas_y in index_dict["index"]
+        ]
+        return True
+
+    def _pack(self, asset_cache: "AssetCache") -> None:
+        """
+        | Shelf pack the blocks, tallest first.
+        | A block that does not fit in what is left of a page starts a new page.
+        | Pages are cropped to what is used.
+        """
+
+        # Tallest first, then widest, keeps shelves tight
+        order: list[int] = sorted(
+            range(len(self.blocks)),
+            key=lambda block_index: (
+                -self.blocks[block_index][1][0][3],
+                -sum(frame[2] for frame in self.blocks[block_index][1]),
+            ),
+        )
+
+        # [(page index, atlas x, atlas y)] per block, and [(width, height)] used per page
+        placements: list[tuple[int, int, int]] = [(0, 0, 0)] * len(self.blocks)
+        page_sizes: list[tuple[int, int]] = [(0, 0)]
+        shelf_x: int = 0
+        shelf_y: int = 0
+        shelf_height: int = 0
+        for block_index in order:
+            _, block = self.blocks[block_index]
+            block_width: int = sum(frame[2] for frame in block)
+            block_height: int = block[0][3]
+            if block_width > TEXTURE_ATLAS_PAGE_SIZE or block_height > TEXTURE_ATLAS_PAGE_SIZE:
+                raise ValueError(
+                    f"{block_width}x{block_height} block does not fit a {TEXTURE_ATLAS_PAGE_SIZE} texture atlas page"
+                )
+
+            # Row full? Next shelf
+            if shelf_x + block_width > TEXTURE_ATLAS_PAGE_SIZE:
+                shelf_x = 0
+                shelf_y += shelf_height
+                shelf_height = 0
+            # Page full? Next page
+            if shelf_y + block_height > TEXTURE_ATLAS_PAGE_SIZE:
+                page_sizes.append((0, 0))
+                shelf_x = 0
+                shelf_y = 0
+                shelf_height = 0
+
+            placements[block_index] = (len(page_sizes) - 1, shelf_x, shelf_y)
+            page_width, page_height = page_sizes[-1]
+            page_sizes[-1] = (max(page_width, shelf_x + block_width), max(page_height, shelf_y + block_height))
+            shelf_x += block_width
+            shelf_height = max(shelf_height, block_height)
+
+        # Stamp the source pixels, sources are only needed until then
+        self.pages = [pg.Surface(page_size, pg.SRCALPHA).convert_alpha() for page_size in page_sizes]
+        for page in self.pages:
+            page.fill((0, 0, 0, 0))
+        for (png_name, block), (page_index, atlas_x, atlas_y) in zip(self.blocks, placements):
+            png_path: str = get_one_target_dict_value(
+                key=png_name,
+                key_type=str,
+                target_dict=PNGS_PATHS_DICT,
+                target_dict_name="PNGS_PATHS_DICT",
+            )
+            source_surf: pg.Surface = asset_cache.get_surf(png_path, self)
+            for frame in block:
+                self.pages[page_index].blit(source_surf, (atlas_x, atlas_y), frame)
+                self.index.append((png_name, frame, page_index, atlas_x, atlas_y))
+                atlas_x += frame[2]
+        asset_cache.release_owner(self)
+
+    def _save(self) -> None:
+        """
+        | Save pages and index to the disk cache, remove older atlases of this name.
+        """
+
+        if not exists(TEXTURE_ATLAS_CACHE_DIR_PATH):
+            makedirs(TEXTURE_ATLAS_CACHE_DIR_PATH)
+
+        # Older atlases of this name are stale
+        for file_name in listdir(TEXTURE_ATLAS_CACHE_DIR_PATH):
+            if file_name.startswith(f"{self.name}_") and self.content_hash not in file_name:
+                remove(join(TEXTURE_ATLAS_CACHE_DIR_PATH, file_name))
+
+        for page_index, page in enumerate(self.pages):
+            pg.image.save(page, self._get_cache_file_path(f"_{page_index}.png"))
+
+        # Index last, a missing index means a partial save and a miss
+        with open(self._get_cache_file_path(".json"), "w") as index_file:
+            dump(
+                {
+                    "version": TEXTURE_ATLAS_VERSION,
+                    "page_count": len(self.pages),
+                    "index": [
+                        [png_name, *source_rect, page_index, atlas_x, atlas_y]
+                        for png_name, source_rect, page_index, atlas_x, atlas_y in self.index
+                    ],
+                },
+                index_file,
+            )
@@ -1,6 +1,6 @@
 from typing import Callable
 
-from typeguard import typechecked
+from typechecking import typechecked
 
 
 @typechecked
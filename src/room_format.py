@@ -0,0 +1,315 @@
+"""
+Binary room format.
+
+A room JSON holds its metadata and, per layer, a list of 0, 1 or tile dicts, one Python object per tile once loaded.
+The binary room holds the same data as a header, a sprite table and one fixed width array of tile ids per layer.
+Loading maps the file and views the arrays in place, collision map lists share 1 tile instance per sprite.
+
+Convert rooms from the repo root, each conversion is read back and compared with its JSON:
+
+python src/room_format.py jsons/rooms/room1.json jsons/rooms/room2.json
+python src/room_format.py jsons/rooms/room1.json --output-dir build/rooms
+
+Layout, little endian, big endian hosts swap the layers on load:
+header        magic, room x ru, room y ru, room scale x, room scale y, width tu, height tu,
+              sprite count, layer count, metadata byte length
+metadata      JSON, the other room keys and the strings the sprite table points at, padded to an even length
+sprite table  per sprite, name string index, type string index, region x, region y, 4 uint16
+layer table   per layer, its layer list key index, 1 uint16
+layers        per layer, width tu * height tu uint16 tile ids, 0 is empty, 1 is a plain 1, 2 and up is sprite id + 2
+"""
+
+from argparse import ArgumentParser
+from argparse import Namespace
+from array import array
+from json import dumps
+from json import load
+from json import loads
+from os.path import basename
+from os.path import dirname
+from os.path import join
+from struct import calcsize
+from struct import pack
+from struct import unpack_from
+from sys import byteorder
+from typing import Any
+
+from asset_bundle import map_asset
+from asset_bundle import open_asset
+from constants import ROOM_HEIGHT_TU
+from constants import ROOM_WIDTH_TU
+from constants import TILE_SIZE
+from schemas import get_none_or_blob_sprite_metadata
+from schemas import NoneOrBlobSpriteMetadata
+from tile_layer import EMPTY_TILE_ID
+from tile_layer import FILLED_TILE_ID
+from tile_layer import FIRST_SPRITE_TILE_ID
+from tile_layer import TileLayer
+from typechecking import typechecked
+
+# Header
+ROOM_MAGIC: bytes = b"P2DROOM1"
+ROOM_HEADER_FORMAT: str = "<8s8HI"
+ROOM_HEADER_SIZE: int = calcsize(ROOM_HEADER_FORMAT)
+ROOM_SPRITE_FORMAT: str = "<4H"
+ROOM_SPRITE_SIZE: int = calcsize(ROOM_SPRITE_FORMAT)
+
+# Header ints, in header order
+ROOM_HEADER_KEYS: tuple[str, ...] = ("room_x_ru", "room_y_ru", "room_scale_x", "room_scale_y")
+
+# Layer list keys, named like the room editor collision map lists
+# Solid is 1 layer, the others are lists of layers
+ROOM_LAYER_KEYS: tuple[str, ...] = (
+    "background_collision_map_list",
+    "solid_collision_map_list",
+    "foreground_collision_map_list",
+    "static_actor_collision_map_list",
+)
+ROOM_SINGLE_LAYER_KEY: str = "solid_collision_map_list"
+
+
+def room_json_to_bytes(room_json_dict: dict) -> bytes:
+    """
+    | Pass a room JSON dict.
+    | Returns it as a binary room.
+    |
+    | Raises exception if a tile x y is not its cell, or a value does not fit a uint16.
+    """
+
+    width_tu: int = room_json_dict["room_scale_x"] * ROOM_WIDTH_TU
+    height_tu: int = room_json_dict["room_scale_y"] * ROOM_HEIGHT_TU
+
+    # Strings the sprite table points at, and (name, type, region x, region y) : sprite id
+    strings: list[str] = []
+    string_indexes: dict[str, int] = {}
+    sprite_ids: dict[tuple[str, str, int, int], int] = {}
+    sprite_table: bytearray = bytearray()
+
+    def _get_string_index(string: str) -> int:
+        if string not in string_indexes:
+            string_indexes[string] = len(strings)
+            strings.append(string)
+        return string_indexes[string]
+
+    # Layer table and arrays
+    layer_key_indexes: list[int] = []
+    layer_arrays: list[bytes] = []
+    for layer_key_index, layer_key in enumerate(ROOM_LAYER_KEYS):
+        if layer_key not in room_json_dict:
+            continue
+        layers: list = [room_json_dict[layer_key]] if layer_key == ROOM_SINGLE_LAYER_KEY else room_json_dict[layer_key]
+        for layer in layers:
+            if len(layer) != width_tu * height_tu:
+                raise ValueError(f"{layer_key} layer has {len(layer)} cells, expected {width_tu * height_tu}")
+            tile_ids: list[int] = []
+            for cell_index, cell in enumerate(layer):
+                # Plain int
+                if isinstance(cell, int):
+                    if cell not in (EMPTY_TILE_ID, FILLED_TILE_ID):
+                        raise ValueError(f"{layer_key} cell {cell_index} is {cell}, expected 0, 1 or a tile")
+                    tile_ids.append(cell)
+                    continue
+                # Tile, its x y is its cell, only the sprite is stored
+                if (cell["x"], cell["y"]) != ((cell_index % width_tu) * TILE_SIZE, (cell_index // width_tu) * TILE_SIZE):
+                    raise ValueError(f"{layer_key} cell {cell_index} x y is not its cell")
+                sprite: tuple[str, str, int, int] = (cell["name"], cell["type"], cell["region_x"], cell["region_y"])
+                if sprite not in sprite_ids:
+                    sprite_ids[sprite] = len(sprite_ids)
+                    sprite_table += pack(
+                        ROOM_SPRITE_FORMAT, _get_string_index(sprite[0]), _get_string_index(sprite[1]), sprite[2], sprite[3]
+                    )
+                tile_ids.append(sprite_ids[sprite] + FIRST_SPRITE_TILE_ID)
+            layer_key_indexes.append(layer_key_index)
+            layer_arrays.append(pack(f"<{len(tile_ids)}H", *tile_ids))
+
+    # Everything else goes in the metadata JSON, padded so the uint16 arrays stay aligned
+    metadata: dict[str, Any] = {
+        key: value for key, value in room_json_dict.items() if key not in ROOM_HEADER_KEYS and key not in ROOM_LAYER_KEYS
+    }
+    metadata_bytes: bytes = dumps({"metadata": metadata, "strings": strings}).encode()
+    metadata_bytes += b" " * (len(metadata_bytes) % 2)
+
+    return b"".join(
+        [
+            pack(
+                ROOM_HEADER_FORMAT,
+                ROOM_MAGIC,
+                *(room_json_dict[key] for key in ROOM_HEADER_KEYS),
+                width_tu,
+                height_tu,
+                len(sprite_ids),
+                len(layer_arrays),
+                len(metadata_bytes),
+            ),
+            metadata_bytes,
+            bytes(sprite_table),
+            pack(f"<{len(layer_key_indexes)}H", *layer_key_indexes),
+            *layer_arrays,
+        ]
+    )
+
+
+@typechecked
+class RoomBinary:
+    """
+    | A binary room over a buffer, usually a mapped file.
+    |
+    | Layers are uint16 views into the buffer, reading them makes no objects.
+    | Collision map lists and the JSON dict are made only when asked for.
+    """
+
+    def __init__(self, buffer: memoryview):
+        # Header
+        header: tuple = unpack_from(ROOM_HEADER_FORMAT, buffer)
+        if header[0] != ROOM_MAGIC:
+            raise ValueError("buffer is not a binary room")
+        self.room_x_ru: int = header[1]
+        self.room_y_ru: int = header[2]
+        self.room_scale_x: int = header[3]
+        self.room_scale_y: int = header[4]
+        self.width_tu: int = header[5]
+        self.height_tu: int = header[6]
+        sprite_count: int = header[7]
+        layer_count: int = header[8]
+        metadata_length: int = header[9]
+
+        # Metadata, the other room keys and the sprite table strings
+        offset: int = ROOM_HEADER_SIZE
+        metadata_end: int = offset + metadata_length
+        metadata_dict: dict = loads(bytes(buffer[offset:metadata_end]))
+        self.metadata: dict[str, Any] = metadata_dict["metadata"]
+        strings: list[str] = metadata_dict["strings"]
+        offset = metadata_end
+
+        # Sprite table, [(name, type, region x, region y)], index is sprite id
+        self.sprites: list[tuple[str, str, int, int]] = []
+        for sprite_index in range(sprite_count):
+            name_index, type_index, region_x, region_y = unpack_from(
+                ROOM_SPRITE_FORMAT, buffer, offset + sprite_index * ROOM_SPRITE_SIZE
+            )
+            self.sprites.append((strings[name_index], strings[type_index], region_x, region_y))
+        offset += sprite_count * ROOM_SPRITE_SIZE
+
+        # Layer table
+        layer_key_indexes: tuple[int, ...] = unpack_from(f"<{layer_count}H", buffer, offset)
+        offset += layer_count * 2
+
+        # Layers, {layer list key : [uint16 views]}, in place
+        cell_count: int = self.width_tu * self.height_tu
+        self.layers: dict[str, list[memoryview]] = {}
+        for layer_key_index in layer_key_indexes:
+            layer_end: int = offset + cell_count * 2
+            layer: memoryview = buffer[offset:layer_end].cast("H")
+            # Cast reads native byte order, big endian host? View a swapped copy of the little endian ids instead
+            if byteorder != "little":
+                swapped_layer: array = array("H", layer)
+                swapped_layer.byteswap()
+                layer = memoryview(swapped_layer)
+            self.layers.setdefault(ROOM_LAYER_KEYS[layer_key_index], []).append(layer)
+            offset = layer_end
+
+    def get_tile_id(self, layer_key: str, layer_index: int, world_tu_x: int, world_tu_y: int) -> int:
+        """
+        | Tile id of a cell, 0 is empty, 1 is filled, 2 and up is sprite id + 2.
+        """
+
+        return self.layers[layer_key][layer_index][world_tu_y * self.width_tu + world_tu_x]
+
+    def to_collision_map_list(self, layer_key: str, layer_index: int) -> list[int | NoneOrBlobSpriteMetadata]:
+        """
+        | Returns a layer the way the room editor holds it, the shared NoneOrBlobSpriteMetadata of its sprite per tile.
+        """
+
+        # Sprite id : shared instance, 1 lookup per sprite, not per tile
+        sprite_instances: list[NoneOrBlobSpriteMetadata] = [get_none_or_blob_sprite_metadata(*sprite) for sprite in self.sprites]
+        return [
+            tile_id if tile_id < FIRST_SPRITE_TILE_ID else sprite_instances[tile_id - FIRST_SPRITE_TILE_ID]
+            for tile_id in self.layers[layer_key][layer_index]
+        ]
+
+    def to_tile_layer(self, layer_key: str, layer_index: int) -> TileLayer:
+        """
+        | Returns a layer as a tile layer, the sprite table is its palette so tile ids are copied as they are.
+        """
+
+        tile_layer: TileLayer = TileLayer(self.width_tu, self.height_tu)
+        tile_layer.load_tile_ids(
+            self.layers[layer_key][layer_index], [get_none_or_blob_sprite_metadata(*sprite) for sprite in self.sprites]
+        )
+        return tile_layer
+
+    def to_json_dict(self) -> dict:
+        """
+        | Returns the room JSON dict it was made from.
+        """
+
+        room_json_dict: dict[str, Any] = {
+            **self.metadata,
+            "room_x_ru": self.room_x_ru,
+            "room_y_ru": self.room_y_ru,
+            "room_scale_x": self.room_scale_x,
+            "room_scale_y": self.room_scale_y,
+        }
+        for layer_key, layers in self.layers.items():
+            json_layers: list[list] = []
+            for layer_index in range(len(layers)):
+                # Tiles in JSON hold their x y, it is their cell
+                json_layers.append(
+                    [
+                        (
+                            cell
+                            if isinstance(cell, int)
+                            else {
+                                "name": cell.name,
+                                "type": cell.type,
+                                "x": (cell_index % self.width_tu) * TILE_SIZE,
+                                "y": (cell_index // self.width_tu) * TILE_SIZE,
+                                "region_x": cell.region_x,
+                                "region_y": cell.region_y,
+                            }
+                        )
+                        for cell_index, cell in enumerate(self.to_collision_map_list(layer_key, layer_index))
+                    ]
+                )
+            room_json_dict[layer_key] = json_layers[0] if layer_key == ROOM_SINGLE_LAYER_KEY else json_layers
+        return room_json_dict
+
+
+def load_room_binary(path: str) -> RoomBinary:
+    """
+    | Pass a binary room path, bundled or on disk.
+    | Maps it, nothing is copied but the metadata and the sprite table.
+    """
+
+    return RoomBinary(map_asset(path))
+
+
+def convert(args: Namespace) -> None:
+    """
+    Convert room JSONs to binary rooms, next to them or in the output dir.
+    Each one is read back and must give its JSON dict again.
+    """
+
+    for json_path in args.json_paths:
+        with open_asset(json_path) as json_file:
+            room_json_dict: dict = load(json_file)
+
+        room_bytes: bytes = room_json_to_bytes(room_json_dict)
+        if RoomBinary(memoryview(room_bytes)).to_json_dict() != room_json_dict:
+            raise ValueError(f"{json_path} does not round trip")
+
+        room_path: str = join(args.output_dir or dirname(json_path), basename(json_path).removesuffix(".json") + ".room")
+        with open(room_path, "wb") as room_file:
+            room_file.write(room_bytes)
+        print(f"{json_path} -> {room_path}, {len(room_bytes)} bytes")
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser(description="Convert room JSONs to binary rooms, run from the repo root.")
+    parser.add_argument("json_paths", nargs="+", help="Room JSON paths.")
+    parser.add_argument("--output-dir", default=None, help="Binary rooms dir, next to each JSON by default.")
+    convert(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
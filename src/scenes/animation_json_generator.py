@@ -25,7 +25,7 @@ from pygame.math import clamp
 from pygame.math import Vector2
 from schemas import ANIMATION_SCHEMA
 from schemas import validate_json
-from typeguard import typechecked
+from typechecking import typechecked
 
 if TYPE_CHECKING:
     from nodes.game import Game
@@ -345,7 +345,7 @@ class AnimationJsonGenerator:
 
         # Draw cursor
         # Get mouse position
-        mouse_position_tuple: tuple[int, int] = pg.mouse.get_pos()
+        mouse_position_tuple: tuple[int, int] = self.game_event_handler.mouse_position_tuple
         mouse_position_x_tuple: int = mouse_position_tuple[0]
         mouse_position_y_tuple: int = mouse_position_tuple[1]
         # Scale mouse position
@@ -450,7 +450,8 @@ class AnimationJsonGenerator:
             if exists(self.input_text) and self.input_text.endswith(".png"):
                 # Setup the sprite sheet data
                 self.sprite_sheet_png_path = self.input_text
-                self.sprite_sheet_surf = pg.image.load(self.sprite_sheet_png_path).convert_alpha()
+                # Markers are drawn on it, work on a copy of the cached surf
+                self.sprite_sheet_surf = self.game.asset_cache.get_surf(self.sprite_sheet_png_path, self).copy()
                 self.sprite_sheet_rect = self.sprite_sheet_surf.get_rect()
                 is_narrower = self.sprite_sheet_rect.width < self.camera.rect.width
                 is_shorter = self.sprite_sheet_rect.height < self.camera.rect.height
@@ -919,8 +920,11 @@ class AnimationJsonGenerator:
     ########
     # DRAW #
     ########
-    def draw(self) -> None:
+    def draw(self, interpolation_alpha: float = 1.0) -> bool:
         self.state_machine_draw.handle(0)
+        # Editor redraws everything every frame, does not report dirty rects
+        self.game.set_is_full_redraw(True)
+        return True
 
     ##########
     # UPDATE #
@@ -960,7 +964,8 @@ class AnimationJsonGenerator:
         """
         # Get fresh selected sprite sheet again
         if self.sprite_sheet_png_path is not None:
-            self.sprite_sheet_surf = pg.image.load(self.sprite_sheet_png_path).convert_alpha()
+            # Markers are drawn on it, work on a copy of the cached surf
+            self.sprite_sheet_surf = self.game.asset_cache.get_surf(self.sprite_sheet_png_path, self).copy()
             # Empty the selected sprites list
             self.local_animation_sprites_list = []
             # Empty collision map
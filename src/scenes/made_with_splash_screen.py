@@ -11,7 +11,7 @@ from constants import pg
 from nodes.curtain import Curtain
 from nodes.state_machine import StateMachine
 from nodes.timer import Timer
-from typeguard import typechecked
+from typechecking import typechecked
 
 
 if TYPE_CHECKING:
@@ -43,6 +43,9 @@ class MadeWithSplashScreen:
         self._setup_state_machine_update()
         self._setup_state_machine_draw()
 
+        # Splash plays for a while, get the next scenes ready meanwhile, already preloading ones are skipped
+        self.game.preload_scenes(["TitleScreen", "MainMenu"])
+
     # Setups
     def _setup_curtain(self) -> None:
         """Setup curtain with event listeners."""
@@ -135,12 +138,16 @@ class MadeWithSplashScreen:
             transition_actions={},
         )
 
+        # Last drawn state, a new draw state may leave the old state things on screen
+        self.last_draw_state: Enum = self.state_machine_draw.state
+
     # State draw logics
     def _CURTAIN_FADING_DRAW(self, _dt: int) -> None:
         NATIVE_SURF.fill(self.clear_color)
         FONT.render_to(NATIVE_SURF, self.title_rect, self.title_text, self.font_color)
         FONT.render_to(NATIVE_SURF, self.tips_rect, self.tips_text, self.font_color)
         self.curtain.draw(NATIVE_SURF, 0)
+        self.game.add_dirty_rects(self.curtain.dirty_rects)
 
     def _SCENE_CURTAIN_OPENED_DRAW(self, _dt: int) -> None:
         pass
@@ -206,9 +213,17 @@ class MadeWithSplashScreen:
         self.state_machine_draw.change_state(MadeWithSplashScreen.State.CLOSED_SCENE_CURTAIN)
 
     # Draw
-    def draw(self) -> None:
+    def draw(self, interpolation_alpha: float = 1.0) -> bool:
+        # Draw state changed? Present everything once
+        if self.state_machine_draw.state != self.last_draw_state:
+            self.last_draw_state = self.state_machine_draw.state
+            self.game.set_is_full_redraw(True)
+
         self.state_machine_draw.handle(0)
 
+        # Drew new pixels? Nothing reported means an idle frame
+        return self.game.is_full_redraw or len(self.game.dirty_rects) != 0
+
     # Update
     def update(self, dt: int) -> None:
         # REMOVE IN BUILD
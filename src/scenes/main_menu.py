@@ -12,7 +12,7 @@ from nodes.button_container import ButtonContainer
 from nodes.curtain import Curtain
 from nodes.state_machine import StateMachine
 from nodes.timer import Timer
-from typeguard import typechecked
+from typechecking import typechecked
 
 
 if TYPE_CHECKING:
@@ -79,7 +79,9 @@ class MainMenu:
         Setup background surf.
         """
 
-        self.background_surf: pg.Surface = pg.image.load(PNGS_PATHS_DICT["main_menu_background.png"]).convert()
+        self.background_surf: pg.Surface = self.game.asset_cache.get_surf(
+            PNGS_PATHS_DICT["main_menu_background.png"], self, is_alpha=False
+        )
 
     def _setup_buttons(self) -> None:
         """
@@ -118,6 +120,8 @@ class MainMenu:
             text_topleft=text_topleft,
             description_text="exit game",
         )
+
+        # REMOVE IN BUILD
         self.animation_json_generator: Button = Button(
             surf_size_tuple=button_surf_size_tuple,
             topleft=topleft,
@@ -146,6 +150,7 @@ class MainMenu:
                 self.continue_button,
                 self.options_button,
                 self.exit_button,
+                # REMOVE IN BUILD
                 self.animation_json_generator,
                 self.sprite_sheet_json_generator,
                 self.room_json_generator,
@@ -211,6 +216,9 @@ class MainMenu:
             transition_actions={},
         )
 
+        # Last drawn state, a new draw state may leave the old state things on screen
+        self.last_draw_state: Enum = self.state_machine_draw.state
+
     # State draw logics
     def _CURTAIN_CLOSED_DRAW(self, _dt: int) -> None:
         pass
@@ -219,10 +227,16 @@ class MainMenu:
         NATIVE_SURF.blit(self.background_surf, (0, 0))
         self.button_container.draw(NATIVE_SURF)
         self.curtain.draw(NATIVE_SURF, 0)
+        self.game.add_dirty_rects(self.button_container.dirty_rects)
+        self.game.add_dirty_rects(self.curtain.dirty_rects)
 
     def _CURTAIN_OPENED_DRAW(self, _dt: int) -> None:
+        # Buttons did not change? Native surf still has them
+        if not self.game.is_full_redraw and not self.button_container.get_is_dirty():
+            return
         NATIVE_SURF.blit(self.background_surf, (0, 0))
         self.button_container.draw(NATIVE_SURF)
+        self.game.add_dirty_rects(self.button_container.dirty_rects)
 
     # State update logics
     def _JUST_ENTERED_SCENE(self, dt: int) -> None:
@@ -270,12 +284,15 @@ class MainMenu:
         if self.selected_button == self.exit_button:
             self.game_event_handler.quit()
 
+        # REMOVE IN BUILD
         elif self.selected_button == self.animation_json_generator:
             self.game.set_scene("AnimationJsonGenerator")
 
+        # REMOVE IN BUILD
         elif self.selected_button == self.sprite_sheet_json_generator:
             self.game.set_scene("SpriteSheetJsonGenerator")
 
+        # REMOVE IN BUILD
         elif self.selected_button == self.room_json_generator:
             self.game.set_scene("RoomJsonGenerator")
 
@@ -311,21 +328,32 @@ class MainMenu:
             self.state_machine_update.change_state(MainMenu.State.CLOSING_SCENE_CURTAIN)
             self.state_machine_draw.change_state(MainMenu.State.CLOSING_SCENE_CURTAIN)
 
+        # REMOVE IN BUILD
         elif self.animation_json_generator == self.selected_button:
             self.state_machine_update.change_state(MainMenu.State.CLOSING_SCENE_CURTAIN)
             self.state_machine_draw.change_state(MainMenu.State.CLOSING_SCENE_CURTAIN)
 
+        # REMOVE IN BUILD
         elif self.sprite_sheet_json_generator == self.selected_button:
             self.state_machine_update.change_state(MainMenu.State.CLOSING_SCENE_CURTAIN)
             self.state_machine_draw.change_state(MainMenu.State.CLOSING_SCENE_CURTAIN)
 
+        # REMOVE IN BUILD
         elif self.room_json_generator == self.selected_button:
             self.state_machine_update.change_state(MainMenu.State.CLOSING_SCENE_CURTAIN)
             self.state_machine_draw.change_state(MainMenu.State.CLOSING_SCENE_CURTAIN)
 
-    def draw(self) -> None:
+    def draw(self, interpolation_alpha: float = 1.0) -> bool:
+        # Draw state changed? Present everything once
+        if self.state_machine_draw.state != self.last_draw_state:
+            self.last_draw_state = self.state_machine_draw.state
+            self.game.set_is_full_redraw(True)
+
         self.state_machine_draw.handle(0)
 
+        # Drew new pixels? Nothing reported means an idle frame
+        return self.game.is_full_redraw or len(self.game.dirty_rects) != 0
+
     def update(self, dt: int) -> None:
         # REMOVE IN BUILD
         self.game.debug_draw.add(
@@ -10,8 +10,11 @@ from typing import TYPE_CHECKING
 from actors.parallax_background import ParallaxBackground
 from actors.player import Player
 from actors.static_actor import StaticActor
+from constants import CHUNK_RENDERER_MAX_CHUNKS
+from constants import CHUNK_SIZE
 from constants import FONT
 from constants import FONT_HEIGHT
+from constants import IS_HOT_RELOAD
 from constants import JSONS_ROOMS_DIR_PATH
 from constants import NATIVE_HEIGHT
 from constants import NATIVE_RECT
@@ -34,21 +37,24 @@ from constants import WORLD_WIDTH_RU
 from nodes.button import Button
 from nodes.button_container import ButtonContainer
 from nodes.camera import Camera
+from nodes.chunk_renderer import ChunkRenderer
 from nodes.curtain import Curtain
 from nodes.state_machine import StateMachine
+from nodes.texture_atlas import TextureAtlas
 from nodes.timer import Timer
 from pygame.math import clamp
 from pygame.math import Vector2
 from schemas import AdjacentTileMetadata
 from schemas import AnimationMetadata
+from schemas import get_none_or_blob_sprite_metadata
 from schemas import instance_adjacent_tile_metadata
 from schemas import instance_binary_map_offset_item_metadata
-from schemas import instance_none_or_blob_sprite_metadata
 from schemas import instance_sprite_metadata
 from schemas import instance_sprite_sheet_metadata
 from schemas import NoneOrBlobSpriteMetadata
 from schemas import SpriteMetadata
-from typeguard import typechecked
+from tile_layer import TileLayer
+from typechecking import typechecked
 from utils import get_one_target_dict_value
 from utils import set_one_target_dict_value
 
@@ -159,6 +165,9 @@ class RoomJsonGenerator:
         # Editor mode / play test mode flag
         self.is_play_test_mode: bool = False
 
+        # How far draw is between the last 2 fixed updates, set by draw
+        self.interpolation_alpha: float = 1.0
+
     def _setup_reformat_sprite_sheet_json_metadata(self) -> None:
         """
         | Sprite name : SpriteMetadata.
@@ -335,15 +344,25 @@ class RoomJsonGenerator:
         self.room_topleft_x: int = 0
         self.room_topleft_y: int = 0
 
-        # Sprite sheet name and surf
+        # Sprite sheet name and texture atlas, the sprite sheet and its static actor sheets packed together
         self.sprite_sheet_png_name: str = ""
-        self.sprite_sheet_surf: (None | pg.Surface) = None
+        self.texture_atlas: (None | TextureAtlas) = None
+
+        # Sprite sheet JSON path, and the paths the hot reload watches
+        self.sprite_sheet_json_path: str = ""
+        self.watched_png_paths_dict: dict[
+            # {png path : png name}
+            str,
+            str,
+        ] = {}
+        # Changed paths of a failed hot reload, the next change reloads them too
+        self.hot_reload_failed_paths: list[str] = []
 
         # Sprite sheet binded things
-        self.sprite_sheet_static_actor_surfs_dict: dict[
-            # {Static actor name : static actor surf}
+        self.sprite_sheet_static_actor_json_paths_dict: dict[
+            # {Static actor name : static actor JSON path}
+            str,
             str,
-            pg.Surface,
         ] = {}
         self.sprite_sheet_static_actor_jsons_dict: dict[
             # {Static actor name : {animation name : animation metadata}}
@@ -365,33 +384,33 @@ class RoomJsonGenerator:
         self.parallax_background_instances_list: list[None | ParallaxBackground] = []
         # Background layer
         self.background_total_layers: int = 0
-        self.background_collision_map_list: list[list[int | NoneOrBlobSpriteMetadata]] = []
+        self.background_collision_map_list: list[TileLayer] = []
         # Static actor layer
         self.static_actor_total_layers: int = 0
-        self.static_actor_collision_map_list: list[list[int]] = []
+        self.static_actor_collision_map_list: list[TileLayer] = []
         # TODO: item actors layer (things that player interact with like twin goddess, item drop, door, teleported etc)
         # TODO: dynamic actors layer (anything that moves under the player like goblins, bullets)
         # Player does not have layer, just draw it
         # TODO: explosions effects are like static actors but they do not need collision or stored in map, just add them in gameplay list
         # Solid
-        self.solid_collision_map_list: list[int | NoneOrBlobSpriteMetadata] = [
-            0 for _ in range(self.room_width_tu * self.room_height_tu)
-        ]
+        self.solid_collision_map_list: TileLayer = TileLayer(self.room_width_tu, self.room_height_tu)
         # Foreground
         self.foreground_total_layers: int = 0
-        self.foreground_collision_map_list: list[list[int | NoneOrBlobSpriteMetadata]] = []
+        self.foreground_collision_map_list: list[TileLayer] = []
 
-        # Pre render background surf
-        self.pre_render_background_surf: pg.Surface = pg.Surface((self.room_width, self.room_height))
-        self.pre_render_background_surf.set_colorkey("red")
-        self.pre_render_background_surf.fill("red")
-        # Pre render foreground surf
-        self.pre_render_foreground_surf: pg.Surface = pg.Surface((self.room_width, self.room_height))
-        self.pre_render_foreground_surf.set_colorkey("red")
-        self.pre_render_foreground_surf.fill("red")
+        # Pre render background, in chunks the camera sees
+        self.background_chunk_renderer: ChunkRenderer = ChunkRenderer(
+            self.room_width, self.room_height, CHUNK_SIZE, CHUNK_RENDERER_MAX_CHUNKS, self._bake_background_chunk
+        )
+        # Pre render foreground, in chunks the camera sees
+        self.foreground_chunk_renderer: ChunkRenderer = ChunkRenderer(
+            self.room_width, self.room_height, CHUNK_SIZE, CHUNK_RENDERER_MAX_CHUNKS, self._bake_foreground_chunk
+        )
 
         # Flag indicator to update pre render surf when collision map is PATCHED
         self.is_pre_render_collision_map_list_mutated: bool = False
+        # Cells PATCHED since the last pre render update, only these are baked again
+        self.pre_render_dirty_cells: set[tuple[int, int]] = set()
 
         # File name is room name to be saved JSON
         self.file_name: str = ""
@@ -694,6 +713,11 @@ class RoomJsonGenerator:
         # Clear
         NATIVE_SURF.fill(self.clear_color)
 
+        # Play test? Draw the world in between the last 2 updates
+        # Editor cursor reads camera rect, so edit mode draws the simulated position
+        if self.is_play_test_mode:
+            self.camera.interpolate_rect(self.interpolation_alpha)
+
         # Store surfs to be drawn with fblits for performance
         blit_sequence: list[
             # List of tuples = (surf, coord)
@@ -706,16 +730,8 @@ class RoomJsonGenerator:
             if parallax_background is not None:
                 blit_sequence = parallax_background.draw(blit_sequence)
 
-        # Collect pre render background surf
-        blit_sequence.append(
-            (
-                self.pre_render_background_surf,
-                (
-                    -self.camera.rect.x,
-                    -self.camera.rect.y,
-                ),
-            )
-        )
+        # Collect pre render background chunks the camera sees
+        self.background_chunk_renderer.draw(self.camera.rect, blit_sequence)
 
         # Collect static actor pre renders
         for static_actor_instance in self.sprite_sheet_static_actor_instance_dict.values():
@@ -727,16 +743,14 @@ class RoomJsonGenerator:
         # TODO: Draw enemies first?
 
         # Draw player
-        self.player.draw()
-
-        # Draw the pre render foreground
-        NATIVE_SURF.blit(
-            self.pre_render_foreground_surf,
-            (
-                -self.camera.rect.x,
-                -self.camera.rect.y,
-            ),
-        )
+        self.player.draw(self.interpolation_alpha if self.is_play_test_mode else 1.0)
+
+        # Draw the pre render foreground chunks the camera sees
+        NATIVE_SURF.fblits(self.foreground_chunk_renderer.draw(self.camera.rect, []))
+
+        # Play test? Put camera back to the simulated position
+        if self.is_play_test_mode:
+            self.camera.restore_rect()
 
         # In editing mode?
         if not self.is_play_test_mode:
@@ -941,20 +955,11 @@ class RoomJsonGenerator:
                 sprite_sheet_metadata_instance = instance_sprite_sheet_metadata(sprite_sheet_json_dict_from_disk)
 
                 # Get sprite_sheet_png_name
+                self.sprite_sheet_json_path = self.input_text
                 self.sprite_sheet_png_name = sprite_sheet_metadata_instance.sprite_sheet_png_name
 
-                # Turn sprite_sheet_png_name to sprite_sheet_png_path
-                sprite_sheet_png_path: str = get_one_target_dict_value(
-                    key=self.sprite_sheet_png_name,
-                    key_type=str,
-                    target_dict=PNGS_PATHS_DICT,
-                    target_dict_name="PNGS_PATHS_DICT",
-                )
-                # Turn sprite_sheet_png_path to sprite_sheet_surf
-                self.sprite_sheet_surf = pg.image.load(sprite_sheet_png_path).convert_alpha()
-
                 # Get stage binded data with sprite_sheet_png_name
-                self.sprite_sheet_static_actor_surfs_dict = self.game.get_sprite_sheet_static_actor_surfs_dict(
+                self.sprite_sheet_static_actor_json_paths_dict = self.game.get_sprite_sheet_static_actor_json_paths_dict(
                     self.sprite_sheet_png_name
                 )
                 self.sprite_sheet_static_actor_jsons_dict = self.game.get_sprite_sheet_static_actor_jsons_dict(
@@ -964,6 +969,12 @@ class RoomJsonGenerator:
                     self.sprite_sheet_png_name
                 )
 
+                # Pack the sprite sheet regions and static actor frames, cached on disk after the first time
+                self.texture_atlas = self.game.get_sprite_sheet_texture_atlas(
+                    sprite_sheet_metadata_instance,
+                    self.sprite_sheet_static_actor_jsons_dict,
+                )
+
                 # Prepare button list to feed button container
                 buttons: list[Button] = []
 
@@ -987,14 +998,15 @@ class RoomJsonGenerator:
                         text_topleft=(53, 2),
                         description_text=sprite_metadata_instance.sprite_type,
                     )
-                    # Create button icon from SpriteSheetMetadata surf with this SpriteMetadata region
-                    subsurf: pg.Surface = self.sprite_sheet_surf.subsurface(
+                    # Create button icon from the texture atlas with this SpriteMetadata region
+                    subsurf: pg.Surface = self.texture_atlas.get_subsurf(
+                        self.sprite_sheet_png_name,
                         (
                             sprite_metadata_instance.x,
                             sprite_metadata_instance.y,
                             sprite_metadata_instance.width,
                             sprite_metadata_instance.height,
-                        )
+                        ),
                     )
                     button = self._create_button_icons(
                         subsurf,
@@ -1027,12 +1039,6 @@ class RoomJsonGenerator:
                             self.foreground_total_layers = sprite_metadata_instance.sprite_layer
                     # This SpriteMetadata is a static_actor?
                     elif sprite_metadata_instance.sprite_type == "static_actor":
-                        # Static actor surf not in binded?
-                        if sprite_metadata_instance.sprite_name not in self.sprite_sheet_static_actor_surfs_dict:
-                            # Raise exception
-                            raise ValueError(
-                                f"{sprite_metadata_instance.sprite_name} is not in sprite_sheet_static_actor_surfs_dict"
-                            )
                         # Static actor json not in binded?
                         if sprite_metadata_instance.sprite_name not in self.sprite_sheet_static_actor_jsons_dict:
                             # Raise exception
@@ -1044,13 +1050,6 @@ class RoomJsonGenerator:
                         if self.static_actor_total_layers < sprite_metadata_instance.sprite_layer:
                             self.static_actor_total_layers = sprite_metadata_instance.sprite_layer
 
-                        # Get this static actor surf
-                        static_actor_surf: pg.Surface = get_one_target_dict_value(
-                            key=sprite_metadata_instance.sprite_name,
-                            key_type=str,
-                            target_dict=self.sprite_sheet_static_actor_surfs_dict,
-                            target_dict_name="self.sprite_sheet_static_actor_surfs_dict",
-                        )
                         # Get this static actor json dict {anim name: anim metadata instance}
                         static_actor_animation_metadata_instance: dict[str, AnimationMetadata] = get_one_target_dict_value(
                             key=sprite_metadata_instance.sprite_name,
@@ -1058,13 +1057,15 @@ class RoomJsonGenerator:
                             target_dict=self.sprite_sheet_static_actor_jsons_dict,
                             target_dict_name="self.sprite_sheet_static_actor_jsons_dict",
                         )
+                        # Get its atlas page and the json dict with frames moved to the page
+                        static_actor_surf, static_actor_animation_metadata_instance = self.texture_atlas.remap_animation_data(
+                            static_actor_animation_metadata_instance
+                        )
                         # Instance this new static actor
                         new_static_actor_instance = StaticActor(
                             static_actor_surf,
                             self.camera,
                             static_actor_animation_metadata_instance,
-                            self.room_width,
-                            self.room_height,
                             self.room_width_tu,
                             self.room_height_tu,
                         )
@@ -1080,33 +1081,37 @@ class RoomJsonGenerator:
 
                 # Init background layers collision map
                 for _ in range(self.background_total_layers):
-                    self.background_collision_map_list.append(
-                        [0 for _ in range(self.room_width_tu * self.room_height_tu)],
-                    )
+                    self.background_collision_map_list.append(TileLayer(self.room_width_tu, self.room_height_tu))
                 # Init static actor layers collision map
                 for _ in range(self.static_actor_total_layers):
-                    self.static_actor_collision_map_list.append(
-                        [0 for _ in range(self.room_width_tu * self.room_height_tu)],
-                    )
+                    self.static_actor_collision_map_list.append(TileLayer(self.room_width_tu, self.room_height_tu))
                 # Init solids collision map (1 layer only for ceramic floor, cave floor, ...)
-                self.solid_collision_map_list = [0 for _ in range(self.room_width_tu * self.room_height_tu)]
+                self.solid_collision_map_list = TileLayer(self.room_width_tu, self.room_height_tu)
                 # Init foreground layers collision map
                 for _ in range(self.foreground_total_layers):
-                    self.foreground_collision_map_list.append(
-                        [0 for _ in range(self.room_width_tu * self.room_height_tu)],
-                    )
+                    self.foreground_collision_map_list.append(TileLayer(self.room_width_tu, self.room_height_tu))
 
                 # Update dynamic actors's solid collision map list (dynamic needs ref to solids)
                 self.player.set_solid_collision_map_list(self.solid_collision_map_list)
+                # Update static actors's collision map list, they draw from it
+                for static_actor_name, static_actor_instance in self.sprite_sheet_static_actor_instance_dict.items():
+                    static_actor_instance.set_collision_map_list(
+                        self.static_actor_collision_map_list[
+                            self.sprite_name_to_sprite_metadata[static_actor_name].sprite_layer - 1
+                        ]
+                    )
 
-                # Init pre render background surf
-                self.pre_render_background_surf = pg.Surface((self.room_width, self.room_height))
-                self.pre_render_background_surf.set_colorkey("red")
-                self.pre_render_background_surf.fill("red")
-                # Init pre render foreground surf
-                self.pre_render_foreground_surf = pg.Surface((self.room_width, self.room_height))
-                self.pre_render_foreground_surf.set_colorkey("red")
-                self.pre_render_foreground_surf.fill("red")
+                # New layers, cells dirty in the old ones are gone
+                self.pre_render_dirty_cells.clear()
+
+                # Init pre render background, in chunks the camera sees
+                self.background_chunk_renderer = ChunkRenderer(
+                    self.room_width, self.room_height, CHUNK_SIZE, CHUNK_RENDERER_MAX_CHUNKS, self._bake_background_chunk
+                )
+                # Init pre render foreground, in chunks the camera sees
+                self.foreground_chunk_renderer = ChunkRenderer(
+                    self.room_width, self.room_height, CHUNK_SIZE, CHUNK_RENDERER_MAX_CHUNKS, self._bake_foreground_chunk
+                )
 
                 # Init player
                 # Construct sprite metadata
@@ -1184,6 +1189,12 @@ class RoomJsonGenerator:
                     self.cursor_height = TILE_SIZE
                     self.cursor_width_tu = 1
                     self.cursor_height_tu = 1
+
+                # REMOVE IN BUILD
+                # Hot reload, watch what the texture atlas and the pre renders are made of
+                if IS_HOT_RELOAD:
+                    self._watch_sprite_sheet_files()
+
                 # Exit
                 self.curtain.go_to_opaque()
             else:
@@ -1250,7 +1261,7 @@ class RoomJsonGenerator:
 
                 if selected_sprite_type == "static_actor":
                     # Get static_actor collision map LAYER
-                    selected_static_actor_layer_collision_map: list[int] = self.static_actor_collision_map_list[
+                    selected_static_actor_layer_collision_map: TileLayer = self.static_actor_collision_map_list[
                         selected_sprite_layer_index
                     ]
                     # Get the selected static actor
@@ -1296,10 +1307,6 @@ class RoomJsonGenerator:
                                 collision_map_list=selected_static_actor_layer_collision_map,
                                 is_update_pre_render=False,
                             )
-                            # Update pre render frame surfs based on collision map
-                            selected_static_actor_instance.update_pre_render_frame_surfs(
-                                collision_map_list=selected_static_actor_layer_collision_map,
-                            )
 
                 #############################
                 # PARALLAX BACKGROUND STATE #
@@ -1310,8 +1317,9 @@ class RoomJsonGenerator:
                     # Lmb just pressed #
                     ####################
                     if self.game_event_handler.is_lmb_just_pressed:
-                        # This layer is None?
-                        if self.parallax_background_instances_list[selected_sprite_layer_index] is None:
+                        # This layer is None? Atlas is set with the sprite sheet, before edit room
+                        is_layer_none: bool = self.parallax_background_instances_list[selected_sprite_layer_index] is None
+                        if is_layer_none and self.texture_atlas is not None:
                             # Get binded mem with name
                             parallax_background_mem = get_one_target_dict_value(
                                 key=self.selected_sprite_name,
@@ -1319,15 +1327,30 @@ class RoomJsonGenerator:
                                 target_dict=self.sprite_sheet_parallax_background_mems_dict,
                                 target_dict_name="self.sprite_sheet_parallax_background_mems_dict",
                             )
+                            # Get its atlas page and region on it
+                            parallax_background_surf, (
+                                parallax_background_x,
+                                parallax_background_y,
+                                _,
+                                _,
+                            ) = self.texture_atlas.get_region(
+                                self.sprite_sheet_png_name,
+                                (
+                                    selected_sprite_x,
+                                    selected_sprite_y,
+                                    self.sprite_metadata_instance.width,
+                                    self.sprite_metadata_instance.height,
+                                ),
+                            )
                             # Create new parallax background instance
                             new_parallax_background_instance = parallax_background_mem(
-                                self.sprite_sheet_surf,
+                                parallax_background_surf,
                                 self.camera,
                                 selected_sprite_name,
                                 self.sprite_metadata_instance.width,
                                 self.sprite_metadata_instance.height,
-                                selected_sprite_x,
-                                selected_sprite_y,
+                                parallax_background_x,
+                                parallax_background_y,
                             )
                             # Fill with new parallax background instance
                             self.parallax_background_instances_list[
@@ -1349,9 +1372,9 @@ class RoomJsonGenerator:
 
                 elif selected_sprite_type == "background":
                     # Get background collision map LAYER
-                    selected_background_layer_collision_map: list[
-                        int | NoneOrBlobSpriteMetadata
-                    ] = self.background_collision_map_list[selected_sprite_layer_index]
+                    selected_background_layer_collision_map: TileLayer = self.background_collision_map_list[
+                        selected_sprite_layer_index
+                    ]
 
                     #############################
                     # Combined rect paint state #
@@ -1410,7 +1433,7 @@ class RoomJsonGenerator:
 
                             if selected_sprite_tile_type == "none":
 
-                                def _flood_fill_callback(world_tu_x: int, world_tu_y: int, collision_map_list: list) -> None:
+                                def _flood_fill_callback(world_tu_x: int, world_tu_y: int, collision_map_list: TileLayer) -> None:
                                     self._on_lmb_just_pressed_none_tile_type(
                                         # The selected collision map
                                         collision_map_list,
@@ -1438,7 +1461,7 @@ class RoomJsonGenerator:
 
                             if selected_sprite_tile_type != "none":
 
-                                def _flood_fill_callback(world_tu_x: int, world_tu_y: int, collision_map_list: list) -> None:
+                                def _flood_fill_callback(world_tu_x: int, world_tu_y: int, collision_map_list: TileLayer) -> None:
                                     self._on_lmb_just_pressed_blob_tile_type(
                                         # The selected collision map
                                         collision_map_list,
@@ -1580,7 +1603,7 @@ class RoomJsonGenerator:
 
                             if selected_sprite_tile_type == "none":
 
-                                def _flood_fill_callback(world_tu_x: int, world_tu_y: int, collision_map_list: list) -> None:
+                                def _flood_fill_callback(world_tu_x: int, world_tu_y: int, collision_map_list: TileLayer) -> None:
                                     self._on_lmb_just_pressed_none_tile_type(
                                         # The selected collision map
                                         collision_map_list,
@@ -1610,7 +1633,7 @@ class RoomJsonGenerator:
 
                             if selected_sprite_tile_type != "none":
 
-                                def _flood_fill_callback(world_tu_x: int, world_tu_y: int, collision_map_list: list) -> None:
+                                def _flood_fill_callback(world_tu_x: int, world_tu_y: int, collision_map_list: TileLayer) -> None:
                                     # Really slow but it works
                                     self._on_lmb_just_pressed_blob_tile_type(
                                         # The selected collision map
@@ -1762,7 +1785,7 @@ class RoomJsonGenerator:
 
                             if selected_sprite_tile_type == "none":
 
-                                def _flood_fill_callback(world_tu_x: int, world_tu_y: int, collision_map_list: list) -> None:
+                                def _flood_fill_callback(world_tu_x: int, world_tu_y: int, collision_map_list: TileLayer) -> None:
                                     self._on_lmb_just_pressed_none_tile_type(
                                         # The selected collision map
                                         collision_map_list,
@@ -1792,7 +1815,7 @@ class RoomJsonGenerator:
 
                             if selected_sprite_tile_type != "none":
 
-                                def _flood_fill_callback(world_tu_x: int, world_tu_y: int, collision_map_list: list) -> None:
+                                def _flood_fill_callback(world_tu_x: int, world_tu_y: int, collision_map_list: TileLayer) -> None:
                                     # Really slow but it works
                                     self._on_lmb_just_pressed_blob_tile_type(
                                         # The selected collision map
@@ -1888,9 +1911,9 @@ class RoomJsonGenerator:
                 ####################
                 elif selected_sprite_type == "foreground":
                     # Get background layer collision map
-                    selected_foreground_layer_collision_map: list[
-                        int | NoneOrBlobSpriteMetadata
-                    ] = self.foreground_collision_map_list[selected_sprite_layer_index]
+                    selected_foreground_layer_collision_map: TileLayer = self.foreground_collision_map_list[
+                        selected_sprite_layer_index
+                    ]
 
                     #############################
                     # Combined rect paint state #
@@ -1949,7 +1972,7 @@ class RoomJsonGenerator:
 
                             if selected_sprite_tile_type == "none":
 
-                                def _flood_fill_callback(world_tu_x: int, world_tu_y: int, collision_map_list: list) -> None:
+                                def _flood_fill_callback(world_tu_x: int, world_tu_y: int, collision_map_list: TileLayer) -> None:
                                     self._on_lmb_just_pressed_none_tile_type(
                                         # The selected collision map
                                         collision_map_list,
@@ -1977,7 +2000,7 @@ class RoomJsonGenerator:
 
                             if selected_sprite_tile_type != "none":
 
-                                def _flood_fill_callback(world_tu_x: int, world_tu_y: int, collision_map_list: list) -> None:
+                                def _flood_fill_callback(world_tu_x: int, world_tu_y: int, collision_map_list: TileLayer) -> None:
                                     # Really slow but it works
                                     self._on_lmb_just_pressed_blob_tile_type(
                                         # The selected collision map
@@ -2058,9 +2081,9 @@ class RoomJsonGenerator:
                                     selected_foreground_layer_collision_map,
                                 )
 
-                # Update pre render
+                # Update pre render, only the patched cells
                 if self.is_pre_render_collision_map_list_mutated:
-                    self._update_pre_render()
+                    self._update_pre_render_dirty_cells()
 
                 # Jump just pressed, go to pallete
                 if self.game_event_handler.is_jump_just_pressed:
@@ -2087,6 +2110,8 @@ class RoomJsonGenerator:
                 # Toggle play test or edit mode
                 self.is_play_test_mode = not self.is_play_test_mode
                 if self.is_play_test_mode:
+                    # Player may be moved in edit mode, do not interpolate from there
+                    self.player.reset_previous_position()
                     self.camera.set_target_vector(self.player.camera_anchor_vector)
                 else:
                     self.camera.set_target_vector(self.camera_anchor_vector)
@@ -2320,8 +2345,12 @@ class RoomJsonGenerator:
     ########
     # DRAW #
     ########
-    def draw(self) -> None:
+    def draw(self, interpolation_alpha: float = 1.0) -> bool:
+        self.interpolation_alpha = interpolation_alpha
         self.state_machine_draw.handle(0)
+        # Editor redraws everything every frame, does not report dirty rects
+        self.game.set_is_full_redraw(True)
+        return True
 
     ##########
     # UPDATE #
@@ -2352,7 +2381,7 @@ class RoomJsonGenerator:
         self,
         world_tu_x: int,
         world_tu_y: int,
-        collision_map_list: list[int | NoneOrBlobSpriteMetadata],
+        collision_map_list: TileLayer,
         callback: Callable,
     ) -> None:
         """
@@ -2408,7 +2437,7 @@ class RoomJsonGenerator:
         selected_static_actor_instance: StaticActor,
         world_mouse_tu_x: int,
         world_mouse_tu_y: int,
-        collision_map_list: list[int],
+        collision_map_list: TileLayer,
     ) -> None:
         """
         | Logic for static actor lmb pressed.
@@ -2435,10 +2464,6 @@ class RoomJsonGenerator:
                 collision_map_list=collision_map_list,
                 is_update_pre_render=False,
             )
-            # Update STATIC ACTOR'S PRE RENDER frame surfs based on collision map
-            selected_static_actor_instance.update_pre_render_frame_surfs(
-                collision_map_list,
-            )
 
     def _change_update_and_draw_state_machine(self, value: Enum) -> None:
         """
@@ -2467,7 +2492,7 @@ class RoomJsonGenerator:
 
         # Draw cursor
         # Get mouse position
-        mouse_position_tuple: tuple[int, int] = pg.mouse.get_pos()
+        mouse_position_tuple: tuple[int, int] = self.game_event_handler.mouse_position_tuple
         mouse_position_x_tuple: int = mouse_position_tuple[0]
         mouse_position_y_tuple: int = mouse_position_tuple[1]
         # Scale mouse position
@@ -2561,76 +2586,259 @@ class RoomJsonGenerator:
         # Return the button
         return button
 
+    def _watch_sprite_sheet_files(self) -> None:
+        """
+        | Watch the sprite sheet JSON, the static actor JSONs and every png they use.
+        | Changes go to on watched files changed.
+        | Runs on every sprite sheet confirm, files of the previous sprite sheet are unwatched first.
+        """
+
+        # Watched before? Start over, else each confirm adds its callback again
+        self.game.file_watcher.unwatch_owner(self)
+
+        # {png path : png name}, the stage png and the static actor pngs
+        png_names: list[str] = [self.sprite_sheet_png_name]
+        for animation_data in self.sprite_sheet_static_actor_jsons_dict.values():
+            for animation_metadata in animation_data.values():
+                png_names.append(animation_metadata.sprite_sheet_png_name)
+        self.watched_png_paths_dict = {
+            get_one_target_dict_value(
+                key=png_name,
+                key_type=str,
+                target_dict=PNGS_PATHS_DICT,
+                target_dict_name="PNGS_PATHS_DICT",
+            ): png_name
+            for png_name in png_names
+        }
+
+        # Watch them all with 1 callback, it gets every change of a poll at once
+        for path in [
+            self.sprite_sheet_json_path,
+            *self.sprite_sheet_static_actor_json_paths_dict.values(),
+            *self.watched_png_paths_dict,
+        ]:
+            self.game.file_watcher.watch(path, self, self._on_watched_files_changed)
+
+    def _on_watched_files_changed(self, changed_paths: list[str]) -> None:
+        """
+        | Hot reload, the file watcher calls this with the changed watched paths.
+        |
+        | A file that fails to load, like a half saved JSON or a removed sprite, prints its error.
+        | Everything keeps its previous atlas, animation data and pre renders.
+        | Its changed paths are reloaded again with the next change.
+        """
+
+        # Failed before? Reload those paths too, once each
+        changed_paths = list(dict.fromkeys([*self.hot_reload_failed_paths, *changed_paths]))
+
+        # JSON syntax errors are value errors too, removed sprites or actors are key errors
+        try:
+            self._hot_reload(changed_paths)
+        except (OSError, ValueError, KeyError) as error:
+            print(f"Hot reload failed, kept the previous sprite sheet: {error!r}")
+            self.hot_reload_failed_paths = changed_paths
+            return
+
+        self.hot_reload_failed_paths = []
+
+    def _hot_reload(self, changed_paths: list[str]) -> None:
+        """
+        | Rebuilds the texture atlas, it is cached by content hash so only a real change repacks.
+        | Then re-bakes only what depends on the changed files.
+        | Sprite sheet JSON or png? The tile pre renders and the placed parallax backgrounds.
+        | Static actor JSON or png? That static actor animation data and pre render frames.
+        |
+        | Everything new is made first and swapped in last, so a raise leaves the scene as it was.
+        |
+        | Sprite regions may move and grow, new sprites or layers need the scene entered again.
+        | Palette icons keep their old pixels until then.
+        """
+
+        # Changed png names, and is it the stage sprite sheet
+        changed_png_names: set[str] = {
+            self.watched_png_paths_dict[path] for path in changed_paths if path in self.watched_png_paths_dict
+        }
+        is_sprite_sheet_changed: bool = (
+            self.sprite_sheet_json_path in changed_paths or self.sprite_sheet_png_name in changed_png_names
+        )
+
+        # Read the JSONs again, GET sees their new modified time, then pack with the new pngs
+        sprite_sheet_metadata_instance = instance_sprite_sheet_metadata(
+            self.game.GET_file_from_disk_dynamic_path(self.sprite_sheet_json_path)
+        )
+        sprite_sheet_static_actor_jsons_dict = self.game.get_sprite_sheet_static_actor_jsons_dict(self.sprite_sheet_png_name)
+        texture_atlas = self.game.get_sprite_sheet_texture_atlas(
+            sprite_sheet_metadata_instance,
+            sprite_sheet_static_actor_jsons_dict,
+        )
+
+        # Sprite sheet changed? Regions may have moved, selected sprite too
+        sprite_name_to_sprite_metadata: dict[str, SpriteMetadata] = self.sprite_name_to_sprite_metadata
+        selected_sprite_metadata_instance: SpriteMetadata = self.sprite_metadata_instance
+        parallax_background_instances_list: list[None | ParallaxBackground] = self.parallax_background_instances_list
+        if is_sprite_sheet_changed:
+            # Looked up in the reloaded sprites only, a removed sprite in use raises
+            reloaded_sprite_name_to_sprite_metadata: dict[str, SpriteMetadata] = {
+                sprite_metadata_instance.sprite_name: sprite_metadata_instance
+                for sprite_metadata_instance in sprite_sheet_metadata_instance.sprites_list
+            }
+            sprite_name_to_sprite_metadata = {**self.sprite_name_to_sprite_metadata, **reloaded_sprite_name_to_sprite_metadata}
+            selected_sprite_metadata_instance = reloaded_sprite_name_to_sprite_metadata[self.sprite_metadata_instance.sprite_name]
+
+            # Make the placed parallax backgrounds again from their region on the new atlas
+            parallax_background_instances_list = []
+            for parallax_background_instance in self.parallax_background_instances_list:
+                if parallax_background_instance is None:
+                    parallax_background_instances_list.append(None)
+                    continue
+                sprite_metadata_instance = reloaded_sprite_name_to_sprite_metadata[parallax_background_instance.sprite_name]
+                parallax_background_surf, (parallax_background_x, parallax_background_y, _, _) = texture_atlas.get_region(
+                    self.sprite_sheet_png_name,
+                    (
+                        sprite_metadata_instance.x,
+                        sprite_metadata_instance.y,
+                        sprite_metadata_instance.width,
+                        sprite_metadata_instance.height,
+                    ),
+                )
+                parallax_background_instances_list.append(
+                    type(parallax_background_instance)(
+                        parallax_background_surf,
+                        self.camera,
+                        parallax_background_instance.sprite_name,
+                        sprite_metadata_instance.width,
+                        sprite_metadata_instance.height,
+                        parallax_background_x,
+                        parallax_background_y,
+                    )
+                )
+
+        # Static actors whose JSON or png changed, remap their animation data on the new atlas
+        static_actor_remaps: list[tuple[StaticActor, pg.Surface, dict[str, AnimationMetadata]]] = []
+        for static_actor_name, static_actor_instance in self.sprite_sheet_static_actor_instance_dict.items():
+            static_actor_animation_data: dict[str, AnimationMetadata] = sprite_sheet_static_actor_jsons_dict[static_actor_name]
+            if self.sprite_sheet_static_actor_json_paths_dict[static_actor_name] not in changed_paths and not any(
+                animation_metadata.sprite_sheet_png_name in changed_png_names
+                for animation_metadata in static_actor_animation_data.values()
+            ):
+                continue
+            static_actor_surf, static_actor_animation_data = texture_atlas.remap_animation_data(static_actor_animation_data)
+            static_actor_remaps.append((static_actor_instance, static_actor_surf, static_actor_animation_data))
+
+        # Everything loaded, swap it in
+        self.sprite_sheet_static_actor_jsons_dict = sprite_sheet_static_actor_jsons_dict
+        self.texture_atlas = texture_atlas
+        self.sprite_name_to_sprite_metadata = sprite_name_to_sprite_metadata
+        self.sprite_metadata_instance = selected_sprite_metadata_instance
+        self.parallax_background_instances_list = parallax_background_instances_list
+        for static_actor_instance, static_actor_surf, static_actor_animation_data in static_actor_remaps:
+            static_actor_instance.set_animation_data(static_actor_surf, static_actor_animation_data)
+
+        # Sprite sheet changed? Bake tiles again
+        if is_sprite_sheet_changed:
+            self._update_pre_render()
+
     def _update_pre_render(self) -> None:
         """
-        | Get new surfs for pre renders.
-        | Iter the collision map to draw on it.
+        | Drop every baked chunk of the pre renders.
+        | Chunks are baked again from the collision maps when the camera sees them.
+        |
+        | For a new room or new sprite sheet pixels.
+        | Patched cells use update pre render dirty cells instead.
         """
 
-        # Clear pre render, make new ones so it does not build up data
-        # Pre render background
-        self.pre_render_background_surf = pg.Surface((self.room_width, self.room_height))
-        self.pre_render_background_surf.set_colorkey("red")
-        self.pre_render_background_surf.fill("red")
-        # Pre render foreground
-        self.pre_render_foreground_surf = pg.Surface((self.room_width, self.room_height))
-        self.pre_render_foreground_surf.set_colorkey("red")
-        self.pre_render_foreground_surf.fill("red")
+        # Every cell is baked again, nothing is left dirty
+        self.pre_render_dirty_cells.clear()
 
-        # Iter over each background collision map layer, flatten it and removes all 0
-        valid_cells = [cell for collision_map in self.background_collision_map_list for cell in collision_map if cell != 0]
-        for cell in valid_cells:
-            # Make sure value is a NoneOrBlobSpriteMetadata
-            if not isinstance(cell, NoneOrBlobSpriteMetadata):
-                raise ValueError("background_collision_map_list can only hold int or NoneOrBlobSpriteMetadata")
-
-            # Unpack NoneOrBlobSpriteMetadata
-            x = cell.x
-            y = cell.y
-            region_x = cell.region_x
-            region_y = cell.region_y
-            # Draw each one on pre_render_background
-            if self.sprite_sheet_surf is not None:
-                # Cannot use fblits because this has regions
-                self.pre_render_background_surf.blit(self.sprite_sheet_surf, (x, y), (region_x, region_y, TILE_SIZE, TILE_SIZE))
-
-        # Iter over cells, removes all 0
-        valid_cells = [cell for cell in self.solid_collision_map_list if cell != 0]
-        for cell in valid_cells:
-            # Make sure value is a NoneOrBlobSpriteMetadata
-            if not isinstance(cell, NoneOrBlobSpriteMetadata):
-                raise ValueError("foreground_collision_map_list can only hold int or NoneOrBlobSpriteMetadata")
-
-            # Unpack NoneOrBlobSpriteMetadata
-            x = cell.x
-            y = cell.y
-            region_x = cell.region_x
-            region_y = cell.region_y
-            # Draw each one on pre render
-            if self.sprite_sheet_surf is not None:
-                # Cannot use fblits because this has regions
-                self.pre_render_foreground_surf.blit(self.sprite_sheet_surf, (x, y), (region_x, region_y, TILE_SIZE, TILE_SIZE))
-
-        # Iter over each foreground collision map layer, flatten it and removes all 0
-        valid_cells = [cell for collision_map in self.foreground_collision_map_list for cell in collision_map if cell != 0]
-        for cell in valid_cells:
+        # Drop the chunks
+        self.background_chunk_renderer.clear()
+        self.foreground_chunk_renderer.clear()
+
+    def _update_pre_render_dirty_cells(self) -> None:
+        """
+        | Bake again only the cells patched since the last pre render update, in the resident chunks.
+        | Autotiled neighbors are set through set tile, so they are dirty too.
+        |
+        | Each dirty cell is cleared on both pre renders, then every layer tile on it is drawn again, in layer order.
+        | Tiles never cross their cell, so the cells around are untouched.
+        | Cost grows with the patched cells, not with the room size.
+        """
+
+        for world_tu_x, world_tu_y in self.pre_render_dirty_cells:
+            cell_rect: pg.Rect = pg.Rect(world_tu_x * TILE_SIZE, world_tu_y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+            self.background_chunk_renderer.update_rect(cell_rect)
+            self.foreground_chunk_renderer.update_rect(cell_rect)
+        self.pre_render_dirty_cells.clear()
+
+    def _bake_background_chunk(self, chunk_surf: pg.Surface, chunk_rect: pg.Rect, dirty_rect: pg.Rect, _variant: int) -> None:
+        """
+        | Background chunk renderer bake callback.
+        """
+
+        self._bake_chunk(self.background_collision_map_list, chunk_surf, chunk_rect, dirty_rect)
+
+    def _bake_foreground_chunk(self, chunk_surf: pg.Surface, chunk_rect: pg.Rect, dirty_rect: pg.Rect, _variant: int) -> None:
+        """
+        | Foreground chunk renderer bake callback, solid is drawn under the foreground layers.
+        """
+
+        self._bake_chunk([self.solid_collision_map_list, *self.foreground_collision_map_list], chunk_surf, chunk_rect, dirty_rect)
+
+    def _bake_chunk(
+        self,
+        collision_maps: list[TileLayer],
+        chunk_surf: pg.Surface,
+        chunk_rect: pg.Rect,
+        dirty_rect: pg.Rect,
+    ) -> None:
+        """
+        | Draw every tile of these layers in the dirty rect on a chunk, in layer order.
+        | Tile position is its cell minus the chunk topleft.
+        """
+
+        # No sprite sheet yet? Nothing to draw
+        if self.texture_atlas is None:
+            return
+
+        # Cells under the dirty rect
+        dirty_tu_x: int = dirty_rect.x // TILE_SIZE
+        dirty_tu_y: int = dirty_rect.y // TILE_SIZE
+        dirty_width_tu: int = (dirty_rect.right - 1) // TILE_SIZE - dirty_tu_x + 1
+        dirty_height_tu: int = (dirty_rect.bottom - 1) // TILE_SIZE - dirty_tu_y + 1
+
+        # Store tile surfs to be drawn with fblits for performance
+        blit_sequence: list[
+            # List of tuples = (surf, coord)
+            tuple[pg.Surface, tuple[int, int]]
+        ] = []
+
+        # Iter over each collision map layer filled cells in the dirty rect
+        for world_tu_x, world_tu_y, cell in (
+            tile
+            for collision_map in collision_maps
+            for tile in collision_map.iter_region_tiles(dirty_tu_x, dirty_tu_y, dirty_width_tu, dirty_height_tu)
+        ):
             # Make sure value is a NoneOrBlobSpriteMetadata
             if not isinstance(cell, NoneOrBlobSpriteMetadata):
-                raise ValueError("foreground_collision_map_list can only hold int or NoneOrBlobSpriteMetadata")
-
-            # Unpack NoneOrBlobSpriteMetadata
-            x = cell.x
-            y = cell.y
-            region_x = cell.region_x
-            region_y = cell.region_y
-            # Draw each one on pre render
-            if self.sprite_sheet_surf is not None:
-                # Cannot use fblits because this has regions
-                self.pre_render_foreground_surf.blit(self.sprite_sheet_surf, (x, y), (region_x, region_y, TILE_SIZE, TILE_SIZE))
+                raise ValueError("collision map lists can only hold int or NoneOrBlobSpriteMetadata")
+
+            # Collect each one, tiles are atlas subsurfs so one fblits draws them all
+            blit_sequence.append(
+                (
+                    self.texture_atlas.get_subsurf(
+                        self.sprite_sheet_png_name,
+                        (cell.region_x, cell.region_y, TILE_SIZE, TILE_SIZE),
+                    ),
+                    (world_tu_x * TILE_SIZE - chunk_rect.x, world_tu_y * TILE_SIZE - chunk_rect.y),
+                )
+            )
+
+        # Draw the collected tiles
+        chunk_surf.fblits(blit_sequence)
 
     def _on_rmb_just_pressed_none_tile_type(
         self,
-        collision_map_list: list[int | NoneOrBlobSpriteMetadata],
+        collision_map_list: TileLayer,
     ) -> None:
         """
         | Click filled tile. Erase and set to 0.
@@ -2640,7 +2848,7 @@ class RoomJsonGenerator:
 
     def _on_rmb_just_pressed_blob_tile_type(
         self,
-        collision_map_list: list[int | NoneOrBlobSpriteMetadata],
+        collision_map_list: TileLayer,
     ) -> None:
         """
         | Click filled tile. Erase and set to 0.
@@ -2716,7 +2924,7 @@ class RoomJsonGenerator:
 
     def _on_lmb_just_pressed_none_tile_type(
         self,
-        collision_map_list: list[int | NoneOrBlobSpriteMetadata],
+        collision_map_list: TileLayer,
         selected_sprite_x: int,
         selected_sprite_y: int,
         world_tu_x: int,
@@ -2743,7 +2951,7 @@ class RoomJsonGenerator:
 
     def _on_lmb_just_pressed_blob_tile_type(
         self,
-        collision_map_list: list[int | NoneOrBlobSpriteMetadata],
+        collision_map_list: TileLayer,
         selected_sprite_x: int,
         selected_sprite_y: int,
         selected_sprite_tile_type: str,
@@ -2764,20 +2972,15 @@ class RoomJsonGenerator:
         )
         # Cell is empty
         if found_tile == 0:
-            # Construct sprite metadata
+            # Get the shared sprite metadata of this sprite variant
             world_snapped_x = world_tu_x * TILE_SIZE
             world_snapped_y = world_tu_y * TILE_SIZE
-            new_none_or_blob_sprite_metadata_dict: dict = {
-                "name": selected_sprite_name,
-                "type": self.sprite_metadata_instance.sprite_type,
-                "x": world_snapped_x,
-                "y": world_snapped_y,
-                "region_x": selected_sprite_x,
-                "region_y": selected_sprite_y,
-            }
-
-            # Turn into sprite metadata instance
-            none_or_blob_sprite_metadata_instance = instance_none_or_blob_sprite_metadata(new_none_or_blob_sprite_metadata_dict)
+            none_or_blob_sprite_metadata_instance = get_none_or_blob_sprite_metadata(
+                selected_sprite_name,
+                self.sprite_metadata_instance.sprite_type,
+                selected_sprite_x,
+                selected_sprite_y,
+            )
 
             # Fill collision map with sprite name in cursor pos
             self._set_tile_from_collision_map_list(
@@ -2859,7 +3062,7 @@ class RoomJsonGenerator:
         sprite_y: int,
         sprite_world_tu_x: int,
         sprite_world_tu_y: int,
-        selected_layer_collision_map: list[int | NoneOrBlobSpriteMetadata],
+        selected_layer_collision_map: TileLayer,
         sprite_snapped_x: int,
         sprite_snapped_y: int,
         sprite_name: str,
@@ -2905,18 +3108,13 @@ class RoomJsonGenerator:
             sprite_x_with_offset = sprite_x + offset_metadata_instance.x
             sprite_y_with_offset = sprite_y + offset_metadata_instance.y
 
-        # Override this sprite collision with new metadata. Construct sprite metadata
-        new_none_or_blob_sprite_metadata_dict: dict = {
-            "name": sprite_name,
-            "type": self.sprite_metadata_instance.sprite_type,
-            "x": sprite_snapped_x,
-            "y": sprite_snapped_y,
-            "region_x": sprite_x_with_offset,
-            "region_y": sprite_y_with_offset,
-        }
-
-        # Turn into sprite metadata instance
-        none_or_blob_sprite_metadata_instance = instance_none_or_blob_sprite_metadata(new_none_or_blob_sprite_metadata_dict)
+        # Override this sprite collision with new metadata. Get the shared sprite metadata of this sprite variant
+        none_or_blob_sprite_metadata_instance = get_none_or_blob_sprite_metadata(
+            sprite_name,
+            self.sprite_metadata_instance.sprite_type,
+            sprite_x_with_offset,
+            sprite_y_with_offset,
+        )
 
         # Set NoneOrBlobSpriteMetadata to collision map
         self._set_tile_from_collision_map_list(
@@ -2929,29 +3127,30 @@ class RoomJsonGenerator:
 
     def _fill_cursor_region_collision_map_with_0(
         self,
-        collision_map: list[int | NoneOrBlobSpriteMetadata],
+        collision_map: TileLayer,
     ) -> None:
         """
         | Iterate over cursor region and fill it with 0.
         """
 
-        # Iterate cursor region
-        for cursor_tu_x in range(self.cursor_width_tu):
-            for cursor_tu_y in range(self.cursor_height_tu):
-                tu_x = self.world_mouse_tu_x + cursor_tu_x
-                tu_y = self.world_mouse_tu_y + cursor_tu_y
-                # Set 0 to collision map
-                self._set_tile_from_collision_map_list(
-                    world_tu_x=tu_x,
-                    world_tu_y=tu_y,
-                    value=0,
-                    collision_map_list=collision_map,
-                    is_update_pre_render=True,
-                )
+        # Update pre render, on the cursor region cells in the room
+        self.is_pre_render_collision_map_list_mutated = True
+        self.pre_render_dirty_cells.update(
+            (tu_x, tu_y)
+            for tu_x in range(
+                max(self.world_mouse_tu_x, 0), min(self.world_mouse_tu_x + self.cursor_width_tu, self.room_width_tu)
+            )
+            for tu_y in range(
+                max(self.world_mouse_tu_y, 0), min(self.world_mouse_tu_y + self.cursor_height_tu, self.room_height_tu)
+            )
+        )
+
+        # Set 0 to cursor region, 1 slice per row, out of room cells are skipped
+        collision_map.fill_region(self.world_mouse_tu_x, self.world_mouse_tu_y, self.cursor_width_tu, self.cursor_height_tu, 0)
 
     def _fill_cursor_region_collision_map_with_metadata(
         self,
-        collision_map_list: list[int | NoneOrBlobSpriteMetadata],
+        collision_map_list: TileLayer,
         region_x: int,
         region_y: int,
         world_tu_x: int,
@@ -2966,26 +3165,15 @@ class RoomJsonGenerator:
             for cursor_tu_y in range(self.cursor_height_tu):
                 tu_x = world_tu_x + cursor_tu_x
                 tu_y = world_tu_y + cursor_tu_y
-                world_snapped_x = world_tu_x * TILE_SIZE
-                world_snapped_y = world_tu_y * TILE_SIZE
-                world_mouse_x_snapped = world_snapped_x + (cursor_tu_x * TILE_SIZE)
-                world_mouse_y_snapped = world_snapped_y + (cursor_tu_y * TILE_SIZE)
                 region_x_with_offset = region_x + (cursor_tu_x * TILE_SIZE)
                 region_y_with_offset = region_y + (cursor_tu_y * TILE_SIZE)
 
-                # Construct sprite metadata
-                new_none_or_blob_sprite_metadata_dict: dict = {
-                    "name": self.sprite_metadata_instance.sprite_name,
-                    "type": self.sprite_metadata_instance.sprite_type,
-                    "x": world_mouse_x_snapped,
-                    "y": world_mouse_y_snapped,
-                    "region_x": region_x_with_offset,
-                    "region_y": region_y_with_offset,
-                }
-
-                # Turn into sprite metadata instance
-                none_or_blob_sprite_metadata_instance = instance_none_or_blob_sprite_metadata(
-                    new_none_or_blob_sprite_metadata_dict
+                # Get the shared sprite metadata of this sprite variant
+                none_or_blob_sprite_metadata_instance = get_none_or_blob_sprite_metadata(
+                    self.sprite_metadata_instance.sprite_name,
+                    self.sprite_metadata_instance.sprite_type,
+                    region_x_with_offset,
+                    region_y_with_offset,
                 )
 
                 # Set NoneOrBlobSpriteMetadata instance to collision map
@@ -2999,7 +3187,7 @@ class RoomJsonGenerator:
 
     def _is_cursor_region_collision_map_empty(
         self,
-        collision_map: list[int | NoneOrBlobSpriteMetadata],
+        collision_map: TileLayer,
         world_tu_x: int,
         world_tu_y: int,
     ) -> bool:
@@ -3205,17 +3393,17 @@ class RoomJsonGenerator:
         self,
         world_tu_x: int,
         world_tu_y: int,
-        collision_map_list: (list[int] | list[int | NoneOrBlobSpriteMetadata]),
+        collision_map_list: TileLayer,
     ) -> int | NoneOrBlobSpriteMetadata:
         """
         | Returns -1 if out of bounds.
         | Because camera needs extra 1 and thus may get out of bound.
         """
 
-        # In bound?
-        if 0 <= world_tu_x < self.room_width_tu and 0 <= world_tu_y < self.room_height_tu:
+        # In bound or on its border? The layer border is -1
+        if -1 <= world_tu_x <= self.room_width_tu and -1 <= world_tu_y <= self.room_height_tu:
             # Return found tile
-            return collision_map_list[world_tu_y * self.room_width_tu + world_tu_x]
+            return collision_map_list.get_tile(world_tu_x, world_tu_y)
         # Out of bound?
         else:
             # Return -1 on out of bound
@@ -3226,7 +3414,7 @@ class RoomJsonGenerator:
         world_tu_x: int,
         world_tu_y: int,
         value: (int | NoneOrBlobSpriteMetadata),
-        collision_map_list: list,
+        collision_map_list: TileLayer,
         is_update_pre_render: bool,
     ) -> int | None:
         """
@@ -3243,7 +3431,10 @@ class RoomJsonGenerator:
         # In bound?
         if 0 <= world_tu_x < self.room_width_tu and 0 <= world_tu_y < self.room_height_tu:
             # Set
-            collision_map_list[world_tu_y * self.room_width_tu + world_tu_x] = value
+            collision_map_list.set_tile(world_tu_x, world_tu_y, value)
+            # Bake this cell again on the next pre render update
+            if is_update_pre_render:
+                self.pre_render_dirty_cells.add((world_tu_x, world_tu_y))
             # Return None on success
             return None
         # Out of bound?
@@ -3255,7 +3446,7 @@ class RoomJsonGenerator:
         self,
         world_tu_x: int,
         world_tu_y: int,
-        collision_map_list: list[int | NoneOrBlobSpriteMetadata],
+        collision_map_list: TileLayer,
         directions: list[tuple[tuple[int, int], int]],
     ) -> int:
         """
@@ -3333,7 +3524,7 @@ class RoomJsonGenerator:
         self,
         world_tu_x: int,
         world_tu_y: int,
-        collision_map_list: list[int | NoneOrBlobSpriteMetadata],
+        collision_map_list: TileLayer,
     ) -> list[AdjacentTileMetadata]:
         """
         | Returns a list of 4 adjacent tiles around the specified coordinates.
@@ -3377,7 +3568,7 @@ class RoomJsonGenerator:
         self,
         world_tu_x: int,
         world_tu_y: int,
-        collision_map_list: list[int | NoneOrBlobSpriteMetadata],
+        collision_map_list: TileLayer,
     ) -> list[AdjacentTileMetadata]:
         """
         | Returns a list of 8 adjacent tiles around the specified coordinates.
@@ -3439,7 +3630,7 @@ class RoomJsonGenerator:
         """
 
         # Get and scale mouse position
-        mouse_position_tuple: tuple[int, int] = pg.mouse.get_pos()
+        mouse_position_tuple: tuple[int, int] = self.game_event_handler.mouse_position_tuple
         mouse_position_x: int = mouse_position_tuple[0]
         mouse_position_y: int = mouse_position_tuple[1]
         # Scale mouse position
@@ -3558,7 +3749,7 @@ class RoomJsonGenerator:
 
     def _get_region_1d_with_positions(
         self,
-        collision_map_list: list[int | NoneOrBlobSpriteMetadata | Any],
+        collision_map_list: TileLayer | list[Any],
         room_width_tu: int,
         xu: int,
         yu: int,
@@ -3573,6 +3764,17 @@ class RoomJsonGenerator:
 
         region_with_positions: list[tuple[(int | NoneOrBlobSpriteMetadata | Any), tuple[int, int]]] = []
 
+        # Tile layer? It reads the region 1 slice per row, and 1 tile around the room reads its border
+        if isinstance(collision_map_list, TileLayer):
+            region: list[int | NoneOrBlobSpriteMetadata] = collision_map_list.get_region(
+                xu, yu, region_width_tu, region_height_tu
+            )
+            for row in range(region_height_tu):
+                for col in range(region_width_tu):
+                    # Append value with its position
+                    region_with_positions.append((region[row * region_width_tu + col], (yu + row, xu + col)))
+            return region_with_positions
+
         for row in range(region_height_tu):
             start_index: int = (yu + row) * room_width_tu + xu  # Calculate the starting index for each row
 
@@ -3585,7 +3787,7 @@ class RoomJsonGenerator:
 
     def _process_second_select(
         self,
-        selected_layer_collision_map: list[int | NoneOrBlobSpriteMetadata],
+        selected_layer_collision_map: TileLayer,
         selected_sprite_name: str,
         selected_sprite_x: int,
         selected_sprite_y: int,
@@ -3627,19 +3829,12 @@ class RoomJsonGenerator:
                     # Fill with metadata instance
                     world_tu_x: int = position[1]
                     world_tu_y: int = position[0]
-                    world_snapped_x: int = world_tu_x * TILE_SIZE
-                    world_snapped_y: int = world_tu_y * TILE_SIZE
-                    new_none_or_blob_sprite_metadata_dict: dict = {
-                        "name": selected_sprite_name,
-                        "type": self.sprite_metadata_instance.sprite_type,
-                        "x": world_snapped_x,
-                        "y": world_snapped_y,
-                        "region_x": selected_sprite_x,
-                        "region_y": selected_sprite_y,
-                    }
-                    # Turn into sprite metadata instance
-                    none_or_blob_sprite_metadata_instance = instance_none_or_blob_sprite_metadata(
-                        new_none_or_blob_sprite_metadata_dict
+                    # Get the shared sprite metadata of this sprite variant, no new instance per tile
+                    none_or_blob_sprite_metadata_instance = get_none_or_blob_sprite_metadata(
+                        selected_sprite_name,
+                        self.sprite_metadata_instance.sprite_type,
+                        selected_sprite_x,
+                        selected_sprite_y,
                     )
                     # Fill collision map with sprite name in cursor pos
                     self._set_tile_from_collision_map_list(
@@ -3661,19 +3856,12 @@ class RoomJsonGenerator:
                     # Fill with metadata instance
                     world_tu_x = position[1]
                     world_tu_y = position[0]
-                    world_snapped_x = world_tu_x * TILE_SIZE
-                    world_snapped_y = world_tu_y * TILE_SIZE
-                    new_none_or_blob_sprite_metadata_dict = {
-                        "name": selected_sprite_name,
-                        "type": self.sprite_metadata_instance.sprite_type,
-                        "x": world_snapped_x,
-                        "y": world_snapped_y,
-                        "region_x": selected_sprite_x,
-                        "region_y": selected_sprite_y,
-                    }
-                    # Turn into sprite metadata instance
-                    none_or_blob_sprite_metadata_instance = instance_none_or_blob_sprite_metadata(
-                        new_none_or_blob_sprite_metadata_dict
+                    # Get the shared sprite metadata of this sprite variant, no new instance per tile
+                    none_or_blob_sprite_metadata_instance = get_none_or_blob_sprite_metadata(
+                        selected_sprite_name,
+                        self.sprite_metadata_instance.sprite_type,
+                        selected_sprite_x,
+                        selected_sprite_y,
                     )
                     # Fill collision map with sprite name in cursor pos
                     self._set_tile_from_collision_map_list(
@@ -26,7 +26,7 @@ from pygame.math import clamp
 from pygame.math import Vector2
 from schemas import SPRITE_SHEET_METADATA_SCHEMA
 from schemas import validate_json
-from typeguard import typechecked
+from typechecking import typechecked
 
 if TYPE_CHECKING:
     from nodes.game import Game
@@ -369,7 +369,7 @@ class SpriteSheetJsonGenerator:
 
         # Draw cursor
         # Get mouse position
-        mouse_position_tuple: tuple[int, int] = pg.mouse.get_pos()
+        mouse_position_tuple: tuple[int, int] = self.game_event_handler.mouse_position_tuple
         mouse_position_x_tuple: int = mouse_position_tuple[0]
         mouse_position_y_tuple: int = mouse_position_tuple[1]
         # Scale mouse position
@@ -449,7 +449,7 @@ class SpriteSheetJsonGenerator:
         # When it is done only, so that it does not mess with saving
         if self.curtain.is_done:
             # Get mouse position
-            mouse_position_tuple: tuple[int, int] = pg.mouse.get_pos()
+            mouse_position_tuple: tuple[int, int] = self.game_event_handler.mouse_position_tuple
             mouse_position_x_tuple: int = mouse_position_tuple[0]
             mouse_position_y_tuple: int = mouse_position_tuple[1]
             # Scale mouse position
@@ -562,7 +562,8 @@ class SpriteSheetJsonGenerator:
             if exists(self.input_text) and self.input_text.endswith(".png"):
                 # Setup the sprite sheet data
                 self.sprite_sheet_png_path = self.input_text
-                self.sprite_sheet_surf = pg.image.load(self.sprite_sheet_png_path).convert_alpha()
+                # Markers are drawn on it, work on a copy of the cached surf
+                self.sprite_sheet_surf = self.game.asset_cache.get_surf(self.sprite_sheet_png_path, self).copy()
                 self.sprite_sheet_rect = self.sprite_sheet_surf.get_rect()
                 is_narrower = self.sprite_sheet_rect.width < self.camera.rect.width
                 is_shorter = self.sprite_sheet_rect.height < self.camera.rect.height
@@ -1091,8 +1092,11 @@ class SpriteSheetJsonGenerator:
     ########
     # DRAW #
     ########
-    def draw(self) -> None:
+    def draw(self, interpolation_alpha: float = 1.0) -> bool:
         self.state_machine_draw.handle(0)
+        # Editor redraws everything every frame, does not report dirty rects
+        self.game.set_is_full_redraw(True)
+        return True
 
     ##########
     # UPDATE #
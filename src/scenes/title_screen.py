@@ -13,7 +13,7 @@ from constants import PNGS_PATHS_DICT
 from nodes.curtain import Curtain
 from nodes.state_machine import StateMachine
 from nodes.timer import Timer
-from typeguard import typechecked
+from typechecking import typechecked
 
 
 if TYPE_CHECKING:
@@ -85,7 +85,9 @@ class TitleScreen:
         Setup Gestalt Illusion logo.
         """
 
-        self.gestalt_illusion_logo_surf: pg.Surface = pg.image.load(PNGS_PATHS_DICT["gestalt_illusion_logo.png"]).convert_alpha()
+        self.gestalt_illusion_logo_surf: pg.Surface = self.game.asset_cache.get_surf(
+            PNGS_PATHS_DICT["gestalt_illusion_logo.png"], self
+        )
         self.gestalt_illusion_logo_surf_topleft = (84, 76)
 
     def _setup_texts(self) -> None:
@@ -181,6 +183,9 @@ class TitleScreen:
             transition_actions={},
         )
 
+        # Last drawn state, a new draw state may leave the old state things on screen
+        self.last_draw_state: Enum = self.state_machine_draw.state
+
     # State draw logics
     def _CURTAIN_FADING_DRAW(self, _dt: int) -> None:
         NATIVE_SURF.fill(self.clear_color)
@@ -195,8 +200,12 @@ class TitleScreen:
             self.font_color,
         )
         self.curtain.draw(NATIVE_SURF, 0)
+        self.game.add_dirty_rects(self.curtain.dirty_rects)
 
     def _OPENED_SCENE_CURTAIN_DRAW(self, _dt: int) -> None:
+        # Prompt did not change? Native surf still has it
+        if not self.game.is_full_redraw and not self.prompt_curtain.is_dirty:
+            return
         NATIVE_SURF.fill(self.clear_color)
         NATIVE_SURF.blit(
             self.gestalt_illusion_logo_surf,
@@ -209,8 +218,12 @@ class TitleScreen:
             self.font_color,
         )
         self.prompt_curtain.draw(NATIVE_SURF, 0)
+        self.game.add_dirty_rects(self.prompt_curtain.dirty_rects)
 
     def _LEAVE_FADE_PROMPT_DRAW(self, _dt: int) -> None:
+        # Prompt did not change? Native surf still has it
+        if not self.game.is_full_redraw and not self.prompt_curtain.is_dirty:
+            return
         NATIVE_SURF.fill(self.clear_color)
         NATIVE_SURF.blit(
             self.gestalt_illusion_logo_surf,
@@ -223,6 +236,7 @@ class TitleScreen:
             self.font_color,
         )
         self.prompt_curtain.draw(NATIVE_SURF, 0)
+        self.game.add_dirty_rects(self.prompt_curtain.dirty_rects)
 
     def _CLOSED_SCENE_CURTAIN_DRAW(self, _dt: int) -> None:
         pass
@@ -304,9 +318,17 @@ class TitleScreen:
         self.prompt_curtain.go_to_invisible()
 
     # Draw
-    def draw(self) -> None:
+    def draw(self, interpolation_alpha: float = 1.0) -> bool:
+        # Draw state changed? Present everything once
+        if self.state_machine_draw.state != self.last_draw_state:
+            self.last_draw_state = self.state_machine_draw.state
+            self.game.set_is_full_redraw(True)
+
         self.state_machine_draw.handle(0)
 
+        # Drew new pixels? Nothing reported means an idle frame
+        return self.game.is_full_redraw or len(self.game.dirty_rects) != 0
+
     # Update
     def update(self, dt: int) -> None:
         # REMOVE IN BUILD
@@ -1,8 +1,10 @@
 from dataclasses import dataclass
 from typing import Any
 
-from jsonschema import validate
-from jsonschema import ValidationError
+from asset_bundle import is_bundled_asset
+from jsonschema.exceptions import best_match
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
 
 # Algo determine how dict access is either
 # - some_dict.name
@@ -27,6 +29,10 @@ from jsonschema import ValidationError
 # So schema here to validate, then use their instance after successful validation
 # Schema instance gives you autocompletion with its keys
 
+# Schemas are compiled to validators once at import, validate json reuses them
+# Dataclasses are slotted, no per instance dict, smaller and faster attribute access
+# Bundled asset JSONs are validated by the release build, their loaders can skip validation with is trusted
+
 ######################
 # ANIMATION METADATA #
 ######################
@@ -75,13 +81,13 @@ ANIMATION_SCHEMA: dict = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class AnimationSpriteMetadata:
     x: int
     y: int
 
 
-@dataclass
+@dataclass(slots=True)
 class AnimationMetadata:
     animation_is_loop: int
     next_animation_name: str
@@ -92,18 +98,18 @@ class AnimationMetadata:
     animation_sprites_list: list[AnimationSpriteMetadata]
 
 
-def instance_animation_metadata(input_dict: dict) -> dict[str, AnimationMetadata]:
+def instance_animation_metadata(input_dict: dict, is_trusted: bool = False) -> dict[str, AnimationMetadata]:
     """
     | Input = animation JSON dict from disk.
     |
-    | Validate input against schema.
+    | Validate input against schema, unless it is trusted, see is trusted json.
     | I raise exception on invalid.
     |
     | Output = {animation name : AnimationMetadata dataclass instance}
     """
 
     # Validate against the schema
-    if not validate_json(input_dict, ANIMATION_SCHEMA):
+    if not is_trusted and not validate_json(input_dict, ANIMATION_SCHEMA):
         raise ValueError("Invalid given animation dict against schema")
 
     # Prepare output {animation name : AnimationMetadata dataclass instance}
@@ -187,7 +193,7 @@ SPRITE_SHEET_METADATA_SCHEMA = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class SpriteMetadata:
     sprite_name: str
     sprite_layer: int
@@ -200,7 +206,7 @@ class SpriteMetadata:
     y: int
 
 
-@dataclass
+@dataclass(slots=True)
 class SpriteSheetMetadata:
     sprite_sheet_png_name: str
     sprite_room_map_body_color: str
@@ -209,18 +215,18 @@ class SpriteSheetMetadata:
     sprites_list: list[SpriteMetadata]
 
 
-def instance_sprite_sheet_metadata(input_dict: dict) -> SpriteSheetMetadata:
+def instance_sprite_sheet_metadata(input_dict: dict, is_trusted: bool = False) -> SpriteSheetMetadata:
     """
     | Input = sprite sheet JSON dict from disk.
     |
-    | Validate input against schema.
+    | Validate input against schema, unless it is trusted, see is trusted json.
     | I raise exception on invalid.
     |
     | Output = SpriteSheetMetadata dataclass instance
     """
 
     # Validate against the schema
-    if not validate_json(input_dict, SPRITE_SHEET_METADATA_SCHEMA):
+    if not is_trusted and not validate_json(input_dict, SPRITE_SHEET_METADATA_SCHEMA):
         raise ValueError("Invalid sprite sheet dict against schema")
         # TODO: Do this later
         # raise ValueError("An exception has occured.")
@@ -295,7 +301,7 @@ SETTINGS_METADATA_SCHEMA = {
         "pause": {"type": "integer", "minimum": 0},
         "jump": {"type": "integer", "minimum": 0},
         "attack": {"type": "integer", "minimum": 0},
-        # REMOVE IN BUILD
+        # Mouse, for the editors, kept in the release so dev and release share settings.json
         "lmb": {"type": "integer", "minimum": 0},
         "mmb": {"type": "integer", "minimum": 0},
         "rmb": {"type": "integer", "minimum": 0},
@@ -311,7 +317,7 @@ SETTINGS_METADATA_SCHEMA = {
         "pause",
         "jump",
         "attack",
-        # REMOVE IN BUILD
+        # Mouse, for the editors, kept in the release so dev and release share settings.json
         "lmb",
         "mmb",
         "rmb",
@@ -322,7 +328,7 @@ SETTINGS_METADATA_SCHEMA = {
 
 # TODO: Use this in place of dict after settings dict validation
 # TODO: Update with set get, then re create dataclass instance
-@dataclass
+@dataclass(slots=True)
 class SettingsMetadata:
     resolution_index: int
     resolution_scale: int
@@ -381,6 +387,8 @@ NONE_OR_BLOB_SPRITE_METADATA_SCHEMA = {
     "type": "object",
     "properties": {
         "name": {"type": "string"},
+        "type": {"type": "string"},
+        # Room JSON tiles still hold their x y, it is their cell, instances do not keep it
         "x": {"type": "integer", "minimum": 0},
         "y": {"type": "integer", "minimum": 0},
         "region_x": {"type": "integer", "minimum": 0},
@@ -388,24 +396,57 @@ NONE_OR_BLOB_SPRITE_METADATA_SCHEMA = {
     },
     "required": [
         "name",
-        "x",
-        "y",
+        "type",
         "region_x",
         "region_y",
     ],
 }
 
 
-@dataclass
+# Frozen, 1 instance is shared by every tile of the same sprite variant
+# A tile position is its cell index in the collision map list, x = index % width tu, y = index // width tu
+@dataclass(frozen=True, slots=True)
 class NoneOrBlobSpriteMetadata:
     name: str
     type: str
-    x: int
-    y: int
     region_x: int
     region_y: int
 
 
+# (name, type, region x, region y) : the shared instance of that sprite variant
+NONE_OR_BLOB_SPRITE_METADATA_INSTANCES_DICT: dict[tuple[str, str, int, int], NoneOrBlobSpriteMetadata] = {}
+
+
+def get_none_or_blob_sprite_metadata(name: str, sprite_type: str, region_x: int, region_y: int) -> NoneOrBlobSpriteMetadata:
+    """
+    | Input = tile sprite name, sprite type and its region on the sprite sheet.
+    |
+    | Returns the shared instance of this sprite variant.
+    | Only the first one of a variant is validated and made, the rest is a dict lookup.
+    | I raise exception on invalid.
+    |
+    | Output = NoneOrBlobSpriteMetadata dataclass instance
+    """
+
+    key: tuple[str, str, int, int] = (name, sprite_type, region_x, region_y)
+
+    # New variant? Validate and make it once
+    if key not in NONE_OR_BLOB_SPRITE_METADATA_INSTANCES_DICT:
+        if not validate_json(
+            {"name": name, "type": sprite_type, "region_x": region_x, "region_y": region_y},
+            NONE_OR_BLOB_SPRITE_METADATA_SCHEMA,
+        ):
+            raise ValueError("Invalid sprite dict against schema")
+        NONE_OR_BLOB_SPRITE_METADATA_INSTANCES_DICT[key] = NoneOrBlobSpriteMetadata(
+            name=name,
+            type=sprite_type,
+            region_x=region_x,
+            region_y=region_y,
+        )
+
+    return NONE_OR_BLOB_SPRITE_METADATA_INSTANCES_DICT[key]
+
+
 def instance_none_or_blob_sprite_metadata(input_dict: dict) -> NoneOrBlobSpriteMetadata:
     """
     | Input = object like dict item member in collision map list.
@@ -413,19 +454,17 @@ def instance_none_or_blob_sprite_metadata(input_dict: dict) -> NoneOrBlobSpriteM
     | Validate input against schema.
     | I raise exception on invalid.
     |
-    | Output = NoneOrBlobSpriteMetadata dataclass instance
+    | Output = the shared NoneOrBlobSpriteMetadata dataclass instance of its sprite variant
     """
 
     # Validate against the schema
     if not validate_json(input_dict, NONE_OR_BLOB_SPRITE_METADATA_SCHEMA):
         raise ValueError("Invalid sprite dict against schema")
 
-    # Construct the whole instance and return it
-    return NoneOrBlobSpriteMetadata(
+    # Get the shared instance and return it
+    return get_none_or_blob_sprite_metadata(
         name=input_dict["name"],
-        type=input_dict["type"],
-        x=input_dict["x"],
-        y=input_dict["y"],
+        sprite_type=input_dict["type"],
         region_x=input_dict["region_x"],
         region_y=input_dict["region_y"],
     )
@@ -450,7 +489,7 @@ ADJACENT_TILE_METADATA_SCHEMA = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class AdjacentTileMetadata:
     tile: str
     world_tu_x: int
@@ -496,7 +535,7 @@ BINARY_MAP_OFFSET_ITEM_METADATA_SCHEMA = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class BinaryMapOffsetItemMetadata:
     x: int
     y: int
@@ -523,15 +562,71 @@ def instance_binary_map_offset_item_metadata(input_dict: dict) -> BinaryMapOffse
     )
 
 
+######################
+# TRUSTED JSON NAMES #
+######################
+
+# JSON name suffix : schema, the release build validates every bundled JSON with these suffixes
+TRUSTED_JSON_SCHEMAS_DICT: dict[str, dict] = {
+    "_animation.json": ANIMATION_SCHEMA,
+    "_sprite_sheet_metadata.json": SPRITE_SHEET_METADATA_SCHEMA,
+}
+
+
+def is_trusted_json(path: str) -> bool:
+    """
+    | Pass a JSON path.
+    | True if it is in the asset bundle and named like a JSON the release build validated.
+    | Its loader can skip validation, the dev tree and the user dir are never trusted.
+    """
+
+    return is_bundled_asset(path) and path.endswith(tuple(TRUSTED_JSON_SCHEMAS_DICT))
+
+
+##############
+# VALIDATORS #
+##############
+
+
+def compile_schema(schema: Any) -> Validator:
+    """
+    | Check a schema, returns a validator for it.
+    | I raise exception on an invalid schema.
+    """
+
+    validator_class: Any = validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
+# Id of schema : its validator, compiled once at import, the schemas live as long as the module
+SCHEMA_VALIDATORS_DICT: dict[int, Validator] = {
+    id(schema): compile_schema(schema)
+    for schema in (
+        ANIMATION_SCHEMA,
+        SPRITE_METADATA_SCHEMA,
+        SPRITE_SHEET_METADATA_SCHEMA,
+        SETTINGS_METADATA_SCHEMA,
+        NONE_OR_BLOB_SPRITE_METADATA_SCHEMA,
+        ADJACENT_TILE_METADATA_SCHEMA,
+        BINARY_MAP_OFFSET_ITEM_METADATA_SCHEMA,
+    )
+}
+
+
 def validate_json(input_dict: dict, schema: Any) -> bool:
     """
     | Validate input dict against schema.
     | Returns boolean.
+    |
+    | Schemas above use their validator compiled at import, any other schema is compiled per call.
     """
 
-    try:
-        validate(instance=input_dict, schema=schema)
-        return True
-    except ValidationError as e:
-        print(f"Validation error: {e.message}")
+    validator: Validator = SCHEMA_VALIDATORS_DICT.get(id(schema)) or compile_schema(schema)
+
+    # Same error jsonschema validate would raise
+    error: Any = best_match(validator.iter_errors(input_dict))
+    if error is not None:
+        print(f"Validation error: {error.message}")
         return False
+    return True
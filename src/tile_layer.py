@@ -0,0 +1,210 @@
+"""
+Tile layers.
+
+A room layer was a list of 0, 1 or NoneOrBlobSpriteMetadata, 1 pointer per cell and a bounds check per read.
+A tile layer holds the same cells as 1 int16 tile id per cell, with a 1 tile border around the room.
+Reads one tile around the room land on the border, so neighbor and collision reads need no bounds check.
+Sprites are kept once per layer in a palette, a tile id points into it.
+A solid bitmap, 1 byte per cell, tells if a cell is filled, collision reads it without making any object.
+
+Tile ids, shared with the binary room format:
+-1  border, out of the room
+0   empty
+1   filled, like the static actor layers
+2+  palette index + 2, a NoneOrBlobSpriteMetadata
+"""
+
+from array import array
+from typing import Iterator
+
+from schemas import NoneOrBlobSpriteMetadata
+from typechecking import typechecked
+
+# Tile ids
+OUT_OF_BOUNDS_TILE_ID: int = -1
+EMPTY_TILE_ID: int = 0
+FILLED_TILE_ID: int = 1
+FIRST_SPRITE_TILE_ID: int = 2
+
+
+@typechecked
+class TileLayer:
+    """
+    | 1 layer of room tiles, backed by an int16 array with a 1 tile border.
+    |
+    | Get tile reads any cell in the room or on its border, border cells are -1.
+    | Set tile writes a cell in the room, the caller checks bounds.
+    | Solid bitmap is 1 for filled cells, indexed like the tile ids, see get index.
+    """
+
+    def __init__(self, width_tu: int, height_tu: int):
+        # Room size and the padded size the arrays use
+        self.width_tu: int = width_tu
+        self.height_tu: int = height_tu
+        self.padded_width_tu: int = width_tu + 2
+        self.padded_height_tu: int = height_tu + 2
+
+        # Tile ids, border -1, room 0
+        self.tile_ids: array = array("h", [OUT_OF_BOUNDS_TILE_ID]) * (self.padded_width_tu * self.padded_height_tu)
+        empty_row: array = array("h", [EMPTY_TILE_ID]) * width_tu
+        for world_tu_y in range(height_tu):
+            start: int = self.get_index(0, world_tu_y)
+            end: int = start + width_tu
+            self.tile_ids[start:end] = empty_row
+
+        # Filled cell : 1, derived from tile ids, border stays 0 so out of the room is air
+        self.solid_bitmap: bytearray = bytearray(self.padded_width_tu * self.padded_height_tu)
+
+        # Palette, tile id - 2 : sprite, and sprite : tile id
+        self.sprites: list[NoneOrBlobSpriteMetadata] = []
+        self.sprite_tile_ids: dict[NoneOrBlobSpriteMetadata, int] = {}
+
+    def get_index(self, world_tu_x: int, world_tu_y: int) -> int:
+        """
+        | Index of a cell in tile ids and solid bitmap.
+        | Valid for -1 to width tu and -1 to height tu.
+        """
+
+        return (world_tu_y + 1) * self.padded_width_tu + world_tu_x + 1
+
+    def get_tile(self, world_tu_x: int, world_tu_y: int) -> int | NoneOrBlobSpriteMetadata:
+        """
+        | Returns -1 on the border, 0 empty, 1 filled, or the NoneOrBlobSpriteMetadata.
+        | Valid for -1 to width tu and -1 to height tu, no bounds check.
+        """
+
+        tile_id: int = self.tile_ids[(world_tu_y + 1) * self.padded_width_tu + world_tu_x + 1]
+        if tile_id < FIRST_SPRITE_TILE_ID:
+            return tile_id
+        return self.sprites[tile_id - FIRST_SPRITE_TILE_ID]
+
+    def set_tile(self, world_tu_x: int, world_tu_y: int, value: int | NoneOrBlobSpriteMetadata) -> None:
+        """
+        | Set 0, 1 or a NoneOrBlobSpriteMetadata to a cell in the room.
+        | Sprites not in the palette yet are added.
+        """
+
+        index: int = self.get_index(world_tu_x, world_tu_y)
+        tile_id: int = value if isinstance(value, int) else self._get_sprite_tile_id(value)
+        self.tile_ids[index] = tile_id
+        self.solid_bitmap[index] = tile_id != EMPTY_TILE_ID
+
+    def fill_region(
+        self,
+        world_tu_x: int,
+        world_tu_y: int,
+        width_tu: int,
+        height_tu: int,
+        value: int | NoneOrBlobSpriteMetadata,
+    ) -> None:
+        """
+        | Set 1 value to every cell of a region, cells out of the room are skipped.
+        | Each row is 1 slice assignment.
+        """
+
+        # Clip to the room
+        left: int = max(world_tu_x, 0)
+        top: int = max(world_tu_y, 0)
+        right: int = min(world_tu_x + width_tu, self.width_tu)
+        bottom: int = min(world_tu_y + height_tu, self.height_tu)
+        if left >= right or top >= bottom:
+            return
+
+        tile_id: int = value if isinstance(value, int) else self._get_sprite_tile_id(value)
+        row_width_tu: int = right - left
+        row_tile_ids: array = array("h", [tile_id]) * row_width_tu
+        row_bits: bytes = bytes([tile_id != EMPTY_TILE_ID]) * row_width_tu
+        for row_tu_y in range(top, bottom):
+            start: int = self.get_index(left, row_tu_y)
+            end: int = start + row_width_tu
+            self.tile_ids[start:end] = row_tile_ids
+            self.solid_bitmap[start:end] = row_bits
+
+    def get_region(self, world_tu_x: int, world_tu_y: int, width_tu: int, height_tu: int) -> list[int | NoneOrBlobSpriteMetadata]:
+        """
+        | Returns the tiles of a region, row by row, like get tile.
+        | The region can reach 1 tile around the room, it reads the border.
+        """
+
+        region: list[int | NoneOrBlobSpriteMetadata] = []
+        for row_tu_y in range(world_tu_y, world_tu_y + height_tu):
+            start: int = self.get_index(world_tu_x, row_tu_y)
+            end: int = start + width_tu
+            region.extend(
+                tile_id if tile_id < FIRST_SPRITE_TILE_ID else self.sprites[tile_id - FIRST_SPRITE_TILE_ID]
+                for tile_id in self.tile_ids[start:end]
+            )
+        return region
+
+    def iter_tiles(self) -> Iterator[tuple[int, int, int | NoneOrBlobSpriteMetadata]]:
+        """
+        | Yields (world tu x, world tu y, tile) of every filled cell, row by row.
+        """
+
+        return self.iter_region_tiles(0, 0, self.width_tu, self.height_tu)
+
+    def iter_region_tiles(
+        self, world_tu_x: int, world_tu_y: int, width_tu: int, height_tu: int
+    ) -> Iterator[tuple[int, int, int | NoneOrBlobSpriteMetadata]]:
+        """
+        | Yields (world tu x, world tu y, tile) of every filled cell of a region, row by row.
+        | Cells out of the room are skipped.
+        """
+
+        # Clip to the room
+        left: int = max(world_tu_x, 0)
+        top: int = max(world_tu_y, 0)
+        right: int = min(world_tu_x + width_tu, self.width_tu)
+        bottom: int = min(world_tu_y + height_tu, self.height_tu)
+
+        row_width_tu: int = right - left
+        for row_tu_y in range(top, bottom):
+            start: int = self.get_index(left, row_tu_y)
+            end: int = start + row_width_tu
+            for column_tu_x, tile_id in enumerate(self.tile_ids[start:end], left):
+                if tile_id == EMPTY_TILE_ID:
+                    continue
+                yield (
+                    column_tu_x,
+                    row_tu_y,
+                    tile_id if tile_id < FIRST_SPRITE_TILE_ID else self.sprites[tile_id - FIRST_SPRITE_TILE_ID],
+                )
+
+    def load_tile_ids(self, tile_ids: memoryview | array, sprites: list[NoneOrBlobSpriteMetadata]) -> None:
+        """
+        | Replace every cell with unpadded tile ids, width tu * height tu, and the palette they point into.
+        | Like a binary room layer and its sprite table.
+        """
+
+        if len(tile_ids) != self.width_tu * self.height_tu:
+            raise ValueError(f"tile ids has {len(tile_ids)} cells, expected {self.width_tu * self.height_tu}")
+
+        # Copy row by row into the padded array, as raw bytes, both are native 16 bit ints
+        for world_tu_y in range(self.height_tu):
+            start: int = self.get_index(0, world_tu_y)
+            end: int = start + self.width_tu
+            row_start: int = world_tu_y * self.width_tu
+            row_end: int = row_start + self.width_tu
+            self.tile_ids[start:end] = array("h", tile_ids[row_start:row_end].tobytes())
+
+        # Palette and solid bitmap
+        self.sprites = list(sprites)
+        self.sprite_tile_ids = {sprite: sprite_index + FIRST_SPRITE_TILE_ID for sprite_index, sprite in enumerate(sprites)}
+        self.solid_bitmap = bytearray(map(EMPTY_TILE_ID.__lt__, self.tile_ids))
+
+    def get_byte_size(self) -> int:
+        """
+        | Bytes of the tile ids and the solid bitmap, the palette is shared sprites.
+        """
+
+        return self.tile_ids.itemsize * len(self.tile_ids) + len(self.solid_bitmap)
+
+    def _get_sprite_tile_id(self, sprite: NoneOrBlobSpriteMetadata) -> int:
+        """
+        | Tile id of a sprite, added to the palette on first use.
+        """
+
+        if sprite not in self.sprite_tile_ids:
+            self.sprite_tile_ids[sprite] = len(self.sprites) + FIRST_SPRITE_TILE_ID
+            self.sprites.append(sprite)
+        return self.sprite_tile_ids[sprite]
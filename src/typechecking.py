@@ -0,0 +1,28 @@
+from os import getenv
+from typing import Any
+from typing import Callable
+from typing import TypeVar
+
+from typeguard import typechecked as typeguard_typechecked
+
+# Classes and functions, what typeguard typechecked takes
+T = TypeVar("T", bound=Callable[..., Any])
+
+# Engine wide runtime type checking switch, GAME_TYPECHECK=0 turns it off for production
+# Off, classes are returned untouched, so hot per frame methods cost a plain call
+# Optimized byte code, like the release build, has no __debug__, always off there
+IS_TYPECHECKED: bool = __debug__ and getenv("GAME_TYPECHECK", "1") != "0"
+
+
+def typechecked(target: T) -> T:
+    """
+    | Use this instead of typeguard typechecked.
+    |
+    | Type checking on, instrument the target with typeguard.
+    | Type checking off, return the target as it is.
+    """
+
+    if not IS_TYPECHECKED:
+        return target
+
+    return typeguard_typechecked(target)
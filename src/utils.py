@@ -1,4 +1,6 @@
+from importlib import import_module
 from math import exp
+from math import inf
 from os import getenv
 from os import listdir
 from os import makedirs
@@ -10,7 +12,20 @@ from platform import system
 from typing import Any
 
 import pygame as pg
-from schemas import NoneOrBlobSpriteMetadata
+from asset_bundle import list_bundle_dir
+
+
+def import_mem(mem_path: str) -> Any:
+    """
+    | Pass a dotted path, "module.path.ClassName".
+    |
+    | Import the module the first time it is asked for.
+    | Python caches the module, later calls only cost the lookup.
+    | Return the class.
+    """
+
+    module_path, _, mem_name = mem_path.rpartition(".")
+    return getattr(import_module(module_path), mem_name)
 
 
 def create_paths_dict(directory: str) -> dict[str, str]:
@@ -19,8 +34,15 @@ def create_paths_dict(directory: str) -> dict[str, str]:
     |
     | Loop over its content, get files only.
     | Create a dict {file name : file path}.
+    |
+    | Bundled dir? Its names come from the bundle index, the dir is not read.
     """
 
+    # Bundled?
+    bundle_file_names: None | list[str] = list_bundle_dir(directory)
+    if bundle_file_names is not None:
+        return {filename: join(directory, filename) for filename in bundle_file_names}
+
     paths_dict = {}
     for filename in listdir(directory):
         if isfile(join(directory, filename)):
@@ -244,31 +266,87 @@ def dynamic_rect_vs_rect(
         return False
 
 
-def exp_decay(a: float, b: float, decay: float, dt: int) -> float:
+def swept_rect_vs_rect(
+    velocity_x: float,
+    velocity_y: float,
+    dt: int,
+    collider_x: float,
+    collider_y: float,
+    collider_width: float,
+    collider_height: float,
+    target_x: float,
+    target_y: float,
+    target_width: float,
+    target_height: float,
+    hit: list[float],
+) -> bool:
     """
-    | Its Lerp but time independent.
+    | Dynamic rect vs rect on plain floats, makes no Vector2 or FRect.
+    | True if the collider moving with velocity for dt hits the target within this step, 0 <= t hit near < 1.
+    |
+    | Need a preallocated list of 5 floats for extra info after computation, reused every call.
+    | hit = [t hit near, contact normal x, contact normal y, contact point x, contact point y].
+    | Contact point is where the collider center stops, normal is 0, 0 on an exact corner.
     """
 
-    return b + (a - b) * exp(-decay * dt)
+    # Reset extra info
+    hit[0] = hit[1] = hit[2] = hit[3] = hit[4] = 0.0
 
+    # Not moving? No hit
+    if not abs(velocity_x) > 0.0 and not abs(velocity_y) > 0.0:
+        return False
+
+    # Ray from the collider center, target grown by half the collider on each side
+    ray_origin_x: float = collider_x + collider_width / 2
+    ray_origin_y: float = collider_y + collider_height / 2
+    ray_dir_x: float = velocity_x * dt
+    ray_dir_y: float = velocity_y * dt
+    expanded_target_x: float = target_x - collider_width / 2
+    expanded_target_y: float = target_y - collider_height / 2
+
+    # Cache division, handle infinity
+    one_over_ray_dir_x: float = (inf if ray_dir_x > 0.0 else -inf) if abs(ray_dir_x) < 0.1 else 1.0 / ray_dir_x
+    one_over_ray_dir_y: float = (inf if ray_dir_y > 0.0 else -inf) if abs(ray_dir_y) < 0.1 else 1.0 / ray_dir_y
+
+    # Get near far time
+    t_near_x: float = (expanded_target_x - ray_origin_x) * one_over_ray_dir_x
+    t_near_y: float = (expanded_target_y - ray_origin_y) * one_over_ray_dir_y
+    t_far_x: float = (expanded_target_x + target_width + collider_width - ray_origin_x) * one_over_ray_dir_x
+    t_far_y: float = (expanded_target_y + target_height + collider_height - ray_origin_y) * one_over_ray_dir_y
 
-def get_tile_from_collision_map_list(
-    world_tu_x: int,
-    world_tu_y: int,
-    room_width_tu: int,
-    room_height_tu: int,
-    collision_map_list: list,
-) -> Any | int | NoneOrBlobSpriteMetadata:
+    # Sort near far time
+    if t_near_x > t_far_x:
+        t_near_x, t_far_x = t_far_x, t_near_x
+    if t_near_y > t_far_y:
+        t_near_y, t_far_y = t_far_y, t_near_y
+
+    # COLLISION RULE
+    if t_near_x > t_far_y or t_near_y > t_far_x:
+        return False
+
+    # Get near far time
+    t_hit_near: float = max(t_near_x, t_near_y)
+    if min(t_far_x, t_far_y) < 0:
+        return False
+    hit[0] = t_hit_near
+
+    # Compute contact point
+    hit[3] = ray_origin_x + t_hit_near * ray_dir_x
+    hit[4] = ray_origin_y + t_hit_near * ray_dir_y
+
+    # Compute contact normal
+    if t_near_x > t_near_y:
+        hit[1] = 1.0 if ray_dir_x < 0 else -1.0
+    elif t_near_x < t_near_y:
+        hit[2] = 1.0 if ray_dir_y < 0 else -1.0
+
+    # Hit within this step
+    return 0.0 <= t_hit_near < 1.0
+
+
+def exp_decay(a: float, b: float, decay: float, dt: int) -> float:
     """
-    | Returns -1 if out of bounds.
-    | Because camera needs extra 1 and thus may get out of bound.
+    | Its Lerp but time independent.
     """
 
-    # In bound?
-    if 0 <= world_tu_x < room_width_tu and 0 <= world_tu_y < room_height_tu:
-        # Return found tile
-        return collision_map_list[world_tu_y * room_width_tu + world_tu_x]
-    # Out of bound?
-    else:
-        # Return -1 on out of bound
-        return -1
+    return b + (a - b) * exp(-decay * dt)